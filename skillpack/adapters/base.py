@@ -6,7 +6,8 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
 
@@ -18,6 +19,16 @@ class FeatureStatus(Enum):
     UNKNOWN = "unknown"             # 未知状态
 
 
+@lru_cache(maxsize=64)
+def _version_tuple(version: str) -> Tuple[int, int, int]:
+    """解析版本号为 (major, minor, patch)，同一版本字符串只解析一次"""
+    parts = version.split(".")
+    major = int(parts[0]) if parts else 0
+    minor = int(parts[1]) if len(parts) > 1 else 0
+    patch = int(parts[2].split("-")[0]) if len(parts) > 2 else 0
+    return major, minor, patch
+
+
 @dataclass
 class CLIVersion:
     """CLI 版本信息"""
@@ -30,33 +41,21 @@ class CLIVersion:
     @property
     def major(self) -> int:
         """主版本号"""
-        parts = self.version.split(".")
-        return int(parts[0]) if parts else 0
+        return _version_tuple(self.version)[0]
 
     @property
     def minor(self) -> int:
         """次版本号"""
-        parts = self.version.split(".")
-        return int(parts[1]) if len(parts) > 1 else 0
+        return _version_tuple(self.version)[1]
 
     @property
     def patch(self) -> int:
         """补丁版本号"""
-        parts = self.version.split(".")
-        return int(parts[2].split("-")[0]) if len(parts) > 2 else 0
+        return _version_tuple(self.version)[2]
 
     def __ge__(self, other: str) -> bool:
         """版本比较: >= """
-        other_parts = other.split(".")
-        other_major = int(other_parts[0]) if other_parts else 0
-        other_minor = int(other_parts[1]) if len(other_parts) > 1 else 0
-        other_patch = int(other_parts[2].split("-")[0]) if len(other_parts) > 2 else 0
-
-        if self.major != other_major:
-            return self.major > other_major
-        if self.minor != other_minor:
-            return self.minor > other_minor
-        return self.patch >= other_patch
+        return _version_tuple(self.version) >= _version_tuple(other)
 
     def __lt__(self, other: str) -> bool:
         """版本比较: < """
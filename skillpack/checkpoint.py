@@ -7,13 +7,105 @@
 
 import hashlib
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from enum import Enum
 
+_checkpoint_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+try:
+    # 可选依赖：orjson 序列化/解析更快；其 JSONDecodeError 是 json.JSONDecodeError 的子类
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _dump_checkpoint(data: Dict[str, Any]) -> bytes:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson 不支持的值（如超过 64 位的整数）回退到标准库
+            return _checkpoint_encoder.encode(data).encode("utf-8")
+
+    _load_checkpoint = orjson.loads
+except ImportError:
+    def _dump_checkpoint(data: Dict[str, Any]) -> bytes:
+        return _checkpoint_encoder.encode(data).encode("utf-8")
+
+    # json.loads 直接接受 UTF-8 bytes
+    _load_checkpoint = json.loads
+
+
+# 归档/恢复时的复制块大小
+_COPY_CHUNK_SIZE = 1024 * 1024
+_MAX_COPY_WORKERS = 8
+
+# 归档目录中记录内容摘要的文件（不参与复制与摘要计算）
+_CONTENT_HASH_FILE = ".content_hash"
+
+# 平台能力在导入时探测一次（copy_file_range 仅 Linux 提供）
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """复制文件内容（不复制元数据），优先使用内核内复制"""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if _HAS_COPY_FILE_RANGE:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK_SIZE):
+                    pass
+                return
+            except OSError:
+                # 文件系统不支持时回退到用户态复制
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+
+        buffer = bytearray(_COPY_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            n = fsrc.readinto(buffer)
+            if not n:
+                break
+            fdst.write(view[:n])
+
+
+def _copy_files(source_dir: Path, target_dir: Path) -> None:
+    """并行复制目录下的所有文件（不递归）"""
+    files = [
+        item for item in source_dir.iterdir()
+        if item.is_file() and item.name != _CONTENT_HASH_FILE
+    ]
+    if len(files) <= 1:
+        for item in files:
+            _fast_copy(item, target_dir / item.name)
+        return
+
+    workers = min(_MAX_COPY_WORKERS, len(files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_fast_copy, item, target_dir / item.name) for item in files]
+        for future in futures:
+            future.result()
+
+
+def _content_digest(directory: Path) -> str:
+    """按文件名顺序计算目录内文件内容的摘要（不递归）"""
+    digest = hashlib.blake2b(digest_size=16)
+    for item in sorted(directory.iterdir()):
+        if not item.is_file() or item.name == _CONTENT_HASH_FILE:
+            continue
+        digest.update(item.name.encode("utf-8"))
+        digest.update(b"\0")
+        with open(item, "rb") as f:
+            for chunk in iter(lambda: f.read(_COPY_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 class PhaseStatus(Enum):
     """阶段状态"""
@@ -220,9 +312,9 @@ class CheckpointManager:
         """获取校验和文件路径"""
         return (directory or self.current_dir) / "checkpoint.json.sha256"
 
-    def _compute_checksum(self, content: str) -> str:
-        """计算 SHA-256 校验和"""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    def _compute_checksum(self, content: bytes) -> str:
+        """计算 SHA-256 校验和（对 UTF-8 编码后的内容）"""
+        return hashlib.sha256(content).hexdigest()
 
     def save(self, checkpoint: Checkpoint) -> bool:
         """
@@ -237,7 +329,8 @@ class CheckpointManager:
         self.current_dir.mkdir(parents=True, exist_ok=True)
 
         checkpoint.updated_at = datetime.now().isoformat()
-        content = json.dumps(checkpoint.to_dict(), indent=2, ensure_ascii=False)
+        # 内容只编码一次：校验和与写入都直接使用 bytes
+        content = _dump_checkpoint(checkpoint.to_dict())
         checksum = self._compute_checksum(content)
 
         checkpoint_path = self._checkpoint_path()
@@ -254,7 +347,7 @@ class CheckpointManager:
                     self._rotate_backups(checkpoint_path)
 
                 # 写入临时文件
-                temp_path.write_text(content, encoding="utf-8")
+                temp_path.write_bytes(content)
                 temp_checksum_path.write_text(checksum, encoding="utf-8")
 
                 # 原子重命名
@@ -269,7 +362,7 @@ class CheckpointManager:
                 return False
         else:
             # 直接写入
-            checkpoint_path.write_text(content, encoding="utf-8")
+            checkpoint_path.write_bytes(content)
             checksum_path.write_text(checksum, encoding="utf-8")
             return True
 
@@ -311,7 +404,7 @@ class CheckpointManager:
             return None
 
         try:
-            content = checkpoint_path.read_text(encoding="utf-8")
+            content = checkpoint_path.read_bytes()
 
             # 验证校验和
             if checksum_path.exists():
@@ -321,7 +414,7 @@ class CheckpointManager:
                     # 尝试从备份恢复
                     return self._recover_from_backup(directory)
 
-            data = json.loads(content)
+            data = _load_checkpoint(content)
             return Checkpoint.from_dict(data)
 
         except (json.JSONDecodeError, KeyError):
@@ -335,8 +428,7 @@ class CheckpointManager:
             backup_path = checkpoint_path.with_suffix(f".json.backup.{i}")
             if backup_path.exists():
                 try:
-                    content = backup_path.read_text(encoding="utf-8")
-                    data = json.loads(content)
+                    data = _load_checkpoint(backup_path.read_bytes())
                     return Checkpoint.from_dict(data)
                 except (json.JSONDecodeError, KeyError):
                     continue
@@ -381,6 +473,8 @@ class CheckpointManager:
         """
         将当前检查点归档到历史
 
+        内容与最近一次归档相同时不再复制，直接返回该归档目录。
+
         Returns:
             归档目录路径
         """
@@ -390,15 +484,27 @@ class CheckpointManager:
 
         self.history_dir.mkdir(parents=True, exist_ok=True)
 
+        content_hash = _content_digest(self.current_dir)
+        latest = max(
+            (entry for entry in self.history_dir.iterdir() if entry.is_dir()),
+            key=lambda entry: entry.name,
+            default=None,
+        )
+        if latest is not None:
+            try:
+                if (latest / _CONTENT_HASH_FILE).read_text(encoding="utf-8") == content_hash:
+                    return latest
+            except OSError:
+                pass
+
         # 创建归档目录
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         archive_dir = self.history_dir / f"{timestamp}_{current.task_id[:8]}"
         archive_dir.mkdir(parents=True, exist_ok=True)
 
         # 复制所有文件
-        for item in self.current_dir.iterdir():
-            if item.is_file():
-                shutil.copy2(item, archive_dir / item.name)
+        _copy_files(self.current_dir, archive_dir)
+        (archive_dir / _CONTENT_HASH_FILE).write_text(content_hash, encoding="utf-8")
 
         return archive_dir
 
@@ -423,9 +529,7 @@ class CheckpointManager:
                     if cp:
                         # 复制到 current
                         self.current_dir.mkdir(parents=True, exist_ok=True)
-                        for item in entry.iterdir():
-                            if item.is_file():
-                                shutil.copy2(item, self.current_dir / item.name)
+                        _copy_files(entry, self.current_dir)
                         return self.load_current()
 
         return None
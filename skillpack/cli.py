@@ -4,12 +4,19 @@ Skillpack CLI 命令
 提供 /do 命令的 CLI 接口。
 """
 
+import functools
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import click
 
+try:
+    # 可选依赖：orjson 解析更快；其 JSONDecodeError 是 json.JSONDecodeError 的子类
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from .models import (
     SkillpackConfig,
     KnowledgeConfig,
@@ -21,6 +28,8 @@ from .models import (
     CrossValidationConfig,
     OutputConfig,
     ExecutionRoute,
+    DEFAULT_ROUTING_WEIGHTS,
+    DEFAULT_ROUTING_THRESHOLDS,
 )
 from .router import TaskRouter
 from .executor import TaskExecutor
@@ -90,7 +99,10 @@ def do(
     
     # 执行任务（传递配置）
     executor = TaskExecutor(config=config, quiet=quiet)
-    status = executor.execute(context)
+    try:
+        status = executor.execute(context)
+    finally:
+        executor.close()
     
     if status.error:
         click.echo(f"✗ 执行失败: {status.error}")
@@ -228,23 +240,43 @@ def stats(today: bool, week: bool, as_json: bool, export: str):
         click.echo(dashboard)
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path: Path, signature: Tuple[int, int, int]) -> Dict[str, Any]:
+    """解析配置文件，按 (路径, 文件签名) 缓存，文件变化后签名不同自然失效"""
+    return _json_loads(path.read_bytes())
+
+
+def _read_config_file(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    读取并解析配置文件，文件未变化时复用上次的解析结果。
+
+    Returns:
+        解析后的数据，文件不存在时返回 None
+
+    Raises:
+        json.JSONDecodeError: 文件内容不是有效 JSON
+    """
+    path = path.absolute()
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+
+    return _parse_config_file(path, (st.st_mtime_ns, st.st_size, st.st_ino))
+
+
 def _load_config() -> SkillpackConfig:
     """加载配置 - 完整解析 .skillpackrc"""
     # 查找配置文件：项目根目录 > 全局目录
     local_config = Path(".skillpackrc")
     global_config = Path.home() / ".claude" / ".skillpackrc"
 
-    data = {}
-    if local_config.exists():
-        try:
-            data = json.loads(local_config.read_text())
-        except json.JSONDecodeError:
-            return SkillpackConfig()
-    elif global_config.exists():
-        try:
-            data = json.loads(global_config.read_text())
-        except json.JSONDecodeError:
-            return SkillpackConfig()
+    try:
+        data = _read_config_file(local_config)
+        if data is None:
+            data = _read_config_file(global_config)
+    except json.JSONDecodeError:
+        return SkillpackConfig()
 
     if not data:
         return SkillpackConfig()
@@ -258,9 +290,10 @@ def _load_config() -> SkillpackConfig:
 
     # 解析 routing 配置
     routing_data = data.get("routing", {})
+    # 复制嵌套字典，避免配置对象与缓存的解析结果共享可变状态
     routing = RoutingConfig(
-        weights=routing_data.get("weights", RoutingConfig().weights),
-        thresholds=routing_data.get("thresholds", RoutingConfig().thresholds),
+        weights=dict(routing_data.get("weights", DEFAULT_ROUTING_WEIGHTS)),
+        thresholds=dict(routing_data.get("thresholds", DEFAULT_ROUTING_THRESHOLDS)),
     )
 
     # 解析 checkpoint 配置
@@ -503,7 +536,10 @@ def _resume_task(task_id: Optional[str] = None):
     click.echo(f"\n⚠️ 注意: 当前版本将重新执行任务")
     click.echo(f"   后续版本将支持从中断点精确恢复\n")
 
-    status = executor.execute(context)
+    try:
+        status = executor.execute(context)
+    finally:
+        executor.close()
 
     if status.error:
         click.echo(f"✗ 恢复执行失败: {status.error}")
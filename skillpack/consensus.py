@@ -20,6 +20,12 @@ from typing import Optional, List, Dict, Any, Callable, Tuple
 
 from .models import SkillpackConfig, TaskContext
 
+try:
+    # 可选依赖：orjson 解析更快；其 JSONDecodeError 是 json.JSONDecodeError 的子类
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ConsensusStatus(Enum):
     """共识状态"""
@@ -296,6 +302,13 @@ Note:
 class ProposalParser:
     """提案解析器"""
 
+    # ```json ... ``` 代码块
+    _JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+    # JSON 对象的起始（{ 后紧跟键或 }），跳过正文中的 {占位符} 之类的花括号
+    _JSON_OBJECT_START_RE = re.compile(r'\{\s*["}]')
+    # 从任意位置解析一个完整 JSON 值（在 C 层定位对象结尾）
+    _JSON_DECODER = json.JSONDecoder()
+
     @classmethod
     def parse(cls, raw_output: str, model: str) -> PlanProposal:
         """
@@ -307,33 +320,19 @@ class ProposalParser:
         3. 智能 fallback
         """
         # 尝试提取 JSON 块
-        json_match = re.search(r'```json\s*(.*?)\s*```', raw_output, re.DOTALL)
+        json_match = cls._JSON_BLOCK_RE.search(raw_output)
         if json_match:
             try:
-                data = json.loads(json_match.group(1))
+                data = _json_loads(json_match.group(1))
                 return cls._from_dict(data, model, raw_output)
             except json.JSONDecodeError:
                 pass
 
-        # 尝试直接解析 JSON
+        # 尝试直接解析 JSON：从第一个对象起始处解析一个完整对象，忽略其后的文本
         try:
-            # 查找 { 开头的 JSON
-            json_start = raw_output.find('{')
-            if json_start != -1:
-                # 找到匹配的 }
-                brace_count = 0
-                json_end = json_start
-                for i, char in enumerate(raw_output[json_start:], json_start):
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-
-                json_str = raw_output[json_start:json_end]
-                data = json.loads(json_str)
+            object_match = cls._JSON_OBJECT_START_RE.search(raw_output)
+            if object_match:
+                data, _ = cls._JSON_DECODER.raw_decode(raw_output, object_match.start())
                 return cls._from_dict(data, model, raw_output)
         except (json.JSONDecodeError, ValueError):
             pass
@@ -10,16 +10,19 @@ import subprocess
 import shlex
 import re
 import threading
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Callable, Dict, Any
+from typing import Optional, List, Callable, Dict, Any, Deque, Iterator
 import json
 import time
 
-from .models import SkillpackConfig
+from .models import SkillpackConfig, _DATACLASS_SLOTS
 from .usage import UsageStore, UsageRecord
+from .consensus import PlanningPromptBuilder
 
 
 class ModelType(Enum):
@@ -45,7 +48,7 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"  # 已取消
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DispatchResult:
     """调度结果"""
     success: bool
@@ -101,6 +104,13 @@ ERROR_PATTERNS: Dict[str, Dict[str, str]] = {
 }
 
 
+# 预编译的错误模式（与 ERROR_PATTERNS 顺序一致）
+_COMPILED_ERROR_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), info)
+    for pattern, info in ERROR_PATTERNS.items()
+]
+
+
 def parse_error(error_text: str) -> tuple[Optional[str], Optional[str]]:
     """
     解析错误文本，返回 (错误类型, 修复建议)。
@@ -110,9 +120,8 @@ def parse_error(error_text: str) -> tuple[Optional[str], Optional[str]]:
     if not error_text:
         return None, None
 
-    error_lower = error_text.lower()
-    for pattern, info in ERROR_PATTERNS.items():
-        if re.search(pattern, error_lower, re.IGNORECASE):
+    for pattern, info in _COMPILED_ERROR_PATTERNS:
+        if pattern.search(error_text):
             return info["type"], info["suggestion"]
 
     return "UNKNOWN_ERROR", None
@@ -144,13 +153,18 @@ class ModelDispatcher:
     v6.0: 版本适配层 + 智能模型路由。
     """
 
+    # 内存执行日志只保留最近的记录（完整用量记录在 UsageStore 中）
+    MAX_EXECUTION_LOG = 256
+
     def __init__(self, config: SkillpackConfig):
         self.config = config
         self.use_cli = config.cli.prefer_cli_over_mcp
-        self._execution_log: List[dict] = []
+        self._execution_log: Deque[dict] = deque(maxlen=self.MAX_EXECUTION_LOG)
         self._mock_mode = self._detect_mock_mode()
         # 用量追踪
         self._usage_store = UsageStore()
+        # batched_usage() 各层缓存的用量记录，记录写入最内层（为空表示逐条写入）
+        self._usage_batches: List[List[UsageRecord]] = []
         self._current_task_id: Optional[str] = None
         self._current_route: Optional[str] = None
         self._current_phase: int = 0
@@ -589,7 +603,7 @@ class ModelDispatcher:
             duration_ms = int((time.time() - start_time) * 1000)
             # 尝试获取部分输出 (v5.4.1)
             partial_output = ""
-            if hasattr(e, 'stdout') and e.stdout:
+            if e.stdout:
                 partial_output = e.stdout if isinstance(e.stdout, str) else e.stdout.decode('utf-8', errors='ignore')
 
             return DispatchResult(
@@ -733,7 +747,7 @@ class ModelDispatcher:
             duration_ms = int((time.time() - start_time) * 1000)
             # 尝试获取部分输出 (v5.4.1)
             partial_output = ""
-            if hasattr(e, 'stdout') and e.stdout:
+            if e.stdout:
                 partial_output = e.stdout if isinstance(e.stdout, str) else e.stdout.decode('utf-8', errors='ignore')
 
             return DispatchResult(
@@ -913,11 +927,33 @@ class ModelDispatcher:
             error=error,
             mode=mode.value
         )
-        self._usage_store.append_record(record)
+        if self._usage_batches:
+            self._usage_batches[-1].append(record)
+        else:
+            self._usage_store.append_record(record)
+
+    @contextmanager
+    def batched_usage(self) -> Iterator[None]:
+        """
+        在上下文内缓存用量记录，退出时（包括异常退出）一次写入
+
+        可嵌套或交叠使用：每层只写出自己缓存的记录，退出后恢复外层缓存。
+        """
+        pending: List[UsageRecord] = []
+        self._usage_batches.append(pending)
+        try:
+            yield
+        finally:
+            # 按身份移除本层，交叠退出时不会误删其他层
+            for i in range(len(self._usage_batches) - 1, -1, -1):
+                if self._usage_batches[i] is pending:
+                    del self._usage_batches[i]
+                    break
+            self._usage_store.append_records(pending)
 
     def get_execution_log(self) -> List[dict]:
         """获取执行日志"""
-        return self._execution_log.copy()
+        return list(self._execution_log)
 
     def get_claude_planning_prompt(
         self,
@@ -936,46 +972,8 @@ class ModelDispatcher:
         Returns:
             格式化的规划 prompt
         """
-        prompt = f"""作为资深软件架构师，为以下任务设计详细的实施方案。
-
-## 任务描述
-{task}
-
-## 要求
-1. **方案摘要**: 简明扼要地描述你的实施思路
-2. **子任务分解**: 将任务拆分为可执行的子任务（3-8个）
-3. **风险评估**: 识别潜在风险和挑战
-4. **方案类型**: 判断你的方案是保守型、平衡型还是激进型
-
-## 输出格式（JSON）
-```json
-{{
-    "summary": "方案摘要...",
-    "approach": "conservative|balanced|aggressive",
-    "subtasks": [
-        {{
-            "id": "task-1",
-            "description": "子任务描述",
-            "priority": 1,
-            "estimated_effort": "low|medium|high",
-            "dependencies": [],
-            "files": ["相关文件路径"]
-        }}
-    ],
-    "risks": ["风险1", "风险2"],
-    "rationale": "选择这个方案的理由...",
-    "confidence": 0.85
-}}
-```
-
-注意：
-- 只做规划，不要编写实际代码
-- 子任务要具体可执行
-- 考虑依赖关系和执行顺序
-"""
-        if context:
-            prompt = f"## 上下文信息\n{context}\n\n" + prompt
-        return prompt
+        # 与 PlanningPromptBuilder 共用同一份静态模板
+        return PlanningPromptBuilder.build_claude_prompt(task, context)
 
     def format_phase_header(
         self,
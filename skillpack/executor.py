@@ -6,16 +6,22 @@ v5.4.0: 集成 CLI 调度器，实现真实的 Codex/Gemini 调用。
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, NamedTuple, Sequence, Set, Tuple, Union
+import functools
+import io
 import json
+import os
+import re
+import sys
 import time
-import uuid
 
-from .models import TaskContext, ExecutionRoute, SkillpackConfig
-from .dispatch import ModelDispatcher, ModelType, DispatchResult, get_dispatcher
+from .models import TaskContext, ExecutionRoute, SkillpackConfig, _DATACLASS_SLOTS
+from .dispatch import ModelDispatcher, ModelType, ExecutionMode, DispatchResult, get_dispatcher
 from .ralph.dashboard import ProgressTracker, SimpleProgressTracker, Phase
 from .usage import UsageStore, UsageRecord
 from .consensus import (
@@ -25,44 +31,323 @@ from .consensus import (
     ConsensusStatus,
     PlanProposal,
     ProposalParser,
+    Subtask,
+    ArbitrationDecision,
     format_consensus_markdown
 )
 
 
-@dataclass
+# 输出内容：完整字符串，或按顺序写入的片段（避免拼接大字符串）
+OutputContent = Union[str, Sequence[str]]
+
+
+# 平台能力在导入时探测一次
+_HAS_WRITEV = hasattr(os, "writev")
+
+
+def _write_chunks(path: Path, chunks: Sequence[str]) -> None:
+    """
+    将若干文本片段写入文件（UTF-8）。
+
+    支持 writev 的平台上一次系统调用提交全部片段，并处理部分写入。
+    """
+    buffers = [chunk.encode("utf-8") for chunk in chunks]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if _HAS_WRITEV:
+            while buffers:
+                written = os.writev(fd, buffers)
+                while buffers and written >= len(buffers[0]):
+                    written -= len(buffers[0])
+                    buffers.pop(0)
+                if buffers and written:
+                    buffers[0] = buffers[0][written:]
+        else:
+            data = memoryview(b"".join(buffers))
+            while data:
+                data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# 模型 / 执行模式的显示名称
+_MODEL_DISPLAY = {
+    ModelType.CLAUDE: "Claude",
+    ModelType.CODEX: "Codex",
+    ModelType.GEMINI: "Gemini",
+}
+_MODE_DISPLAY = {
+    ExecutionMode.CLI: "CLI",
+    ExecutionMode.MCP: "MCP",
+}
+
+# 阶段结果 Markdown 头部模板
+_RESULT_HEADER_TEMPLATE = """# {phase_name}
+
+## 执行信息
+- **任务**: {description}
+- **模型**: {model}
+- **执行模式**: {mode}
+- **状态**: {status}
+- **耗时**: {seconds:.2f}s
+- **命令**: `{command}`
+
+---
+
+## 输出
+
+"""
+
+# 共识仲裁报告（preamble 为可选的前置章节）
+_ARBITRATION_REPORT_TEMPLATE = """# 共识仲裁报告
+
+{preamble}## 分歧分析
+{divergences}
+
+## 仲裁决策
+- **采纳方案**: {approach}
+- **决策理由**: {reasoning}
+
+## 最终子任务
+{subtasks}
+"""
+
+
+# 任务描述扫描（模块加载时编译，大小写不敏感，无需 lower() 复制）
+_TEXT_SIGNAL_RE = re.compile("|".join(map(re.escape, (
+    "typo", "readme", "文档", "docs", "comment", "注释",
+    "config", "配置", ".md", ".txt", ".json", ".yaml"
+))), re.IGNORECASE)
+_CODE_SIGNAL_RE = re.compile("|".join(map(re.escape, (
+    "fix", "bug", "function", "method", "implement", "实现",
+    ".ts", ".js", ".py", ".go", ".rs", ".java", ".tsx", ".jsx",
+    "code", "add", "remove", "refactor", "修复"
+))), re.IGNORECASE)
+_CONTEXT_FILE_RE = re.compile(r'[\w/.-]+\.(ts|js|py|go|rs|java|tsx|jsx|md|json|yaml|toml)')
+_UI_FILE_RE = re.compile(r'[\w/.-]+\.(tsx|jsx|css|scss|vue|svelte)')
+
+# 常见 UI 目录（按优先级）
+_COMMON_UI_DIRS = (
+    "src/components",
+    "src/pages",
+    "src/styles",
+    "components",
+    "pages",
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _find_first_ui_dir(cwd: str) -> Optional[str]:
+    """查找工作目录下第一个存在的常见 UI 目录（按工作目录缓存）"""
+    for path in _COMMON_UI_DIRS:
+        if os.path.isdir(os.path.join(cwd, path)):
+            return path
+    return None
+
+
+class ModelCall(NamedTuple):
+    """单次模型调用记录（需要字典时使用 _asdict()）"""
+    phase: int
+    model: str
+    success: bool
+    duration_ms: int
+    route: Optional[str] = None
+    type: Optional[str] = None
+
+
+class PhaseStep(NamedTuple):
+    """执行阶段定义（追踪阶段、显示名称、执行模型、起始进度与提示）"""
+    phase: Phase
+    name: str
+    model: ModelType
+    progress: float
+    message: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ExecutionStatus:
     """执行状态"""
     is_running: bool = False
     error: Optional[str] = None
-    output_files: list[str] = None
-    model_calls: list[dict] = None  # 记录实际的模型调用
-
-    def __post_init__(self):
-        if self.output_files is None:
-            self.output_files = []
-        if self.model_calls is None:
-            self.model_calls = []
+    output_files: list[str] = field(default_factory=list)
+    model_calls: list[ModelCall] = field(default_factory=list)  # 记录实际的模型调用
 
 
 class ExecutorStrategy(ABC):
     """执行器策略基类"""
 
-    def __init__(self, config: Optional[SkillpackConfig] = None):
+    # 路由标签与阶段表（子类覆盖）
+    ROUTE: str = ""
+    PHASE_STEPS: Mapping[str, PhaseStep] = MappingProxyType({})
+
+    def __init__(
+        self,
+        config: Optional[SkillpackConfig] = None,
+        dispatcher: Optional[ModelDispatcher] = None
+    ):
         self.config = config or SkillpackConfig()
-        self.dispatcher = get_dispatcher(self.config)
+        self.dispatcher = dispatcher or get_dispatcher(self.config)
         self.output_dir = Path(self.config.output.current_dir)
+        self._output_dir_ready = False
+        # 后台写入线程（首次异步保存时创建）
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
+        # 模型并行调用线程池（首次使用时创建，跨阶段、跨任务复用）
+        self._model_pool: Optional[ThreadPoolExecutor] = None
 
     @abstractmethod
     def execute(self, context: TaskContext, tracker: ProgressTracker) -> ExecutionStatus:
         """执行任务"""
         pass
 
-    def _save_output(self, filename: str, content: str) -> Path:
-        """保存输出文件"""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = self.output_dir / filename
-        output_path.write_text(content, encoding="utf-8")
-        return output_path
+    def _enter_phase(
+        self,
+        tracker: ProgressTracker,
+        key: str,
+        number: int,
+        total_phases: int,
+        name: Optional[str] = None,
+        route: Optional[str] = None,
+    ) -> None:
+        """按阶段表进入阶段：更新追踪器并输出阶段头部"""
+        step = self.PHASE_STEPS[key]
+        tracker.start_phase(step.phase)
+        tracker.update(step.progress, step.message)
+        header = self.dispatcher.format_phase_header(
+            phase=number,
+            total_phases=total_phases,
+            phase_name=name or step.name,
+            route=route or self.ROUTE,
+            model=step.model,
+            progress_percent=round(step.progress * 100)
+        )
+        self._emit(header, "\n")
+
+    def _emit(self, *chunks: str, flush: bool = False) -> None:
+        """
+        输出到标准输出。
+
+        多个片段合并为一次 write，仅在阶段完成时 flush。
+        """
+        out = sys.stdout
+        out.write("".join(chunks))
+        if flush:
+            out.flush()
+
+    def _save_output(self, filename: str, content: OutputContent) -> Path:
+        """保存输出文件（content 可为字符串或按顺序写入的片段列表）"""
+        return self._save_outputs([(filename, content)])[0]
+
+    def _save_output_async(self, filename: str, content: OutputContent) -> Future:
+        """
+        在后台线程保存输出文件。
+
+        仅用于后续模型调用不会读取的文件，使磁盘写入与下一次调用重叠。
+        单线程写入保证同名文件按提交顺序落盘。
+        """
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="skillpack-writer"
+            )
+        future = self._writer.submit(self._save_output, filename, content)
+        self._pending_writes.append(future)
+        return future
+
+    def _get_model_pool(self) -> ThreadPoolExecutor:
+        """获取模型并行调用线程池"""
+        if self._model_pool is None:
+            self._model_pool = ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix="skillpack-model"
+            )
+        return self._model_pool
+
+    def _discard_model_pool(self) -> None:
+        """
+        弃用当前模型线程池（不等待仍在运行的调用）
+
+        超时的调用会一直占用工作线程，继续复用时后续提交需排队，
+        排队时间也会计入 result(timeout) 的超时；弃用后下次使用重新创建。
+        """
+        pool, self._model_pool = self._model_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def close(self) -> None:
+        """
+        关闭后台线程池
+
+        等待未完成的写入；模型线程池直接弃用，仍在运行的调用在后台结束后线程退出。
+        """
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        self._discard_model_pool()
+
+    def _wait_pending_writes(self, raise_errors: bool = True) -> None:
+        """
+        等待所有后台写入完成（返回执行结果前调用）
+
+        raise_errors 为 False 时只等待、忽略写入异常（用于异常退出路径，不覆盖原异常）。
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            if raise_errors:
+                future.result()
+            else:
+                future.exception()
+
+    def _finish(
+        self,
+        error: Optional[str],
+        output_files: List[str],
+        model_calls: List[ModelCall],
+    ) -> ExecutionStatus:
+        """等待后台写入并构建最终执行结果"""
+        self._wait_pending_writes()
+        return ExecutionStatus(error=error, output_files=output_files, model_calls=model_calls)
+
+    def _save_outputs(self, files: List[Tuple[str, OutputContent]]) -> List[Path]:
+        """
+        批量保存输出文件。
+
+        目录只在首次保存时创建，每个文件只打开一次并一次性写入。
+        """
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
+        output_paths = []
+        for filename, content in files:
+            output_path = self.output_dir / filename
+            chunks = (content,) if isinstance(content, str) else content
+            try:
+                _write_chunks(output_path, chunks)
+            except FileNotFoundError:
+                # 目录在两次执行之间被清理，重新创建后重试
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                _write_chunks(output_path, chunks)
+            output_paths.append(output_path)
+        return output_paths
+
+    def _get_context_files(self, context: TaskContext) -> List[str]:
+        """从任务描述中提取相关文件"""
+        return _CONTEXT_FILE_RE.findall(context.description)
+
+    def _format_arbitration_report(self, consensus: PlanningConsensus, preamble: str = "") -> str:
+        """格式化共识仲裁报告"""
+        arbitration = consensus.arbitration
+        return _ARBITRATION_REPORT_TEMPLATE.format_map({
+            "preamble": preamble,
+            "divergences": "\n".join(
+                f"- [{d.level.value}] {d.aspect}: {d.description}" for d in consensus.divergences
+            ),
+            "approach": arbitration.accepted_approach if arbitration else "merged",
+            "reasoning": arbitration.reasoning if arbitration else "综合两方案优点",
+            "subtasks": "\n".join(
+                f"{i+1}. {t.description}" for i, t in enumerate(consensus.final_subtasks)
+            ),
+        })
 
     def _format_result_markdown(
         self,
@@ -73,27 +358,21 @@ class ExecutorStrategy(ABC):
     ) -> str:
         """格式化结果为 Markdown"""
         status = "✅ 成功" if result.success else "❌ 失败"
-        mode = result.mode.value if result.mode else "unknown"
-
-        header = f"""# {phase_name}
-
-## 执行信息
-- **任务**: {context.description}
-- **模型**: {model.value.capitalize()}
-- **执行模式**: {mode.upper()}
-- **状态**: {status}
-- **耗时**: {result.duration_ms / 1000:.2f}s
-- **命令**: `{result.command}`
 
----
-
-## 输出
-
-"""
-        if result.success:
-            return header + result.output
-        else:
-            return header + f"### 错误\n\n```\n{result.error}\n```\n\n### 部分输出\n\n{result.output}"
+        buf = io.StringIO()
+        buf.write(_RESULT_HEADER_TEMPLATE.format_map({
+            "phase_name": phase_name,
+            "description": context.description,
+            "model": _MODEL_DISPLAY[model],
+            "mode": _MODE_DISPLAY.get(result.mode, "UNKNOWN"),
+            "status": status,
+            "seconds": result.duration_ms / 1000,
+            "command": result.command,
+        }))
+        if not result.success:
+            buf.write(f"### 错误\n\n```\n{result.error}\n```\n\n### 部分输出\n\n")
+        buf.write(result.output)
+        return buf.getvalue()
 
 
 class DirectExecutor(ExecutorStrategy):
@@ -105,41 +384,34 @@ class DirectExecutor(ExecutorStrategy):
     - DIRECT_CODE: Codex CLI 执行（代码修改）
     """
 
+    PHASE_STEPS = MappingProxyType({
+        "implement": PhaseStep(Phase.IMPLEMENTING, "执行", ModelType.CODEX, 0.3, "准备 Codex 调用..."),
+    })
+
     def execute(self, context: TaskContext, tracker: ProgressTracker) -> ExecutionStatus:
-        tracker.start_phase(Phase.IMPLEMENTING)
-        model_calls = []
+        model_calls: List[ModelCall] = []
 
         # 判断是文本任务还是代码任务（用于路由标签）
         is_code_task = self._is_code_task(context.description)
+        context_files = self._get_context_files(context)
         route_label = "DIRECT_CODE" if is_code_task else "DIRECT_TEXT"
 
         # 统一使用 Codex CLI 执行
-        tracker.update(0.3, "准备 Codex 调用...")
-
-        # 输出阶段头部
-        header = self.dispatcher.format_phase_header(
-            phase=1,
-            total_phases=1,
-            phase_name="执行",
-            route=route_label,
-            model=ModelType.CODEX,
-            progress_percent=30
-        )
-        print(header)
+        self._enter_phase(tracker, "implement", 1, 1, route=route_label)
 
         # 调用 Codex CLI
         result = self.dispatcher.call_codex(
             prompt=context.description,
-            context_files=self._get_context_files(context)
+            context_files=context_files
         )
 
-        model_calls.append({
-            "phase": 1,
-            "model": ModelType.CODEX.value,
-            "route": route_label,
-            "success": result.success,
-            "duration_ms": result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=1,
+            model=ModelType.CODEX.value,
+            success=result.success,
+            duration_ms=result.duration_ms,
+            route=route_label
+        ))
 
         tracker.update(0.9, "保存结果...")
 
@@ -159,50 +431,24 @@ class DirectExecutor(ExecutorStrategy):
             duration_ms=result.duration_ms,
             output_file=".skillpack/current/output.txt"
         )
-        print(complete_msg)
+        self._emit(complete_msg, "\n", flush=True)
 
         tracker.complete_phase()
         tracker.complete()
 
-        return ExecutionStatus(
-            is_running=False,
-            error=result.error if not result.success else None,
-            output_files=["output.txt"],
-            model_calls=model_calls
+        return self._finish(
+            result.error if not result.success else None,
+            ["output.txt"],
+            model_calls
         )
 
     def _is_code_task(self, description: str) -> bool:
         """判断是否为代码任务"""
-        code_signals = [
-            "fix", "bug", "function", "method", "implement", "实现",
-            ".ts", ".js", ".py", ".go", ".rs", ".java", ".tsx", ".jsx",
-            "code", "add", "remove", "refactor", "修复"
-        ]
-        text_signals = [
-            "typo", "readme", "文档", "docs", "comment", "注释",
-            "config", "配置", ".md", ".txt", ".json", ".yaml"
-        ]
-
-        desc_lower = description.lower()
-
         # 如果包含文本信号，优先判断为文本任务
-        for signal in text_signals:
-            if signal in desc_lower:
-                return False
-
+        if _TEXT_SIGNAL_RE.search(description):
+            return False
         # 如果包含代码信号，判断为代码任务
-        for signal in code_signals:
-            if signal in desc_lower:
-                return True
-
-        return False
-
-    def _get_context_files(self, context: TaskContext) -> List[str]:
-        """从任务描述中提取相关文件"""
-        # 简单实现：提取文件路径模式
-        import re
-        files = re.findall(r'[\w/.-]+\.(ts|js|py|go|rs|java|tsx|jsx|md|json|yaml|toml)', context.description)
-        return files
+        return _CODE_SIGNAL_RE.search(description) is not None
 
 
 class PlannedExecutor(ExecutorStrategy):
@@ -215,89 +461,64 @@ class PlannedExecutor(ExecutorStrategy):
     Phase 4: 审查 - Codex (CLI)
     """
 
+    ROUTE = "PLANNED"
+    PHASE_STEPS = MappingProxyType({
+        "plan": PhaseStep(Phase.PLANNING, "规划", ModelType.CLAUDE, 0.05, "准备多模型并行规划..."),
+        "arbitrate": PhaseStep(Phase.PLANNING, "共识仲裁", ModelType.CLAUDE, 0.2, "仲裁分歧..."),
+        "implement": PhaseStep(Phase.IMPLEMENTING, "实现", ModelType.CODEX, 0.4, "准备 Codex 实现..."),
+        "review": PhaseStep(Phase.REVIEWING, "审查", ModelType.CODEX, 0.8, "准备 Codex 审查..."),
+    })
+
     def execute(self, context: TaskContext, tracker: ProgressTracker) -> ExecutionStatus:
-        model_calls = []
+        model_calls: List[ModelCall] = []
         consensus_enabled = self.config.consensus.enabled
 
         # Phase 1: 并行规划 (Claude + Codex) - v5.5 新增
-        tracker.start_phase(Phase.PLANNING)
-        tracker.update(0.05, "准备多模型并行规划...")
-
         total_phases = 4 if consensus_enabled else 3
 
-        header = self.dispatcher.format_phase_header(
-            phase=1,
-            total_phases=total_phases,
-            phase_name="并行规划" if consensus_enabled else "规划",
-            route="PLANNED",
-            model=ModelType.CLAUDE,
-            progress_percent=5
-        )
-        print(header)
+        self._enter_phase(tracker, "plan", 1, total_phases, name="并行规划" if consensus_enabled else None)
 
         consensus = None
         if consensus_enabled:
             # 使用多模型共识规划
             consensus = self._parallel_planning(context, tracker)
 
-            model_calls.append({
-                "phase": 1,
-                "model": "claude+codex",
-                "type": "consensus_planning",
-                "success": True,
-                "duration_ms": consensus.total_planning_time_ms
-            })
+            model_calls.append(ModelCall(
+                phase=1,
+                model="claude+codex",
+                success=True,
+                duration_ms=consensus.total_planning_time_ms,
+                type="consensus_planning"
+            ))
 
             # 保存共识报告
             consensus_content = format_consensus_markdown(consensus)
-            self._save_output("1_planning_consensus.md", consensus_content)
+            self._save_output_async("1_planning_consensus.md", consensus_content)
 
-            print(f"""✅ Phase 1 完成 (多模型规划共识)
+            self._emit(f"""✅ Phase 1 完成 (多模型规划共识)
 ├── Claude 方案: {"✓" if consensus.claude_proposal else "✗"}
 ├── Codex 方案: {"✓" if consensus.codex_proposal else "✗"}
 ├── 共识状态: {consensus.status.value}
 ├── 共识置信度: {consensus.consensus_confidence:.0%}
 ├── 子任务数: {len(consensus.final_subtasks)}
-└── 输出: .skillpack/current/1_planning_consensus.md""")
+└── 输出: .skillpack/current/1_planning_consensus.md""", "\n", flush=True)
 
             tracker.complete_phase()
 
             # Phase 2: 共识分析/仲裁 (如有分歧)
             if consensus.status == ConsensusStatus.DISAGREEMENT:
-                tracker.start_phase(Phase.PLANNING)
-                tracker.update(0.2, "仲裁分歧...")
-
-                header = self.dispatcher.format_phase_header(
-                    phase=2,
-                    total_phases=total_phases,
-                    phase_name="共识仲裁",
-                    route="PLANNED",
-                    model=ModelType.CLAUDE,
-                    progress_percent=20
-                )
-                print(header)
+                self._enter_phase(tracker, "arbitrate", 2, total_phases)
 
                 # Claude 仲裁（由当前 Claude 实例执行）
                 consensus = self._arbitrate_consensus(consensus)
 
-                arbitration_content = f"""# 共识仲裁报告
-
-## 分歧分析
-{chr(10).join([f"- [{d.level.value}] {d.aspect}: {d.description}" for d in consensus.divergences])}
-
-## 仲裁决策
-- **采纳方案**: {consensus.arbitration.accepted_approach if consensus.arbitration else 'merged'}
-- **决策理由**: {consensus.arbitration.reasoning if consensus.arbitration else '综合两方案优点'}
+                arbitration_content = self._format_arbitration_report(consensus)
+                self._save_output_async("2_arbitration.md", arbitration_content)
 
-## 最终子任务
-{chr(10).join([f"{i+1}. {t.description}" for i, t in enumerate(consensus.final_subtasks)])}
-"""
-                self._save_output("2_arbitration.md", arbitration_content)
-
-                print(f"""✅ Phase 2 完成 (共识仲裁)
+                self._emit(f"""✅ Phase 2 完成 (共识仲裁)
 ├── 分歧数: {len(consensus.divergences)}
 ├── 采纳方案: {consensus.arbitration.accepted_approach if consensus.arbitration else 'merged'}
-└── 输出: .skillpack/current/2_arbitration.md""")
+└── 输出: .skillpack/current/2_arbitration.md""", "\n", flush=True)
 
                 tracker.complete_phase()
         else:
@@ -310,23 +531,12 @@ class PlannedExecutor(ExecutorStrategy):
 ## 规划
 (由 Claude 完成规划)
 """
-            self._save_output("1_plan.md", plan_content)
+            self._save_output_async("1_plan.md", plan_content)
             tracker.complete_phase()
 
         # Phase 3: 实现 (Codex)
         impl_phase = 3 if (consensus_enabled and consensus and consensus.status == ConsensusStatus.DISAGREEMENT) else 2
-        tracker.start_phase(Phase.IMPLEMENTING)
-        tracker.update(0.4, "准备 Codex 实现...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=impl_phase,
-            total_phases=total_phases,
-            phase_name="实现",
-            route="PLANNED",
-            model=ModelType.CODEX,
-            progress_percent=40
-        )
-        print(header)
+        self._enter_phase(tracker, "implement", impl_phase, total_phases)
 
         # 构建实现 prompt（包含共识信息）
         if consensus:
@@ -346,12 +556,12 @@ class PlannedExecutor(ExecutorStrategy):
             context_files=self._get_context_files(context)
         )
 
-        model_calls.append({
-            "phase": impl_phase,
-            "model": ModelType.CODEX.value,
-            "success": impl_result.success,
-            "duration_ms": impl_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=impl_phase,
+            model=ModelType.CODEX.value,
+            success=impl_result.success,
+            duration_ms=impl_result.duration_ms
+        ))
 
         impl_filename = f"{impl_phase}_implementation.md"
         impl_content = self._format_result_markdown(
@@ -360,42 +570,31 @@ class PlannedExecutor(ExecutorStrategy):
             impl_result,
             context
         )
-        self._save_output(impl_filename, impl_content)
+        self._save_output_async(impl_filename, impl_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=impl_phase,
             model=ModelType.CODEX,
             duration_ms=impl_result.duration_ms,
             output_file=f".skillpack/current/{impl_filename}"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 4: 审查 (Codex)
         review_phase = impl_phase + 1
-        tracker.start_phase(Phase.REVIEWING)
-        tracker.update(0.8, "准备 Codex 审查...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=review_phase,
-            total_phases=total_phases,
-            phase_name="审查",
-            route="PLANNED",
-            model=ModelType.CODEX,
-            progress_percent=80
-        )
-        print(header)
+        self._enter_phase(tracker, "review", review_phase, total_phases)
 
         review_result = self.dispatcher.call_codex(
             prompt=f"审查以下实现:\n\n{impl_result.output}\n\n审查重点: 需求覆盖、代码质量、潜在Bug、安全问题"
         )
 
-        model_calls.append({
-            "phase": review_phase,
-            "model": ModelType.CODEX.value,
-            "success": review_result.success,
-            "duration_ms": review_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=review_phase,
+            model=ModelType.CODEX.value,
+            success=review_result.success,
+            duration_ms=review_result.duration_ms
+        ))
 
         review_filename = f"{review_phase}_review.md"
         review_content = self._format_result_markdown(
@@ -404,14 +603,14 @@ class PlannedExecutor(ExecutorStrategy):
             review_result,
             context
         )
-        self._save_output(review_filename, review_content)
+        self._save_output_async(review_filename, review_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=review_phase,
             model=ModelType.CODEX,
             duration_ms=review_result.duration_ms,
             output_file=f".skillpack/current/{review_filename}"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
         tracker.complete()
@@ -425,11 +624,10 @@ class PlannedExecutor(ExecutorStrategy):
         else:
             output_files = ["1_plan.md", "2_implementation.md", "3_review.md"]
 
-        return ExecutionStatus(
-            is_running=False,
-            error=impl_result.error or review_result.error if not (impl_result.success and review_result.success) else None,
-            output_files=output_files,
-            model_calls=model_calls
+        return self._finish(
+            impl_result.error or review_result.error if not (impl_result.success and review_result.success) else None,
+            output_files,
+            model_calls
         )
 
     def _parallel_planning(
@@ -442,9 +640,6 @@ class PlannedExecutor(ExecutorStrategy):
 
         使用 ThreadPoolExecutor 实现并行调用。
         """
-        from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-        import time
-
         start_time = time.time()
         tracker.update(0.1, "并行调用 Claude + Codex 规划...")
 
@@ -466,8 +661,6 @@ class PlannedExecutor(ExecutorStrategy):
         # 如果 Codex 规划成功，Claude 规划使用占位
         if consensus.codex_proposal and consensus.codex_proposal.parse_success:
             # Claude 方案：基于 Codex 方案生成互补方案（占位）
-            from .consensus import PlanProposal, ApproachType, Subtask
-
             claude_proposal = PlanProposal(
                 model="claude",
                 summary=f"为任务 '{context.description[:50]}...' 的实施方案",
@@ -490,15 +683,13 @@ class PlannedExecutor(ExecutorStrategy):
 
         consensus.total_planning_time_ms = int((time.time() - start_time) * 1000)
 
-        print(f"  ✓ 并行规划完成: {consensus.total_planning_time_ms}ms")
+        self._emit(f"  ✓ 并行规划完成: {consensus.total_planning_time_ms}ms\n")
         return consensus
 
     def _arbitrate_consensus(self, consensus: PlanningConsensus) -> PlanningConsensus:
         """
         仲裁分歧 (v5.5): 由 Claude 决策。
         """
-        from .consensus import ArbitrationDecision
-
         # 生成仲裁决策（由当前 Claude 实例填充）
         consensus.arbitration = ArbitrationDecision(
             accepted_approach="merged",
@@ -513,12 +704,6 @@ class PlannedExecutor(ExecutorStrategy):
 
         return consensus
 
-    def _get_context_files(self, context: TaskContext) -> List[str]:
-        """从任务描述中提取相关文件"""
-        import re
-        files = re.findall(r'[\w/.-]+\.(ts|js|py|go|rs|java|tsx|jsx|md|json|yaml|toml)', context.description)
-        return files
-
 
 class RalphExecutor(ExecutorStrategy):
     """
@@ -531,87 +716,64 @@ class RalphExecutor(ExecutorStrategy):
     Phase 5: 仲裁验证 - Claude
     """
 
+    ROUTE = "RALPH"
+    PHASE_STEPS = MappingProxyType({
+        "analyze": PhaseStep(Phase.ANALYZING, "深度分析", ModelType.CLAUDE, 0.05, "准备多模型并行规划..."),
+        "arbitrate": PhaseStep(Phase.PLANNING, "共识仲裁", ModelType.CLAUDE, 0.15, "仲裁分歧..."),
+        "plan": PhaseStep(Phase.PLANNING, "规划", ModelType.CLAUDE, 0.25, "详细规划..."),
+        "implement": PhaseStep(Phase.IMPLEMENTING, "执行子任务", ModelType.CODEX, 0.4, "准备 Codex 执行子任务..."),
+        "review": PhaseStep(Phase.REVIEWING, "独立审查", ModelType.GEMINI, 0.7, "准备 Gemini 独立审查..."),
+        "validate": PhaseStep(Phase.VALIDATING, "仲裁验证", ModelType.CLAUDE, 0.9, "仲裁验证..."),
+    })
+
     def execute(self, context: TaskContext, tracker: ProgressTracker) -> ExecutionStatus:
-        model_calls = []
+        model_calls: List[ModelCall] = []
         consensus_enabled = self.config.consensus.enabled
 
         # Phase 1: 多模型并行规划 (Claude + Codex) - v5.5 新增
-        tracker.start_phase(Phase.ANALYZING)
-        tracker.update(0.05, "准备多模型并行规划...")
-
         total_phases = 5
 
-        header = self.dispatcher.format_phase_header(
-            phase=1,
-            total_phases=total_phases,
-            phase_name="多模型规划" if consensus_enabled else "深度分析",
-            route="RALPH",
-            model=ModelType.CLAUDE,
-            progress_percent=5
-        )
-        print(header)
+        self._enter_phase(tracker, "analyze", 1, total_phases, name="多模型规划" if consensus_enabled else None)
 
         consensus = None
         if consensus_enabled:
             # 使用多模型共识规划
             consensus = self._parallel_planning(context, tracker)
 
-            model_calls.append({
-                "phase": 1,
-                "model": "claude+codex",
-                "type": "consensus_planning",
-                "success": True,
-                "duration_ms": consensus.total_planning_time_ms
-            })
+            model_calls.append(ModelCall(
+                phase=1,
+                model="claude+codex",
+                success=True,
+                duration_ms=consensus.total_planning_time_ms,
+                type="consensus_planning"
+            ))
 
             # 保存共识报告
             consensus_content = format_consensus_markdown(consensus)
-            self._save_output("1_planning_consensus.md", consensus_content)
+            self._save_output_async("1_planning_consensus.md", consensus_content)
 
-            print(f"""✅ Phase 1 完成 (多模型规划共识)
+            self._emit(f"""✅ Phase 1 完成 (多模型规划共识)
 ├── Claude 方案: {"✓" if consensus.claude_proposal else "✗"}
 ├── Codex 方案: {"✓" if consensus.codex_proposal else "✗"}
 ├── 共识状态: {consensus.status.value}
 ├── 共识置信度: {consensus.consensus_confidence:.0%}
-└── 输出: .skillpack/current/1_planning_consensus.md""")
+└── 输出: .skillpack/current/1_planning_consensus.md""", "\n", flush=True)
 
             tracker.complete_phase()
 
             # Phase 2: 共识仲裁 (如有分歧)
             if consensus.status == ConsensusStatus.DISAGREEMENT:
-                tracker.start_phase(Phase.PLANNING)
-                tracker.update(0.15, "仲裁分歧...")
-
-                header = self.dispatcher.format_phase_header(
-                    phase=2,
-                    total_phases=total_phases,
-                    phase_name="共识仲裁",
-                    route="RALPH",
-                    model=ModelType.CLAUDE,
-                    progress_percent=15
-                )
-                print(header)
+                self._enter_phase(tracker, "arbitrate", 2, total_phases)
 
                 consensus = self._arbitrate_consensus(consensus)
 
-                arbitration_content = f"""# 共识仲裁报告
-
-## 分歧分析
-{chr(10).join([f"- [{d.level.value}] {d.aspect}: {d.description}" for d in consensus.divergences])}
-
-## 仲裁决策
-- **采纳方案**: {consensus.arbitration.accepted_approach if consensus.arbitration else 'merged'}
-- **决策理由**: {consensus.arbitration.reasoning if consensus.arbitration else '综合两方案优点'}
+                arbitration_content = self._format_arbitration_report(consensus)
+                self._save_output_async("2_arbitration.md", arbitration_content)
 
-## 最终子任务
-{chr(10).join([f"{i+1}. {t.description}" for i, t in enumerate(consensus.final_subtasks)])}
-"""
-                self._save_output("2_arbitration.md", arbitration_content)
-
-                print(f"""✅ Phase 2 完成 (共识仲裁)
+                self._emit(f"""✅ Phase 2 完成 (共识仲裁)
 ├── 分歧数: {len(consensus.divergences)}
 ├── 采纳方案: {consensus.arbitration.accepted_approach if consensus.arbitration else 'merged'}
-└── 输出: .skillpack/current/2_arbitration.md""")
+└── 输出: .skillpack/current/2_arbitration.md""", "\n", flush=True)
 
                 tracker.complete_phase()
         else:
@@ -624,22 +786,10 @@ class RalphExecutor(ExecutorStrategy):
 ## 分析
 (由 Claude 完成深度分析)
 """
-            self._save_output("1_analysis.md", analysis_content)
             tracker.complete_phase()
 
             # Phase 2: 规划 (Claude)
-            tracker.start_phase(Phase.PLANNING)
-            tracker.update(0.25, "详细规划...")
-
-            header = self.dispatcher.format_phase_header(
-                phase=2,
-                total_phases=total_phases,
-                phase_name="规划",
-                route="RALPH",
-                model=ModelType.CLAUDE,
-                progress_percent=25
-            )
-            print(header)
+            self._enter_phase(tracker, "plan", 2, total_phases)
 
             plan_content = f"""# 详细规划
 
@@ -649,22 +799,15 @@ class RalphExecutor(ExecutorStrategy):
 ## 子任务列表
 (由 Claude 完成规划和子任务分解)
 """
-            self._save_output("2_plan.md", plan_content)
+            # 两份占位文档互不依赖，合并为一次批量写入
+            self._save_outputs([
+                ("1_analysis.md", analysis_content),
+                ("2_plan.md", plan_content),
+            ])
             tracker.complete_phase()
 
         # Phase 3: 执行子任务 (Codex)
-        tracker.start_phase(Phase.IMPLEMENTING)
-        tracker.update(0.4, "准备 Codex 执行子任务...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=3,
-            total_phases=total_phases,
-            phase_name="执行子任务",
-            route="RALPH",
-            model=ModelType.CODEX,
-            progress_percent=40
-        )
-        print(header)
+        self._enter_phase(tracker, "implement", 3, total_phases)
 
         # 构建实现 prompt（包含共识信息）
         if consensus:
@@ -684,12 +827,15 @@ class RalphExecutor(ExecutorStrategy):
             context_files=self._get_context_files(context)
         )
 
-        model_calls.append({
-            "phase": 3,
-            "model": ModelType.CODEX.value,
-            "success": impl_result.success,
-            "duration_ms": impl_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=3,
+            model=ModelType.CODEX.value,
+            success=impl_result.success,
+            duration_ms=impl_result.duration_ms
+        ))
+
+        # 后续阶段只引用输出前缀，截取一次后复用
+        impl_excerpt = impl_result.output[:5000]
 
         impl_content = self._format_result_markdown(
             "Phase 3: 执行子任务",
@@ -699,28 +845,17 @@ class RalphExecutor(ExecutorStrategy):
         )
         self._save_output("3_subtask_main.md", impl_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=3,
             model=ModelType.CODEX,
             duration_ms=impl_result.duration_ms,
             output_file=".skillpack/current/3_subtask_main.md"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 4: 独立审查 (Gemini) - v5.4 新增
-        tracker.start_phase(Phase.REVIEWING)
-        tracker.update(0.7, "准备 Gemini 独立审查...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=4,
-            total_phases=total_phases,
-            phase_name="独立审查",
-            route="RALPH",
-            model=ModelType.GEMINI,
-            progress_percent=70
-        )
-        print(header)
+        self._enter_phase(tracker, "review", 4, total_phases)
 
         # 查询知识库获取需求文档（如果配置了）
         knowledge_context = ""
@@ -741,7 +876,7 @@ class RalphExecutor(ExecutorStrategy):
 
 ---
 """
-                print("  📚 已获取知识库需求文档")
+                self._emit("  📚 已获取知识库需求文档\n")
 
         # Gemini 独立审查 Codex 的实现（注入知识库需求）
         review_prompt = f"""审查以下代码实现:
@@ -749,7 +884,7 @@ class RalphExecutor(ExecutorStrategy):
 任务描述: {context.description}
 {knowledge_context}
 实现结果:
-{impl_result.output[:5000]}  # 限制长度
+{impl_excerpt}  # 限制长度
 
 审查重点:
 1. 需求是否完全覆盖（对比知识库中的需求文档）
@@ -762,17 +897,29 @@ class RalphExecutor(ExecutorStrategy):
 - 需求覆盖度检查（如有知识库需求）
 - 改进建议"""
 
-        review_result = self.dispatcher.call_gemini(
-            prompt=review_prompt,
-            context_files=[".skillpack/current/3_subtask_main.md"]
+        # 仲裁文档中实现结果部分不依赖审查结果：
+        # Gemini 审查在后台线程执行，同时先落盘仲裁占位
+        arbitration_head = f"""# 仲裁验证
+
+## Codex 实现结果
+{impl_excerpt[:2000] if impl_result.success else "实现失败"}
+
+## Gemini 审查报告
+"""
+        review_future = self._get_model_pool().submit(
+            self.dispatcher.call_gemini,
+            review_prompt,
+            [".skillpack/current/3_subtask_main.md"]
         )
+        self._save_output("5_arbitration.md", arbitration_head + "(审查进行中)\n")
+        review_result = review_future.result()
 
-        model_calls.append({
-            "phase": 4,
-            "model": ModelType.GEMINI.value,
-            "success": review_result.success,
-            "duration_ms": review_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=4,
+            model=ModelType.GEMINI.value,
+            success=review_result.success,
+            duration_ms=review_result.duration_ms
+        ))
 
         review_content = self._format_result_markdown(
             "Phase 4: 独立审查 (Gemini)",
@@ -780,43 +927,25 @@ class RalphExecutor(ExecutorStrategy):
             review_result,
             context
         )
-        self._save_output("4_review.md", review_content)
+        self._save_output_async("4_review.md", review_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=4,
             model=ModelType.GEMINI,
             duration_ms=review_result.duration_ms,
             output_file=".skillpack/current/4_review.md"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 5: 仲裁验证 (Claude) - v5.4 新增
-        tracker.start_phase(Phase.VALIDATING)
-        tracker.update(0.9, "仲裁验证...")
+        self._enter_phase(tracker, "validate", 5, total_phases)
 
-        header = self.dispatcher.format_phase_header(
-            phase=5,
-            total_phases=total_phases,
-            phase_name="仲裁验证",
-            route="RALPH",
-            model=ModelType.CLAUDE,
-            progress_percent=90
-        )
-        print(header)
-
-        arbitration_content = f"""# 仲裁验证
-
-## Codex 实现结果
-{impl_result.output[:2000] if impl_result.success else "实现失败"}
-
-## Gemini 审查报告
-{review_result.output[:2000] if review_result.success else "审查失败"}
-
-## Claude 仲裁
-(由 Claude 完成仲裁验证)
-"""
-        self._save_output("5_arbitration.md", arbitration_content)
+        self._save_output_async("5_arbitration.md", [
+            arbitration_head,
+            review_result.output[:2000] if review_result.success else "审查失败",
+            "\n\n## Claude 仲裁\n(由 Claude 完成仲裁验证)\n",
+        ])
 
         tracker.complete_phase()
         tracker.complete()
@@ -833,11 +962,10 @@ class RalphExecutor(ExecutorStrategy):
                 "4_review.md", "5_arbitration.md"
             ]
 
-        return ExecutionStatus(
-            is_running=False,
-            error=None if (impl_result.success and review_result.success) else (impl_result.error or review_result.error),
-            output_files=output_files,
-            model_calls=model_calls
+        return self._finish(
+            None if (impl_result.success and review_result.success) else (impl_result.error or review_result.error),
+            output_files,
+            model_calls
         )
 
     def _parallel_planning(
@@ -848,9 +976,6 @@ class RalphExecutor(ExecutorStrategy):
         """
         并行规划 (v5.5): Claude + Codex 同时规划。
         """
-        from concurrent.futures import ThreadPoolExecutor
-        import time
-
         start_time = time.time()
         tracker.update(0.1, "并行调用 Claude + Codex 规划...")
 
@@ -864,8 +989,6 @@ class RalphExecutor(ExecutorStrategy):
 
         # 如果 Codex 规划成功，Claude 规划使用占位
         if consensus.codex_proposal and consensus.codex_proposal.parse_success:
-            from .consensus import PlanProposal, ApproachType, Subtask
-
             claude_proposal = PlanProposal(
                 model="claude",
                 summary=f"为任务 '{context.description[:50]}...' 的深度分析方案",
@@ -887,15 +1010,13 @@ class RalphExecutor(ExecutorStrategy):
 
         consensus.total_planning_time_ms = int((time.time() - start_time) * 1000)
 
-        print(f"  ✓ 并行规划完成: {consensus.total_planning_time_ms}ms")
+        self._emit(f"  ✓ 并行规划完成: {consensus.total_planning_time_ms}ms\n")
         return consensus
 
     def _arbitrate_consensus(self, consensus: PlanningConsensus) -> PlanningConsensus:
         """
         仲裁分歧 (v5.5): 由 Claude 决策。
         """
-        from .consensus import ArbitrationDecision
-
         consensus.arbitration = ArbitrationDecision(
             accepted_approach="merged",
             reasoning="综合两个方案的优点，采用合并策略以最大化覆盖度和降低风险",
@@ -907,12 +1028,6 @@ class RalphExecutor(ExecutorStrategy):
         consensus.status = ConsensusStatus.PARTIAL_AGREEMENT
         return consensus
 
-    def _get_context_files(self, context: TaskContext) -> List[str]:
-        """从任务描述中提取相关文件"""
-        import re
-        files = re.findall(r'[\w/.-]+\.(ts|js|py|go|rs|java|tsx|jsx|md|json|yaml|toml)', context.description)
-        return files
-
 
 class ArchitectExecutor(ExecutorStrategy):
     """
@@ -926,24 +1041,27 @@ class ArchitectExecutor(ExecutorStrategy):
     Phase 6: 仲裁验证 - Claude
     """
 
+    ROUTE = "ARCHITECT"
+    # 并行规划阶段等待模型结果的超时（秒）
+    GEMINI_ANALYSIS_TIMEOUT = 180
+    CODEX_PLANNING_TIMEOUT = 120
+    PHASE_STEPS = MappingProxyType({
+        "analyze": PhaseStep(Phase.ANALYZING, "架构分析", ModelType.GEMINI, 0.05, "准备 Gemini 架构分析 + Codex 规划..."),
+        "arbitrate": PhaseStep(Phase.PLANNING, "共识仲裁", ModelType.CLAUDE, 0.15, "仲裁分歧..."),
+        "design": PhaseStep(Phase.DESIGNING, "架构设计", ModelType.CLAUDE, 0.2, "架构设计..."),
+        "plan": PhaseStep(Phase.PLANNING, "实施规划", ModelType.CLAUDE, 0.35, "实施规划..."),
+        "implement": PhaseStep(Phase.IMPLEMENTING, "分阶段实施", ModelType.CODEX, 0.5, "准备 Codex 分阶段实施..."),
+        "review": PhaseStep(Phase.REVIEWING, "独立审查", ModelType.GEMINI, 0.75, "准备 Gemini 独立审查..."),
+        "validate": PhaseStep(Phase.VALIDATING, "仲裁验证", ModelType.CLAUDE, 0.9, "仲裁验证..."),
+    })
+
     def execute(self, context: TaskContext, tracker: ProgressTracker) -> ExecutionStatus:
-        model_calls = []
+        model_calls: List[ModelCall] = []
         consensus_enabled = self.config.consensus.enabled
         total_phases = 6
 
         # Phase 1: 架构分析 + 多模型规划 (Gemini + Codex 并行)
-        tracker.start_phase(Phase.ANALYZING)
-        tracker.update(0.05, "准备 Gemini 架构分析 + Codex 规划...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=1,
-            total_phases=total_phases,
-            phase_name="架构分析 + 多模型规划" if consensus_enabled else "架构分析",
-            route="ARCHITECT",
-            model=ModelType.GEMINI,
-            progress_percent=5
-        )
-        print(header)
+        self._enter_phase(tracker, "analyze", 1, total_phases, name="架构分析 + 多模型规划" if consensus_enabled else None)
 
         arch_prompt = f"""@. 分析整个项目架构:
 
@@ -961,27 +1079,30 @@ class ArchitectExecutor(ExecutorStrategy):
         arch_result = None
 
         if consensus_enabled:
-            from concurrent.futures import ThreadPoolExecutor
-            import time
-
             start_time = time.time()
+            pool = self._get_model_pool()
 
-            with ThreadPoolExecutor(max_workers=2) as pool:
-                # Gemini 架构分析
-                gemini_future = pool.submit(
-                    self.dispatcher.call_gemini,
-                    arch_prompt,
-                    ["."]
-                )
+            # Gemini 架构分析
+            gemini_future = pool.submit(
+                self.dispatcher.call_gemini,
+                arch_prompt,
+                ["."]
+            )
 
-                # Codex 规划
-                codex_future = pool.submit(
-                    self.dispatcher.call_codex_for_planning,
-                    f"为以下任务设计架构和实施方案:\n\n{context.description}"
-                )
+            # Codex 规划
+            codex_future = pool.submit(
+                self.dispatcher.call_codex_for_planning,
+                f"为以下任务设计架构和实施方案:\n\n{context.description}"
+            )
 
-                arch_result = gemini_future.result(timeout=180)
-                codex_result = codex_future.result(timeout=120)
+            try:
+                arch_result = gemini_future.result(timeout=self.GEMINI_ANALYSIS_TIMEOUT)
+                codex_result = codex_future.result(timeout=self.CODEX_PLANNING_TIMEOUT)
+            except FuturesTimeoutError:
+                gemini_future.cancel()
+                codex_future.cancel()
+                self._discard_model_pool()
+                raise
 
             # 解析 Codex 规划结果
             if codex_result.success:
@@ -989,8 +1110,6 @@ class ArchitectExecutor(ExecutorStrategy):
                 codex_proposal.generation_time_ms = codex_result.duration_ms
 
                 # 创建 Claude 占位提案（基于 Gemini 分析）
-                from .consensus import PlanProposal, ApproachType, Subtask
-
                 claude_proposal = PlanProposal(
                     model="claude",
                     summary=f"基于 Gemini 架构分析的实施方案",
@@ -1013,22 +1132,22 @@ class ArchitectExecutor(ExecutorStrategy):
 
                 # 保存共识报告
                 consensus_content = format_consensus_markdown(consensus)
-                self._save_output("1_planning_consensus.md", consensus_content)
+                self._save_output_async("1_planning_consensus.md", consensus_content)
 
-                model_calls.append({
-                    "phase": 1,
-                    "model": "gemini+codex",
-                    "type": "architecture_consensus",
-                    "success": True,
-                    "duration_ms": consensus.total_planning_time_ms
-                })
+                model_calls.append(ModelCall(
+                    phase=1,
+                    model="gemini+codex",
+                    success=True,
+                    duration_ms=consensus.total_planning_time_ms,
+                    type="architecture_consensus"
+                ))
 
-                print(f"""✅ Phase 1 完成 (架构分析 + 多模型规划)
+                self._emit(f"""✅ Phase 1 完成 (架构分析 + 多模型规划)
 ├── Gemini 架构分析: {"✓" if arch_result.success else "✗"}
 ├── Codex 规划: {"✓" if codex_proposal.parse_success else "✗"}
 ├── 共识状态: {consensus.status.value}
 ├── 共识置信度: {consensus.consensus_confidence:.0%}
-└── 输出: .skillpack/current/1_planning_consensus.md""")
+└── 输出: .skillpack/current/1_planning_consensus.md""", "\n", flush=True)
             else:
                 # Codex 规划失败，仅使用 Gemini 架构分析
                 arch_content = self._format_result_markdown(
@@ -1037,21 +1156,21 @@ class ArchitectExecutor(ExecutorStrategy):
                     arch_result,
                     context
                 )
-                self._save_output("1_architecture_analysis.md", arch_content)
+                self._save_output_async("1_architecture_analysis.md", arch_content)
 
-                model_calls.append({
-                    "phase": 1,
-                    "model": ModelType.GEMINI.value,
-                    "success": arch_result.success,
-                    "duration_ms": arch_result.duration_ms
-                })
+                model_calls.append(ModelCall(
+                    phase=1,
+                    model=ModelType.GEMINI.value,
+                    success=arch_result.success,
+                    duration_ms=arch_result.duration_ms
+                ))
 
-                print(self.dispatcher.format_phase_complete(
+                self._emit(self.dispatcher.format_phase_complete(
                     phase=1,
                     model=ModelType.GEMINI,
                     duration_ms=arch_result.duration_ms,
                     output_file=".skillpack/current/1_architecture_analysis.md"
-                ))
+                ), "\n", flush=True)
         else:
             # 传统模式：仅 Gemini 架构分析
             arch_result = self.dispatcher.call_gemini(
@@ -1059,12 +1178,12 @@ class ArchitectExecutor(ExecutorStrategy):
                 context_files=["."]
             )
 
-            model_calls.append({
-                "phase": 1,
-                "model": ModelType.GEMINI.value,
-                "success": arch_result.success,
-                "duration_ms": arch_result.duration_ms
-            })
+            model_calls.append(ModelCall(
+                phase=1,
+                model=ModelType.GEMINI.value,
+                success=arch_result.success,
+                duration_ms=arch_result.duration_ms
+            ))
 
             arch_content = self._format_result_markdown(
                 "Phase 1: 架构分析 (Gemini)",
@@ -1072,96 +1191,57 @@ class ArchitectExecutor(ExecutorStrategy):
                 arch_result,
                 context
             )
-            self._save_output("1_architecture_analysis.md", arch_content)
+            self._save_output_async("1_architecture_analysis.md", arch_content)
 
-            print(self.dispatcher.format_phase_complete(
+            self._emit(self.dispatcher.format_phase_complete(
                 phase=1,
                 model=ModelType.GEMINI,
                 duration_ms=arch_result.duration_ms,
                 output_file=".skillpack/current/1_architecture_analysis.md"
-            ))
+            ), "\n", flush=True)
 
         tracker.complete_phase()
 
+        # 后续阶段只引用架构分析的前缀，截取一次后复用
+        arch_success = arch_result.success if arch_result else False
+        arch_excerpt = arch_result.output[:3000] if arch_result else ""
+
         # Phase 2: 共识仲裁 / 架构设计
+        pending_outputs: List[Tuple[str, str]] = []
         if consensus_enabled and consensus and consensus.status == ConsensusStatus.DISAGREEMENT:
-            tracker.start_phase(Phase.PLANNING)
-            tracker.update(0.15, "仲裁分歧...")
-
-            header = self.dispatcher.format_phase_header(
-                phase=2,
-                total_phases=total_phases,
-                phase_name="共识仲裁",
-                route="ARCHITECT",
-                model=ModelType.CLAUDE,
-                progress_percent=15
-            )
-            print(header)
+            self._enter_phase(tracker, "arbitrate", 2, total_phases)
 
             consensus = self._arbitrate_consensus(consensus)
 
-            arbitration_content = f"""# 共识仲裁报告
-
-## Gemini 架构分析摘要
-{arch_result.output[:1500] if arch_result and arch_result.success else "(分析失败)"}
-
-## 分歧分析
-{chr(10).join([f"- [{d.level.value}] {d.aspect}: {d.description}" for d in consensus.divergences])}
-
-## 仲裁决策
-- **采纳方案**: {consensus.arbitration.accepted_approach if consensus.arbitration else 'merged'}
-- **决策理由**: {consensus.arbitration.reasoning if consensus.arbitration else '综合两方案优点'}
-
-## 最终子任务
-{chr(10).join([f"{i+1}. {t.description}" for i, t in enumerate(consensus.final_subtasks)])}
-"""
-            self._save_output("2_arbitration.md", arbitration_content)
+            arbitration_content = self._format_arbitration_report(
+                consensus,
+                preamble=f"## Gemini 架构分析摘要\n{arch_excerpt[:1500] if arch_success else '(分析失败)'}\n\n"
+            )
+            self._save_output_async("2_arbitration.md", arbitration_content)
 
-            print(f"""✅ Phase 2 完成 (共识仲裁)
+            self._emit(f"""✅ Phase 2 完成 (共识仲裁)
 ├── 分歧数: {len(consensus.divergences)}
 ├── 采纳方案: {consensus.arbitration.accepted_approach if consensus.arbitration else 'merged'}
-└── 输出: .skillpack/current/2_arbitration.md""")
+└── 输出: .skillpack/current/2_arbitration.md""", "\n", flush=True)
 
             tracker.complete_phase()
         else:
             # 传统模式：架构设计
-            tracker.start_phase(Phase.DESIGNING)
-            tracker.update(0.2, "架构设计...")
-
-            header = self.dispatcher.format_phase_header(
-                phase=2,
-                total_phases=total_phases,
-                phase_name="架构设计",
-                route="ARCHITECT",
-                model=ModelType.CLAUDE,
-                progress_percent=20
-            )
-            print(header)
+            self._enter_phase(tracker, "design", 2, total_phases)
 
             design_content = f"""# 架构设计
 
 ## 基于 Gemini 分析
-{arch_result.output[:3000] if arch_result and arch_result.success else "(分析失败)"}
+{arch_excerpt if arch_success else "(分析失败)"}
 
 ## 架构设计
 (由 Claude 完成架构设计)
 """
-            self._save_output("2_architecture_design.md", design_content)
+            pending_outputs.append(("2_architecture_design.md", design_content))
             tracker.complete_phase()
 
         # Phase 3: 实施规划 (Claude)
-        tracker.start_phase(Phase.PLANNING)
-        tracker.update(0.35, "实施规划...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=3,
-            total_phases=total_phases,
-            phase_name="实施规划",
-            route="ARCHITECT",
-            model=ModelType.CLAUDE,
-            progress_percent=35
-        )
-        print(header)
+        self._enter_phase(tracker, "plan", 3, total_phases)
 
         if consensus:
             plan_content = f"""# 实施规划
@@ -1181,22 +1261,13 @@ class ArchitectExecutor(ExecutorStrategy):
 ## 分阶段实施计划
 (由 Claude 完成详细规划)
 """
-        self._save_output("3_implementation_plan.md", plan_content)
+        # 架构设计与实施规划均为模板文档，合并为一次批量写入
+        pending_outputs.append(("3_implementation_plan.md", plan_content))
+        self._save_outputs(pending_outputs)
         tracker.complete_phase()
 
         # Phase 4: 分阶段实施 (Codex)
-        tracker.start_phase(Phase.IMPLEMENTING)
-        tracker.update(0.5, "准备 Codex 分阶段实施...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=4,
-            total_phases=total_phases,
-            phase_name="分阶段实施",
-            route="ARCHITECT",
-            model=ModelType.CODEX,
-            progress_percent=50
-        )
-        print(header)
+        self._enter_phase(tracker, "implement", 4, total_phases)
 
         # 构建实现 prompt（包含共识信息）
         if consensus:
@@ -1208,23 +1279,25 @@ class ArchitectExecutor(ExecutorStrategy):
 {consensus.to_implementation_prompt()}
 
 ## 架构分析参考
-{arch_result.output[:1500] if arch_result and arch_result.success else "(无)"}
+{arch_excerpt[:1500] if arch_success else "(无)"}
 
 请按照上述子任务列表依次实施。"""
         else:
-            impl_prompt = f"根据架构设计实施以下任务:\n\n{context.description}\n\n架构分析:\n{arch_result.output[:2000] if arch_result else ''}"
+            impl_prompt = f"根据架构设计实施以下任务:\n\n{context.description}\n\n架构分析:\n{arch_excerpt[:2000]}"
 
         impl_result = self.dispatcher.call_codex(
             prompt=impl_prompt,
             context_files=self._get_context_files(context)
         )
 
-        model_calls.append({
-            "phase": 4,
-            "model": ModelType.CODEX.value,
-            "success": impl_result.success,
-            "duration_ms": impl_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=4,
+            model=ModelType.CODEX.value,
+            success=impl_result.success,
+            duration_ms=impl_result.duration_ms
+        ))
+
+        impl_excerpt = impl_result.output[:5000]
 
         impl_content = self._format_result_markdown(
             "Phase 4: 分阶段实施 (Codex)",
@@ -1234,28 +1307,17 @@ class ArchitectExecutor(ExecutorStrategy):
         )
         self._save_output("4_phase_implementation.md", impl_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=4,
             model=ModelType.CODEX,
             duration_ms=impl_result.duration_ms,
             output_file=".skillpack/current/4_phase_implementation.md"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 5: 独立审查 (Gemini) - v5.4 调整
-        tracker.start_phase(Phase.REVIEWING)
-        tracker.update(0.75, "准备 Gemini 独立审查...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=5,
-            total_phases=total_phases,
-            phase_name="独立审查",
-            route="ARCHITECT",
-            model=ModelType.GEMINI,
-            progress_percent=75
-        )
-        print(header)
+        self._enter_phase(tracker, "review", 5, total_phases)
 
         # 查询知识库获取需求文档（如果配置了）
         knowledge_context = ""
@@ -1276,14 +1338,14 @@ class ArchitectExecutor(ExecutorStrategy):
 
 ---
 """
-                print("  📚 已获取知识库需求文档")
+                self._emit("  📚 已获取知识库需求文档\n")
 
         review_prompt = f"""审查以下架构实现:
 
 原始任务: {context.description}
 {knowledge_context}
 实现结果:
-{impl_result.output[:5000]}
+{impl_excerpt}
 
 审查重点:
 1. 架构设计是否正确实现（对比知识库需求）
@@ -1297,12 +1359,12 @@ class ArchitectExecutor(ExecutorStrategy):
             context_files=[".skillpack/current/4_phase_implementation.md"]
         )
 
-        model_calls.append({
-            "phase": 5,
-            "model": ModelType.GEMINI.value,
-            "success": review_result.success,
-            "duration_ms": review_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=5,
+            model=ModelType.GEMINI.value,
+            success=review_result.success,
+            duration_ms=review_result.duration_ms
+        ))
 
         review_content = self._format_result_markdown(
             "Phase 5: 独立审查 (Gemini)",
@@ -1310,46 +1372,30 @@ class ArchitectExecutor(ExecutorStrategy):
             review_result,
             context
         )
-        self._save_output("5_review.md", review_content)
+        self._save_output_async("5_review.md", review_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=5,
             model=ModelType.GEMINI,
             duration_ms=review_result.duration_ms,
             output_file=".skillpack/current/5_review.md"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 6: 仲裁验证 (Claude) - v5.4 新增
-        tracker.start_phase(Phase.VALIDATING)
-        tracker.update(0.9, "仲裁验证...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=6,
-            total_phases=total_phases,
-            phase_name="仲裁验证",
-            route="ARCHITECT",
-            model=ModelType.CLAUDE,
-            progress_percent=90
-        )
-        print(header)
-
-        arbitration_content = f"""# 仲裁验证
-
-## Gemini 架构分析
-{arch_result.output[:2000] if arch_result.success else "(分析失败)"}
-
-## Codex 实施结果
-{impl_result.output[:2000] if impl_result.success else "(实施失败)"}
-
-## Gemini 审查报告
-{review_result.output[:2000] if review_result.success else "(审查失败)"}
-
-## Claude 仲裁
-(由 Claude 完成最终仲裁验证)
-"""
-        self._save_output("6_arbitration.md", arbitration_content)
+        self._enter_phase(tracker, "validate", 6, total_phases)
+
+        # 按片段顺序直接写入，不拼接完整文档
+        self._save_output_async("6_arbitration.md", [
+            "# 仲裁验证\n\n## Gemini 架构分析\n",
+            arch_excerpt[:2000] if arch_success else "(分析失败)",
+            "\n\n## Codex 实施结果\n",
+            impl_excerpt[:2000] if impl_result.success else "(实施失败)",
+            "\n\n## Gemini 审查报告\n",
+            review_result.output[:2000] if review_result.success else "(审查失败)",
+            "\n\n## Claude 仲裁\n(由 Claude 完成最终仲裁验证)\n",
+        ])
 
         tracker.complete_phase()
         tracker.complete()
@@ -1372,20 +1418,16 @@ class ArchitectExecutor(ExecutorStrategy):
                 "5_review.md", "6_arbitration.md"
             ]
 
-        arch_success = arch_result.success if arch_result else False
-        return ExecutionStatus(
-            is_running=False,
-            error=None if all([arch_success, impl_result.success, review_result.success]) else "部分阶段执行失败",
-            output_files=output_files,
-            model_calls=model_calls
+        return self._finish(
+            None if all([arch_success, impl_result.success, review_result.success]) else "部分阶段执行失败",
+            output_files,
+            model_calls
         )
 
     def _arbitrate_consensus(self, consensus: PlanningConsensus) -> PlanningConsensus:
         """
         仲裁分歧 (v5.5): 由 Claude 决策。
         """
-        from .consensus import ArbitrationDecision
-
         consensus.arbitration = ArbitrationDecision(
             accepted_approach="merged",
             reasoning="综合 Gemini 架构分析和 Codex 规划方案，采用合并策略",
@@ -1397,12 +1439,6 @@ class ArchitectExecutor(ExecutorStrategy):
         consensus.status = ConsensusStatus.PARTIAL_AGREEMENT
         return consensus
 
-    def _get_context_files(self, context: TaskContext) -> List[str]:
-        """从任务描述中提取相关文件"""
-        import re
-        files = re.findall(r'[\w/.-]+\.(ts|js|py|go|rs|java|tsx|jsx|md|json|yaml|toml)', context.description)
-        return files
-
 
 class UIFlowExecutor(ExecutorStrategy):
     """
@@ -1413,22 +1449,18 @@ class UIFlowExecutor(ExecutorStrategy):
     Phase 3: 预览验证 - Claude
     """
 
+    ROUTE = "UI_FLOW"
+    PHASE_STEPS = MappingProxyType({
+        "design": PhaseStep(Phase.DESIGNING, "UI 设计", ModelType.GEMINI, 0.1, "准备 Gemini UI 设计..."),
+        "implement": PhaseStep(Phase.IMPLEMENTING, "实现", ModelType.GEMINI, 0.4, "准备 Gemini UI 实现..."),
+        "validate": PhaseStep(Phase.VALIDATING, "预览验证", ModelType.CLAUDE, 0.85, "预览验证..."),
+    })
+
     def execute(self, context: TaskContext, tracker: ProgressTracker) -> ExecutionStatus:
-        model_calls = []
+        model_calls: List[ModelCall] = []
 
         # Phase 1: UI 设计 (Gemini)
-        tracker.start_phase(Phase.DESIGNING)
-        tracker.update(0.1, "准备 Gemini UI 设计...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=1,
-            total_phases=3,
-            phase_name="UI 设计",
-            route="UI_FLOW",
-            model=ModelType.GEMINI,
-            progress_percent=10
-        )
-        print(header)
+        self._enter_phase(tracker, "design", 1, 3)
 
         design_prompt = f"""设计以下 UI 组件:
 
@@ -1445,12 +1477,14 @@ class UIFlowExecutor(ExecutorStrategy):
             context_files=self._get_ui_context_files(context)
         )
 
-        model_calls.append({
-            "phase": 1,
-            "model": ModelType.GEMINI.value,
-            "success": design_result.success,
-            "duration_ms": design_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=1,
+            model=ModelType.GEMINI.value,
+            success=design_result.success,
+            duration_ms=design_result.duration_ms
+        ))
+
+        design_excerpt = design_result.output[:3000]
 
         design_content = self._format_result_markdown(
             "Phase 1: UI 设计 (Gemini)",
@@ -1458,37 +1492,26 @@ class UIFlowExecutor(ExecutorStrategy):
             design_result,
             context
         )
-        self._save_output("1_ui_design.md", design_content)
+        self._save_output_async("1_ui_design.md", design_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=1,
             model=ModelType.GEMINI,
             duration_ms=design_result.duration_ms,
             output_file=".skillpack/current/1_ui_design.md"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 2: 实现 (Gemini)
-        tracker.start_phase(Phase.IMPLEMENTING)
-        tracker.update(0.4, "准备 Gemini UI 实现...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=2,
-            total_phases=3,
-            phase_name="实现",
-            route="UI_FLOW",
-            model=ModelType.GEMINI,
-            progress_percent=40
-        )
-        print(header)
+        self._enter_phase(tracker, "implement", 2, 3)
 
         impl_prompt = f"""根据设计实现以下 UI 组件:
 
 任务: {context.description}
 
 设计方案:
-{design_result.output[:3000] if design_result.success else "(设计阶段失败)"}
+{design_excerpt if design_result.success else "(设计阶段失败)"}
 
 实现要求:
 1. 使用项目现有技术栈
@@ -1500,12 +1523,12 @@ class UIFlowExecutor(ExecutorStrategy):
             context_files=self._get_ui_context_files(context)
         )
 
-        model_calls.append({
-            "phase": 2,
-            "model": ModelType.GEMINI.value,
-            "success": impl_result.success,
-            "duration_ms": impl_result.duration_ms
-        })
+        model_calls.append(ModelCall(
+            phase=2,
+            model=ModelType.GEMINI.value,
+            success=impl_result.success,
+            duration_ms=impl_result.duration_ms
+        ))
 
         impl_content = self._format_result_markdown(
             "Phase 2: UI 实现 (Gemini)",
@@ -1513,35 +1536,24 @@ class UIFlowExecutor(ExecutorStrategy):
             impl_result,
             context
         )
-        self._save_output("2_implementation.md", impl_content)
+        self._save_output_async("2_implementation.md", impl_content)
 
-        print(self.dispatcher.format_phase_complete(
+        self._emit(self.dispatcher.format_phase_complete(
             phase=2,
             model=ModelType.GEMINI,
             duration_ms=impl_result.duration_ms,
             output_file=".skillpack/current/2_implementation.md"
-        ))
+        ), "\n", flush=True)
 
         tracker.complete_phase()
 
         # Phase 3: 预览验证 (Claude)
-        tracker.start_phase(Phase.VALIDATING)
-        tracker.update(0.85, "预览验证...")
-
-        header = self.dispatcher.format_phase_header(
-            phase=3,
-            total_phases=3,
-            phase_name="预览验证",
-            route="UI_FLOW",
-            model=ModelType.CLAUDE,
-            progress_percent=85
-        )
-        print(header)
+        self._enter_phase(tracker, "validate", 3, 3)
 
         preview_content = f"""# 预览验证
 
 ## Gemini 设计方案
-{design_result.output[:2000] if design_result.success else "(设计失败)"}
+{design_excerpt[:2000] if design_result.success else "(设计失败)"}
 
 ## Gemini 实现结果
 {impl_result.output[:2000] if impl_result.success else "(实现失败)"}
@@ -1549,36 +1561,25 @@ class UIFlowExecutor(ExecutorStrategy):
 ## Claude 验证
 (由 Claude 完成预览验证和微调)
 """
-        self._save_output("3_preview.md", preview_content)
+        self._save_output_async("3_preview.md", preview_content)
 
         tracker.complete_phase()
         tracker.complete()
 
-        return ExecutionStatus(
-            is_running=False,
-            error=None if (design_result.success and impl_result.success) else (design_result.error or impl_result.error),
-            output_files=["1_ui_design.md", "2_implementation.md", "3_preview.md"],
-            model_calls=model_calls
+        return self._finish(
+            None if (design_result.success and impl_result.success) else (design_result.error or impl_result.error),
+            ["1_ui_design.md", "2_implementation.md", "3_preview.md"],
+            model_calls
         )
 
     def _get_ui_context_files(self, context: TaskContext) -> List[str]:
         """获取 UI 相关上下文文件"""
-        import re
-        files = re.findall(r'[\w/.-]+\.(tsx|jsx|css|scss|vue|svelte)', context.description)
+        files = _UI_FILE_RE.findall(context.description)
 
         # 添加常见 UI 目录
-        common_paths = [
-            "src/components",
-            "src/pages",
-            "src/styles",
-            "components",
-            "pages"
-        ]
-
-        for path in common_paths:
-            if Path(path).exists():
-                files.append(path)
-                break
+        ui_dir = _find_first_ui_dir(os.getcwd())
+        if ui_dir:
+            files.append(ui_dir)
 
         return files
 
@@ -1590,49 +1591,79 @@ class TaskExecutor:
         self.config = config or SkillpackConfig()
         self.quiet = quiet
         self._usage_store = UsageStore()
-        self._strategies = {
-            ExecutionRoute.DIRECT: DirectExecutor(self.config),
-            ExecutionRoute.PLANNED: PlannedExecutor(self.config),
-            ExecutionRoute.RALPH: RalphExecutor(self.config),
-            ExecutionRoute.ARCHITECT: ArchitectExecutor(self.config),
-            ExecutionRoute.UI_FLOW: UIFlowExecutor(self.config),
+        # 所有策略共享同一个调度器（版本检测只执行一次）
+        self._dispatcher = get_dispatcher(self.config)
+        # 策略按需创建并缓存，单次运行只会用到其中一个
+        self._strategy_factories = {
+            ExecutionRoute.DIRECT: DirectExecutor,
+            ExecutionRoute.PLANNED: PlannedExecutor,
+            ExecutionRoute.RALPH: RalphExecutor,
+            ExecutionRoute.ARCHITECT: ArchitectExecutor,
+            ExecutionRoute.UI_FLOW: UIFlowExecutor,
         }
+        self._strategy_cache: Dict[ExecutionRoute, ExecutorStrategy] = {}
+        # 已创建输出目录的工作目录
+        self._prepared_dirs: Set[Path] = set()
+
+    def _get_strategy(self, route: ExecutionRoute) -> ExecutorStrategy:
+        """获取路由对应的执行策略（首次使用时创建）"""
+        strategy = self._strategy_cache.get(route)
+        if strategy is None:
+            factory = self._strategy_factories.get(route, DirectExecutor)
+            strategy = factory(self.config, self._dispatcher)
+            self._strategy_cache[route] = strategy
+        return strategy
+
+    def close(self) -> None:
+        """释放已创建策略的线程池"""
+        for strategy in self._strategy_cache.values():
+            strategy.close()
+        self._strategy_cache.clear()
+
+    def _prepare_output_dirs(self, working_dir: Path) -> None:
+        """创建输出目录（同一工作目录只创建一次）"""
+        if working_dir in self._prepared_dirs:
+            return
+        (working_dir / self.config.output.current_dir).mkdir(parents=True, exist_ok=True)
+        (working_dir / self.config.output.history_dir).mkdir(parents=True, exist_ok=True)
+        self._prepared_dirs.add(working_dir)
+
+    def _print_banner(self, context: TaskContext) -> None:
+        """输出任务开始横幅"""
+        mode = "CLI 优先" if self.config.cli.prefer_cli_over_mcp else "MCP"
+        print(f"""
+════════════════════════════════════════════════════════════
+🚀 Skillpack v5.4.1 - 任务开始
+════════════════════════════════════════════════════════════
+📋 任务: {context.description}
+📊 路由: {context.route.value}
+🖥️ 执行模式: {mode}
+────────────────────────────────────────────────────────────
+""")
 
     def execute(self, context: TaskContext) -> ExecutionStatus:
         """执行任务"""
         # 生成任务 ID
-        task_id = f"task-{uuid.uuid4().hex[:8]}"
+        task_id = f"task-{os.urandom(4).hex()}"
 
         # 创建输出目录
-        working_dir = context.working_dir or Path.cwd()
-        current_dir = working_dir / self.config.output.current_dir
-        current_dir.mkdir(parents=True, exist_ok=True)
-
-        history_dir = working_dir / self.config.output.history_dir
-        history_dir.mkdir(parents=True, exist_ok=True)
+        self._prepare_output_dirs(context.working_dir or Path.cwd())
 
         # 创建进度追踪器
+        # 追踪器不对外暴露，无需保留进度事件
         tracker = SimpleProgressTracker(
             task_id=task_id,
             description=context.description,
-            quiet=self.quiet
+            quiet=self.quiet,
+            max_events=0
         )
 
         # 输出执行模式
-        mode = "CLI 优先" if self.config.cli.prefer_cli_over_mcp else "MCP"
         if not self.quiet:
-            print(f"""
-════════════════════════════════════════════════════════════
-🚀 Skillpack v5.4.1 - 任务开始
-════════════════════════════════════════════════════════════
-📋 任务: {context.description}
-📊 路由: {context.route.value}
-🖥️ 执行模式: {mode}
-────────────────────────────────────────────────────────────
-""")
+            self._print_banner(context)
 
         # 获取执行策略
-        strategy = self._strategies.get(context.route, DirectExecutor(self.config))
+        strategy = self._get_strategy(context.route)
 
         # 设置调度器上下文（用于用量追踪）
         strategy.dispatcher.set_context(
@@ -1640,8 +1671,31 @@ class TaskExecutor:
             route=context.route.value
         )
 
-        # 执行
-        return strategy.execute(context, tracker)
+        # 丢弃上次异常中断遗留的写入，避免本次 _finish 抛出旧任务的错误
+        strategy._wait_pending_writes(raise_errors=False)
+
+        # 执行（本次任务的用量记录在结束时一次写入）
+        try:
+            with strategy.dispatcher.batched_usage():
+                return strategy.execute(context, tracker)
+        except BaseException:
+            # 异常退出时不会经过 _finish，仍需等待已提交的写入落盘
+            strategy._wait_pending_writes(raise_errors=False)
+            raise
+
+    async def execute_async(self, context: TaskContext) -> ExecutionStatus:
+        """
+        异步执行任务
+
+        策略中的模型调用是阻塞的 CLI 子进程，放到默认线程池执行，
+        事件循环在等待期间可以调度其他协程。调度器上下文按实例共享，
+        并发执行多个任务时请为每个任务使用独立的 TaskExecutor。
+        """
+        # asyncio 导入开销较大（连带 ssl/socket），只在异步调用时导入
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute, context)
 
     def record_claude_phase(
         self,
@@ -4,15 +4,164 @@ LSP 客户端 (v6.0)
 提供 LSP 协议客户端实现，支持代码智能功能。
 """
 
+import atexit
+import functools
+import itertools
 import subprocess
 import json
 import threading
-from typing import Dict, List, Optional, Any, Callable
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import Future, wait as wait_futures
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from pathlib import Path
+from urllib.parse import unquote
 from dataclasses import dataclass
 
 from .config import LSPConfig, LSPServerConfig, detect_language
 
+try:
+    # 可选依赖：orjson 直接输出/解析 UTF-8 bytes
+    import orjson
+    _dump_message = orjson.dumps
+    _load_message = orjson.loads
+except ImportError:
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def _dump_message(message: Dict) -> bytes:
+        return _encoder.encode(message).encode("utf-8")
+
+    _load_message = json.loads
+
+
+# 服务器管道缓冲区大小
+_PIPE_BUFFER_SIZE = 64 * 1024
+
+# LSP SymbolKind 编号到名称
+SYMBOL_KINDS = {
+    1: "File", 2: "Module", 3: "Namespace", 4: "Package",
+    5: "Class", 6: "Method", 7: "Property", 8: "Field",
+    9: "Constructor", 10: "Enum", 11: "Interface", 12: "Function",
+    13: "Variable", 14: "Constant", 15: "String", 16: "Number",
+    17: "Boolean", 18: "Array", 19: "Object", 20: "Key",
+    21: "Null", 22: "EnumMember", 23: "Struct", 24: "Event",
+    25: "Operator", 26: "TypeParameter",
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _uri_for(file_path: Path) -> str:
+    """文件路径转 URI（as_uri 需要逐段转义，按路径缓存）"""
+    return file_path.as_uri()
+
+
+@functools.lru_cache(maxsize=2048)
+def _path_from_uri(uri: str) -> Path:
+    """从 URI 解析路径（还原 as_uri 的转义；引用/符号结果中同一 URI 反复出现，按 URI 缓存）"""
+    if uri.startswith("file://"):
+        return Path(unquote(uri[7:]))
+    return Path(uri)
+
+
+class _ServerConnection:
+    """LSP 服务器连接（进程、读取线程与等待中的请求），可被多个客户端共享"""
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+        # next() 在 GIL 下是原子的，分配请求 ID 无需加锁
+        self.request_ids = itertools.count(1)
+        # 每个请求一个 Future，读取线程只唤醒对应的等待者
+        self.pending: Dict[int, Future] = {}
+        self.initialized = False
+        # 读取线程退出（服务器进程已结束）后置为 True
+        self.closed = False
+        self.init_lock = threading.Lock()
+        self.refcount = 0
+
+        threading.Thread(target=self._read_responses_until_closed, daemon=True).start()
+
+    def send(self, messages: List[Dict]):
+        """发送 LSP 消息（多条消息合并为一次写入）"""
+        frames = []
+        for message in messages:
+            content = _dump_message(message)
+            frames.append(b"Content-Length: %d\r\n\r\n" % len(content))
+            frames.append(content)
+
+        try:
+            stdin = self.process.stdin
+            stdin.write(b"".join(frames))
+            stdin.flush()
+        except Exception:
+            pass
+
+    def close(self):
+        """关闭服务器进程"""
+        try:
+            self.send([
+                {"jsonrpc": "2.0", "method": "shutdown"},
+                {"jsonrpc": "2.0", "method": "exit"},
+            ])
+            self.process.terminate()
+        except Exception:
+            pass
+
+    def _read_responses(self):
+        """读取响应线程"""
+        stdout = self.process.stdout
+        while True:
+            try:
+                # 逐行读取头部（缓冲读取，避免逐字节系统调用）
+                content_length = 0
+                while True:
+                    line = stdout.readline()
+                    if not line:
+                        return
+                    if line == b"\r\n":
+                        break
+                    if line.startswith(b"Content-Length:"):
+                        content_length = int(line[15:].strip())
+
+                if content_length == 0:
+                    continue
+
+                # 读取内容（直接解析 bytes）
+                message = _load_message(stdout.read(content_length))
+
+                # 处理响应
+                if "id" in message:
+                    future = self.pending.get(message["id"])
+                    if future is not None and not future.done():
+                        future.set_result(message.get("result"))
+
+            except Exception:
+                break
+
+    def _read_responses_until_closed(self):
+        """读取响应直到服务器退出，随后唤醒所有等待中的请求（不必等到超时）"""
+        try:
+            self._read_responses()
+        finally:
+            self.closed = True
+            for future in list(self.pending.values()):
+                if not future.done():
+                    future.set_result(None)
+
+
+# 进程内共享的服务器连接：(语言, 工作区根目录, 启动命令) -> 连接
+_SERVER_POOL: Dict[Tuple[str, str, Tuple[str, ...]], _ServerConnection] = {}
+_POOL_LOCK = threading.Lock()
+
+
+@atexit.register
+def _shutdown_server_pool():
+    """进程退出时关闭所有共享的服务器"""
+    with _POOL_LOCK:
+        connections = list(_SERVER_POOL.values())
+        _SERVER_POOL.clear()
+    for connection in connections:
+        connection.close()
+
 
 @dataclass
 class Location:
@@ -33,6 +182,46 @@ class Symbol:
     container: Optional[str] = None
 
 
+class SymbolTable(Sequence):
+    """
+    符号表（按列存储）
+
+    解析时只追加到并行数组，按下标访问时才构建 Symbol 对象。
+    结束行/列缺失时记为 -1。
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.kinds = array("i")
+        self.uris: List[str] = []
+        self.lines = array("i")
+        self.columns = array("i")
+        self.end_lines = array("i")
+        self.end_columns = array("i")
+        self.containers: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        end_line = self.end_lines[index]
+        end_column = self.end_columns[index]
+        return Symbol(
+            name=self.names[index],
+            kind=SYMBOL_KINDS.get(self.kinds[index], "Unknown"),
+            location=Location(
+                file=_path_from_uri(self.uris[index]),
+                line=self.lines[index],
+                column=self.columns[index],
+                end_line=None if end_line < 0 else end_line,
+                end_column=None if end_column < 0 else end_column,
+            ),
+            container=self.containers[index],
+        )
+
+
 @dataclass
 class HoverInfo:
     """悬停信息"""
@@ -60,17 +249,16 @@ class LSPClient:
             config: LSP 配置
         """
         self._config = config
-        self._servers: Dict[str, subprocess.Popen] = {}
-        self._request_id = 0
-        self._pending_requests: Dict[int, threading.Event] = {}
-        self._responses: Dict[int, Any] = {}
-        self._initialized: Dict[str, bool] = {}
-        self._lock = threading.Lock()
+        # 本客户端持有的连接（来自进程级连接池）
+        self._servers: Dict[str, _ServerConnection] = {}
+        self._server_keys: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
 
     def start(self, language: str) -> bool:
         """
         启动指定语言的 LSP 服务器
 
+        同一工作区、同一命令的服务器在进程内共享，只在首次使用时启动和初始化。
+
         Args:
             language: 语言标识
 
@@ -87,28 +275,34 @@ class LSPClient:
         if not server_config:
             return False
 
-        try:
-            # 启动服务器进程
-            cmd = [server_config.command] + server_config.args
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-
-            self._servers[language] = process
-
-            # 启动读取线程
-            reader_thread = threading.Thread(
-                target=self._read_responses,
-                args=(language, process),
-                daemon=True,
-            )
-            reader_thread.start()
+        cmd = [server_config.command] + server_config.args
+        workspace_root = (self._config.workspace_root or Path.cwd()).resolve()
+        key = (language, str(workspace_root), tuple(cmd))
 
-            # 初始化
-            return self._initialize(language)
+        try:
+            with _POOL_LOCK:
+                connection = _SERVER_POOL.get(key)
+                if connection is None or connection.process.poll() is not None:
+                    # 启动服务器进程
+                    process = subprocess.Popen(
+                        cmd,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        bufsize=_PIPE_BUFFER_SIZE,
+                    )
+                    connection = _ServerConnection(process)
+                    _SERVER_POOL[key] = connection
+                connection.refcount += 1
+
+            self._servers[language] = connection
+            self._server_keys[language] = key
+
+            # 初始化（共享连接只初始化一次）
+            with connection.init_lock:
+                if not connection.initialized:
+                    connection.initialized = self._initialize(language)
+            return connection.initialized
 
         except FileNotFoundError:
             print(f"⚠️ LSP 服务器未找到: {server_config.command}")
@@ -118,18 +312,20 @@ class LSPClient:
             return False
 
     def stop(self, language: str):
-        """停止 LSP 服务器"""
-        if language in self._servers:
-            try:
-                self._send_notification(language, "shutdown")
-                self._send_notification(language, "exit")
-                self._servers[language].terminate()
-            except Exception:
-                pass
-            finally:
-                del self._servers[language]
-                if language in self._initialized:
-                    del self._initialized[language]
+        """释放 LSP 服务器（最后一个使用者释放时才关闭进程）"""
+        connection = self._servers.pop(language, None)
+        if connection is None:
+            return
+        key = self._server_keys.pop(language)
+
+        with _POOL_LOCK:
+            connection.refcount -= 1
+            should_close = connection.refcount <= 0
+            if should_close and _SERVER_POOL.get(key) is connection:
+                del _SERVER_POOL[key]
+
+        if should_close:
+            connection.close()
 
     def stop_all(self):
         """停止所有服务器"""
@@ -160,24 +356,46 @@ class LSPClient:
         response = self._send_request(
             language,
             "textDocument/definition",
-            {
-                "textDocument": {"uri": file_path.as_uri()},
-                "position": {"line": line, "character": column},
-            },
+            self._position_params(file_path, line, column),
         )
 
-        if not response:
-            return None
+        return self._parse_definition(response)
 
-        # 处理响应
-        if isinstance(response, list) and response:
-            loc = response[0]
-        elif isinstance(response, dict):
-            loc = response
-        else:
-            return None
+    def goto_definition_batch(
+        self,
+        positions: List[Tuple[Path, int, int]],
+    ) -> List[Optional[Location]]:
+        """
+        批量跳转到定义
 
-        return self._parse_location(loc)
+        同一语言的请求合并为一次写入，再统一等待响应。
+
+        Args:
+            positions: (文件路径, 行号, 列号) 列表 (0-indexed)
+
+        Returns:
+            与输入顺序一一对应的定义位置（失败为 None）
+        """
+        results: List[Optional[Location]] = [None] * len(positions)
+
+        by_language: Dict[str, List[int]] = {}
+        for index, (file_path, _, _) in enumerate(positions):
+            language = detect_language(file_path)
+            if language:
+                by_language.setdefault(language, []).append(index)
+
+        for language, indexes in by_language.items():
+            if not self._ensure_started(language):
+                continue
+            responses = self._send_requests(
+                language,
+                "textDocument/definition",
+                [self._position_params(*positions[index]) for index in indexes],
+            )
+            for index, response in zip(indexes, responses):
+                results[index] = self._parse_definition(response)
+
+        return results
 
     def find_references(
         self,
@@ -206,7 +424,7 @@ class LSPClient:
             language,
             "textDocument/references",
             {
-                "textDocument": {"uri": file_path.as_uri()},
+                "textDocument": {"uri": _uri_for(file_path)},
                 "position": {"line": line, "character": column},
                 "context": {"includeDeclaration": include_declaration},
             },
@@ -244,10 +462,7 @@ class LSPClient:
         response = self._send_request(
             language,
             "textDocument/hover",
-            {
-                "textDocument": {"uri": file_path.as_uri()},
-                "position": {"line": line, "character": column},
-            },
+            self._position_params(file_path, line, column),
         )
 
         if not response or "contents" not in response:
@@ -274,7 +489,7 @@ class LSPClient:
 
         return None
 
-    def document_symbols(self, file_path: Path) -> List[Symbol]:
+    def document_symbols(self, file_path: Path) -> SymbolTable:
         """
         获取文档符号
 
@@ -282,28 +497,29 @@ class LSPClient:
             file_path: 文件路径
 
         Returns:
-            符号列表
+            符号表（可按下标/迭代获取 Symbol）
         """
         language = detect_language(file_path)
         if not language or not self._ensure_started(language):
-            return []
+            return SymbolTable()
 
         response = self._send_request(
             language,
             "textDocument/documentSymbol",
-            {"textDocument": {"uri": file_path.as_uri()}},
+            {"textDocument": {"uri": _uri_for(file_path)}},
         )
 
         if not response or not isinstance(response, list):
-            return []
+            return SymbolTable()
 
         return self._parse_symbols(response, file_path)
 
     def _ensure_started(self, language: str) -> bool:
         """确保服务器已启动"""
-        if language not in self._servers:
+        connection = self._servers.get(language)
+        if connection is None:
             return self.start(language)
-        return language in self._initialized and self._initialized[language]
+        return connection.initialized
 
     def _initialize(self, language: str) -> bool:
         """初始化 LSP 连接"""
@@ -331,7 +547,6 @@ class LSPClient:
 
         if response:
             self._send_notification(language, "initialized", {})
-            self._initialized[language] = True
             return True
 
         return False
@@ -343,36 +558,41 @@ class LSPClient:
         params: Dict,
     ) -> Optional[Any]:
         """发送请求并等待响应"""
-        if language not in self._servers:
-            return None
-
-        with self._lock:
-            self._request_id += 1
-            request_id = self._request_id
+        return self._send_requests(language, method, [params])[0]
 
-        message = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-            "params": params,
-        }
+    def _send_requests(
+        self,
+        language: str,
+        method: str,
+        params_list: List[Dict],
+    ) -> List[Optional[Any]]:
+        """批量发送同一方法的请求（一次写入），按顺序返回响应"""
+        connection = self._servers.get(language)
+        if connection is None:
+            return [None] * len(params_list)
 
-        # 创建等待事件
-        event = threading.Event()
-        self._pending_requests[request_id] = event
+        request_ids = [next(connection.request_ids) for _ in params_list]
+        futures = [Future() for _ in request_ids]
+        connection.pending.update(zip(request_ids, futures))
 
         # 发送消息
-        self._send_message(language, message)
-
-        # 等待响应
-        if event.wait(timeout=self._config.timeout_seconds):
-            result = self._responses.pop(request_id, None)
-            del self._pending_requests[request_id]
-            return result
-
-        # 超时
-        del self._pending_requests[request_id]
-        return None
+        self._send_messages(language, [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params,
+            }
+            for request_id, params in zip(request_ids, params_list)
+        ])
+
+        # 一次等待收集整批响应（超时未到达的返回 None）；服务器已退出时不再等待
+        if not connection.closed:
+            wait_futures(futures, timeout=self._config.timeout_seconds)
+        for request_id in request_ids:
+            connection.pending.pop(request_id, None)
+
+        return [future.result() if future.done() else None for future in futures]
 
     def _send_notification(
         self,
@@ -388,59 +608,34 @@ class LSPClient:
         if params:
             message["params"] = params
 
-        self._send_message(language, message)
-
-    def _send_message(self, language: str, message: Dict):
-        """发送 LSP 消息"""
-        if language not in self._servers:
-            return
-
-        content = json.dumps(message)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
-
-        try:
-            self._servers[language].stdin.write(header.encode())
-            self._servers[language].stdin.write(content.encode())
-            self._servers[language].stdin.flush()
-        except Exception:
-            pass
-
-    def _read_responses(self, language: str, process: subprocess.Popen):
-        """读取响应线程"""
-        while language in self._servers:
-            try:
-                # 读取头部
-                header = b""
-                while b"\r\n\r\n" not in header:
-                    byte = process.stdout.read(1)
-                    if not byte:
-                        return
-                    header += byte
+        self._send_messages(language, [message])
 
-                # 解析 Content-Length
-                header_str = header.decode()
-                content_length = 0
-                for line in header_str.split("\r\n"):
-                    if line.startswith("Content-Length:"):
-                        content_length = int(line.split(":")[1].strip())
-                        break
+    def _send_messages(self, language: str, messages: List[Dict]):
+        """发送 LSP 消息（多条消息合并为一次写入）"""
+        connection = self._servers.get(language)
+        if connection is not None:
+            connection.send(messages)
 
-                if content_length == 0:
-                    continue
+    def _position_params(self, file_path: Path, line: int, column: int) -> Dict:
+        """构建 TextDocumentPositionParams"""
+        return {
+            "textDocument": {"uri": _uri_for(file_path)},
+            "position": {"line": line, "character": column},
+        }
 
-                # 读取内容
-                content = process.stdout.read(content_length).decode()
-                message = json.loads(content)
+    def _parse_definition(self, response: Any) -> Optional[Location]:
+        """解析 definition 响应（Location / Location[] / LocationLink[]）"""
+        if not response:
+            return None
 
-                # 处理响应
-                if "id" in message:
-                    request_id = message["id"]
-                    if request_id in self._pending_requests:
-                        self._responses[request_id] = message.get("result")
-                        self._pending_requests[request_id].set()
+        if isinstance(response, list):
+            loc = response[0]
+        elif isinstance(response, dict):
+            loc = response
+        else:
+            return None
 
-            except Exception:
-                break
+        return self._parse_location(loc)
 
     def _parse_location(self, data: Dict) -> Optional[Location]:
         """解析位置信息"""
@@ -456,14 +651,8 @@ class LSPClient:
         start = range_data.get("start", {})
         end = range_data.get("end", {})
 
-        # 从 URI 解析路径
-        if uri.startswith("file://"):
-            file_path = Path(uri[7:])
-        else:
-            file_path = Path(uri)
-
         return Location(
-            file=file_path,
+            file=_path_from_uri(uri),
             line=start.get("line", 0),
             column=start.get("character", 0),
             end_line=end.get("line"),
@@ -474,46 +663,52 @@ class LSPClient:
         self,
         data: List[Dict],
         file_path: Path,
-    ) -> List[Symbol]:
-        """解析符号列表"""
-        symbols = []
-
-        SYMBOL_KINDS = {
-            1: "File", 2: "Module", 3: "Namespace", 4: "Package",
-            5: "Class", 6: "Method", 7: "Property", 8: "Field",
-            9: "Constructor", 10: "Enum", 11: "Interface", 12: "Function",
-            13: "Variable", 14: "Constant", 15: "String", 16: "Number",
-            17: "Boolean", 18: "Array", 19: "Object", 20: "Key",
-            21: "Null", 22: "EnumMember", 23: "Struct", 24: "Event",
-            25: "Operator", 26: "TypeParameter",
-        }
-
-        def process_symbol(item: Dict, container: Optional[str] = None):
+    ) -> SymbolTable:
+        """解析符号列表（显式栈前序遍历，深层嵌套不会触发递归上限）"""
+        table = SymbolTable()
+        add_name = table.names.append
+        add_kind = table.kinds.append
+        add_uri = table.uris.append
+        add_line = table.lines.append
+        add_column = table.columns.append
+        add_end_line = table.end_lines.append
+        add_end_column = table.end_columns.append
+        add_container = table.containers.append
+        file_uri = _uri_for(file_path)
+
+        stack: List[Tuple[Dict, Optional[str]]] = [(item, None) for item in reversed(data)]
+        while stack:
+            item, container = stack.pop()
             name = item.get("name", "")
-            kind_num = item.get("kind", 0)
-            kind = SYMBOL_KINDS.get(kind_num, "Unknown")
 
             # 获取位置
-            loc_data = item.get("location", {})
-            if not loc_data:
+            loc_data = item.get("location")
+            if loc_data:
+                # SymbolInformation 格式
+                uri = loc_data.get("uri", loc_data.get("targetUri", ""))
+                range_data = loc_data.get("range", loc_data.get("targetRange", {}))
+            else:
                 # DocumentSymbol 格式
+                uri = file_uri
                 range_data = item.get("range", item.get("selectionRange", {}))
-                loc_data = {"uri": file_path.as_uri(), "range": range_data}
-
-            loc = self._parse_location(loc_data)
-            if loc:
-                symbols.append(Symbol(
-                    name=name,
-                    kind=kind,
-                    location=loc,
-                    container=container,
-                ))
-
-            # 处理子符号
-            for child in item.get("children", []):
-                process_symbol(child, name)
-
-        for item in data:
-            process_symbol(item)
 
-        return symbols
+            if uri and range_data:
+                start = range_data.get("start", {})
+                end = range_data.get("end", {})
+                end_line = end.get("line")
+                end_column = end.get("character")
+                add_name(name)
+                add_kind(item.get("kind", 0))
+                add_uri(uri)
+                add_line(start.get("line", 0))
+                add_column(start.get("character", 0))
+                add_end_line(-1 if end_line is None else end_line)
+                add_end_column(-1 if end_column is None else end_column)
+                add_container(container)
+
+            # 子符号逆序入栈，保持原有的先序输出顺序
+            children = item.get("children")
+            if children:
+                stack.extend((child, name) for child in reversed(children))
+
+        return table
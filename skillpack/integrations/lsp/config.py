@@ -4,6 +4,7 @@ LSP 配置 (v6.0)
 定义 LSP 服务器配置和语言映射。
 """
 
+import functools
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from pathlib import Path
@@ -72,5 +73,10 @@ EXTENSION_TO_LANGUAGE = {
 
 def detect_language(file_path: Path) -> Optional[str]:
     """根据文件扩展名检测语言"""
-    suffix = file_path.suffix.lower()
-    return EXTENSION_TO_LANGUAGE.get(suffix)
+    return _language_for_suffix(file_path.suffix)
+
+
+@functools.lru_cache(maxsize=64)
+def _language_for_suffix(suffix: str) -> Optional[str]:
+    """扩展名（原始大小写）到语言的缓存映射"""
+    return EXTENSION_TO_LANGUAGE.get(suffix.lower())
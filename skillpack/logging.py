@@ -8,15 +8,65 @@
 - 结构化 JSON 日志
 """
 
+import atexit
+import copy
+import functools
 import logging
 import logging.handlers
 import json
+import queue
+import socket
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set
+
+try:
+    # 可选依赖：orjson 在 C 层完成序列化，非 ASCII 字符原样输出
+    import orjson
+
+    def _dump_record(log_record: Dict[str, Any]) -> str:
+        return orjson.dumps(log_record).decode("utf-8")
+except ImportError:
+    _encoder = json.JSONEncoder(ensure_ascii=False)
+    _dump_record = _encoder.encode
+
+
+# 日志级别名称到 logging 模块级别的映射
+_LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# 主机名在进程生命周期内不变，导入时取一次
+_HOSTNAME = socket.gethostname()
+
+# 已创建过的日志目录，重复 configure() 时不再逐级 stat
+_CREATED_LOG_DIRS: Set[Path] = set()
+
+# 按秒缓存的 ISO 时间前缀: (epoch 秒, "YYYY-MM-DDTHH:MM:SS")
+_ts_cache = (-1, "")
+
+
+def _iso_timestamp(created: float) -> str:
+    """生成与 datetime.isoformat() 一致的时间戳，同一秒内只格式化一次"""
+    global _ts_cache
+    sec = int(created)
+    cache = _ts_cache
+    if cache[0] != sec:
+        cache = _ts_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    usec = round((created - sec) * 1e6)
+    if usec == 0:
+        return cache[1]
+    if usec >= 1000000:
+        return datetime.fromtimestamp(created).isoformat()
+    return f"{cache[1]}.{usec:06d}"
 
 
 class LogLevel(Enum):
@@ -29,14 +79,11 @@ class LogLevel(Enum):
 
     def to_logging_level(self) -> int:
         """转换为 logging 模块的级别"""
-        mapping = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-            "critical": logging.CRITICAL,
-        }
-        return mapping.get(self.value, logging.INFO)
+        return _LEVEL_MAP.get(self.value, logging.INFO)
+
+
+# 级别名称到 LogLevel 的映射，避免 Enum 按值查找
+_LEVEL_BY_NAME = {lvl.value: lvl for lvl in LogLevel}
 
 
 @dataclass
@@ -51,6 +98,27 @@ class LoggingConfig:
     json_format: bool = False
     include_timestamp: bool = True
     include_module: bool = True
+    batch_size: int = 64  # 文件日志批量写入的记录数
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """按秒缓存 %(asctime)s 的格式化器，同一秒内的记录只调用一次 strftime"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        cache = self._time_cache
+        if cache[0] != sec or cache[1] != datefmt:
+            ct = self.converter(record.created)
+            cache = self._time_cache = (
+                sec, datefmt, time.strftime(datefmt or self.default_time_format, ct)
+            )
+        if datefmt or not self.default_msec_format:
+            return cache[2]
+        return self.default_msec_format % (cache[2], record.msecs)
 
 
 class JSONFormatter(logging.Formatter):
@@ -58,9 +126,11 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_record: Dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": _iso_timestamp(record.created),
             "level": record.levelname,
             "message": record.getMessage(),
+            "hostname": _HOSTNAME,
+            "pid": record.process,
         }
 
         if record.module:
@@ -80,10 +150,10 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "phase"):
             log_record["phase"] = record.phase
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return _dump_record(log_record)
 
 
-class ColoredFormatter(logging.Formatter):
+class ColoredFormatter(CachedTimeFormatter):
     """带颜色的控制台格式化器"""
 
     COLORS = {
@@ -98,16 +168,132 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt: Optional[str] = None, use_colors: bool = True):
         super().__init__(fmt)
         self.use_colors = use_colors
+        # 预先生成各级别的带色级别名，format 时只做一次查表
+        self._colored = {
+            level: f"{color}{logging.getLevelName(level)}{self.RESET}"
+            for level, color in self.COLORS.items()
+        } if use_colors else {}
 
     def format(self, record: logging.LogRecord) -> str:
-        if self.use_colors:
-            color = self.COLORS.get(record.levelno, self.RESET)
-            record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        if not self.use_colors:
+            return super().format(record)
+        original = record.levelname
+        record.levelname = self._colored.get(
+            record.levelno, f"{self.RESET}{original}{self.RESET}"
+        )
+        try:
+            return super().format(record)
+        finally:
+            # 还原级别名，避免影响同一记录的其他处理器
+            record.levelname = original
+
+
+class BatchRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    批量写入的轮转文件处理器
+
+    记录先缓存在内存中，达到 batch_size 或调用 flush() 时合并为一次写入；
+    文件大小在内存中累计，判断轮转时不再每条记录 seek/tell。
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = "utf-8",
+        batch_size: int = 64,
+    ):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self.batch_size = max(1, batch_size)
+        self._pending: List[str] = []
+        self._size = self.stream.seek(0, 2)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # 每条记录只格式化、编码一次，轮转判断与计数共用结果
+            msg = self.format(record) + self.terminator
+            size = self._record_size(msg)
+            if self._exceeds_max(size):
+                self._write_pending()
+                self.doRollover()
+                self._size = 0
+            self._pending.append(msg)
+            self._size += size
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+        except Exception:
+            self.handleError(record)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # 按内存中累计的大小判断，不像标准库那样每条记录 stat 日志文件
+        if self.maxBytes <= 0:
+            return False
+        return self._exceeds_max(self._record_size(self.format(record) + self.terminator))
+
+    def _record_size(self, msg: str) -> int:
+        """格式化后的记录写入文件的字节数"""
+        return len(msg.encode(self.encoding or "utf-8"))
+
+    def _exceeds_max(self, size: int) -> bool:
+        """追加 size 字节后是否需要轮转（emit 与 shouldRollover 共用）"""
+        return self.maxBytes > 0 and self._size > 0 and self._size + size >= self.maxBytes
+
+    def _write_pending(self) -> None:
+        if self._pending and self.stream:
+            self.stream.write("".join(self._pending))
+            self.stream.flush()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """队列监听器：队列暂时取空时才刷新处理器，使连续记录合并写入"""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+class QueueFileHandler(logging.handlers.QueueHandler):
+    """
+    队列处理器：调用线程只入队，文件写入与轮转由后台监听线程完成
+
+    flush() 会等待队列中已有的记录全部写出；监听线程已停止时不等待。
+    """
+
+    def __init__(self, queue: "queue.Queue[Any]"):
+        super().__init__(queue)
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 只合并消息参数，保留 exc_info 等字段交给真正的格式化器
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def flush(self) -> None:
+        # 没有监听线程消费队列时 join() 会永久阻塞
+        if self.listener is not None:
+            self.queue.join()
 
 
 class SkillpackLogger:
-    """Skillpack 日志管理器"""
+    """
+    Skillpack 日志管理器
+
+    日志方法支持 %-style 参数，格式化延迟到记录实际输出时:
+        logger.info("task=%s phase=%d", task_id, phase)
+    """
 
     _instance: Optional["SkillpackLogger"] = None
     _logger: Optional[logging.Logger] = None
@@ -121,6 +307,8 @@ class SkillpackLogger:
         if self._logger is None:
             self._logger = logging.getLogger("skillpack")
             self._config: Optional[LoggingConfig] = None
+            self._listener: Optional[logging.handlers.QueueListener] = None
+            atexit.register(self._stop_listener)
 
     def configure(self, config: Optional[LoggingConfig] = None) -> None:
         """
@@ -130,10 +318,12 @@ class SkillpackLogger:
             config: 日志配置，None 时使用默认配置
         """
         self._config = config or LoggingConfig()
+        self._level_no = self._config.level.to_logging_level()
 
-        # 清除现有处理器
+        # 清除现有处理器（先写完后台队列中的记录）
+        self._stop_listener()
         self._logger.handlers.clear()
-        self._logger.setLevel(self._config.level.to_logging_level())
+        self._logger.setLevel(self._level_no)
 
         # 添加控制台处理器
         if self._config.console_enabled:
@@ -146,7 +336,7 @@ class SkillpackLogger:
     def _add_console_handler(self) -> None:
         """添加控制台处理器"""
         handler = logging.StreamHandler(sys.stderr)
-        handler.setLevel(self._config.level.to_logging_level())
+        handler.setLevel(self._level_no)
 
         if self._config.json_format:
             handler.setFormatter(JSONFormatter())
@@ -160,30 +350,65 @@ class SkillpackLogger:
             fmt_parts.append("%(message)s")
 
             fmt = " ".join(fmt_parts)
-            handler.setFormatter(ColoredFormatter(fmt))
+            # 输出被重定向/管道时不加 ANSI 颜色，省去每条记录的着色处理
+            isatty = getattr(handler.stream, "isatty", None)
+            use_colors = bool(isatty and isatty())
+            handler.setFormatter(ColoredFormatter(fmt, use_colors=use_colors))
 
         self._logger.addHandler(handler)
 
     def _add_file_handler(self) -> None:
         """添加文件处理器（带轮转）"""
         log_path = Path(self._config.file_path)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if log_path.parent not in _CREATED_LOG_DIRS:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            _CREATED_LOG_DIRS.add(log_path.parent)
 
-        handler = logging.handlers.RotatingFileHandler(
+        create_handler = functools.partial(
+            BatchRotatingFileHandler,
             log_path,
             maxBytes=self._config.max_size_mb * 1024 * 1024,
             backupCount=self._config.backup_count,
             encoding="utf-8",
+            batch_size=self._config.batch_size,
         )
-        handler.setLevel(self._config.level.to_logging_level())
+        try:
+            handler = create_handler()
+        except FileNotFoundError:
+            # 之前创建的目录已被删除，重新创建后再打开
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            handler = create_handler()
+        handler.setLevel(self._level_no)
 
         if self._config.json_format:
             handler.setFormatter(JSONFormatter())
         else:
             fmt = "%(asctime)s %(levelname)s [%(module)s] %(message)s"
-            handler.setFormatter(logging.Formatter(fmt))
-
-        self._logger.addHandler(handler)
+            handler.setFormatter(CachedTimeFormatter(fmt))
+
+        # 写入与轮转放到后台线程，调用方只入队；队列空闲时批量刷新
+        log_queue: queue.Queue = queue.Queue()
+        queue_handler = QueueFileHandler(log_queue)
+        queue_handler.setLevel(self._level_no)
+        self._listener = _BatchingQueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        queue_handler.listener = self._listener
+        self._listener.start()
+        self._logger.addHandler(queue_handler)
+
+    def _stop_listener(self) -> None:
+        """停止后台写入线程并关闭文件"""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            # 先摘下队列处理器，之后的记录不再进入无人消费的队列
+            for handler in list(self._logger.handlers):
+                if isinstance(handler, QueueFileHandler) and handler.listener is listener:
+                    self._logger.removeHandler(handler)
+                    handler.listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
 
     @property
     def logger(self) -> logging.Logger:
@@ -192,25 +417,50 @@ class SkillpackLogger:
             self.configure()
         return self._logger
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Debug 日志"""
-        self.logger.debug(message, extra=kwargs)
-
-    def info(self, message: str, **kwargs) -> None:
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            if kwargs:
+                logger.debug(message, *args, extra=kwargs)
+            else:
+                logger.debug(message, *args)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Info 日志"""
-        self.logger.info(message, extra=kwargs)
-
-    def warning(self, message: str, **kwargs) -> None:
+        logger = self.logger
+        if logger.isEnabledFor(logging.INFO):
+            if kwargs:
+                logger.info(message, *args, extra=kwargs)
+            else:
+                logger.info(message, *args)
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Warning 日志"""
-        self.logger.warning(message, extra=kwargs)
-
-    def error(self, message: str, **kwargs) -> None:
+        logger = self.logger
+        if logger.isEnabledFor(logging.WARNING):
+            if kwargs:
+                logger.warning(message, *args, extra=kwargs)
+            else:
+                logger.warning(message, *args)
+
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Error 日志"""
-        self.logger.error(message, extra=kwargs)
-
-    def critical(self, message: str, **kwargs) -> None:
+        logger = self.logger
+        if logger.isEnabledFor(logging.ERROR):
+            if kwargs:
+                logger.error(message, *args, extra=kwargs)
+            else:
+                logger.error(message, *args)
+
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Critical 日志"""
-        self.logger.critical(message, extra=kwargs)
+        logger = self.logger
+        if logger.isEnabledFor(logging.CRITICAL):
+            if kwargs:
+                logger.critical(message, *args, extra=kwargs)
+            else:
+                logger.critical(message, *args)
 
     def task_log(
         self,
@@ -230,18 +480,27 @@ class SkillpackLogger:
             phase: 当前阶段
             level: 日志级别
         """
+        logger = self.logger
+        level_no = level.to_logging_level()
+        if not logger.isEnabledFor(level_no):
+            return
+
         extra = {"task_id": task_id}
         if route:
             extra["route"] = route
         if phase is not None:
             extra["phase"] = phase
 
-        self.logger.log(level.to_logging_level(), message, extra=extra)
+        logger.log(level_no, message, extra=extra)
+
+
+# 模块级单例，导入时创建一次；get_logger() 直接返回，不再经过 __new__/__init__
+_INSTANCE = SkillpackLogger()
 
 
 def get_logger() -> SkillpackLogger:
     """获取 Skillpack 日志管理器实例"""
-    return SkillpackLogger()
+    return _INSTANCE
 
 
 def configure_logging(
@@ -264,8 +523,13 @@ def configure_logging(
     Returns:
         配置好的 logger 实例
     """
+    try:
+        log_level = _LEVEL_BY_NAME[level.lower()]
+    except KeyError:
+        raise ValueError(f"{level!r} is not a valid LogLevel") from None
+
     config = LoggingConfig(
-        level=LogLevel(level.lower()),
+        level=log_level,
         console_enabled=console,
         file_enabled=file,
         file_path=file_path,
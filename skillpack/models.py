@@ -4,10 +4,16 @@ Skillpack 数据模型
 定义任务复杂度、执行路由和配置模型。
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
+
+
+# Python 3.10+ 的 dataclass 支持 slots，3.9 下退化为普通 dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class TaskComplexity(Enum):
@@ -28,32 +34,43 @@ class ExecutionRoute(Enum):
     UI_FLOW = "UI_FLOW"        # UI 流程
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class KnowledgeConfig:
     """知识库配置"""
     default_notebook: Optional[str] = None
     auto_query: bool = True
 
 
-@dataclass
+# 路由默认权重与阈值（只读，各实例按需复制）
+DEFAULT_ROUTING_WEIGHTS: Mapping[str, int] = MappingProxyType({
+    "scope": 25,
+    "dependency": 20,
+    "technical": 20,
+    "risk": 15,
+    "time": 10,
+    "ui": 10
+})
+DEFAULT_ROUTING_THRESHOLDS: Mapping[str, int] = MappingProxyType({
+    "direct": 20,
+    "planned": 45,
+    "ralph": 70
+})
+
+# 默认启用多模型规划共识的路由
+DEFAULT_COVERED_ROUTES: Tuple[str, ...] = ("PLANNED", "RALPH", "ARCHITECT")
+
+# LSP 默认支持的语言
+DEFAULT_LSP_LANGUAGES: Tuple[str, ...] = ("typescript", "python", "go", "rust")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RoutingConfig:
     """路由配置"""
-    weights: Dict[str, int] = field(default_factory=lambda: {
-        "scope": 25,
-        "dependency": 20,
-        "technical": 20,
-        "risk": 15,
-        "time": 10,
-        "ui": 10
-    })
-    thresholds: Dict[str, int] = field(default_factory=lambda: {
-        "direct": 20,
-        "planned": 45,
-        "ralph": 70
-    })
-
-
-@dataclass
+    weights: Dict[str, int] = field(default_factory=DEFAULT_ROUTING_WEIGHTS.copy)
+    thresholds: Dict[str, int] = field(default_factory=DEFAULT_ROUTING_THRESHOLDS.copy)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CheckpointConfig:
     """检查点配置"""
     auto_save: bool = True
@@ -63,7 +80,7 @@ class CheckpointConfig:
     max_history: int = 10
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParallelConfig:
     """并行执行配置"""
     enabled: bool = False
@@ -74,7 +91,7 @@ class ParallelConfig:
     fallback_to_serial_on_failure: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MCPConfig:
     """MCP 调用配置"""
     timeout_seconds: int = 180
@@ -82,7 +99,7 @@ class MCPConfig:
     auto_fallback_to_cli: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CLIConfig:
     """CLI 直接调用配置"""
     prefer_cli_over_mcp: bool = True  # v5.3+ 默认 CLI 优先
@@ -94,7 +111,7 @@ class CLIConfig:
     max_lines_per_file: int = 800
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CrossValidationConfig:
     """交叉验证配置 (v5.4)"""
     enabled: bool = True
@@ -102,7 +119,7 @@ class CrossValidationConfig:
     min_confidence_for_auto_pass: str = "high"  # low, medium, high
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ConsensusConfig:
     """
     多模型规划共识配置 (v5.5)
@@ -115,16 +132,16 @@ class ConsensusConfig:
     arbitration_threshold: float = 0.7    # 触发仲裁的共识度阈值
     planning_timeout_seconds: int = 120   # 单模型规划超时时间
     fallback_to_single_model: bool = True # 超时/失败时降级到单模型
-    covered_routes: list = None           # 覆盖的路由（默认: PLANNED, RALPH, ARCHITECT）
+    covered_routes: Tuple[str, ...] = DEFAULT_COVERED_ROUTES  # 覆盖的路由
 
     def __post_init__(self):
         if self.covered_routes is None:
-            self.covered_routes = ["PLANNED", "RALPH", "ARCHITECT"]
+            self.covered_routes = DEFAULT_COVERED_ROUTES
 
 
 # ==================== v6.0 新增配置类 ====================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AdapterConfig:
     """
     CLI 适配器配置 (v6.0)
@@ -140,7 +157,7 @@ class AdapterConfig:
     show_upgrade_hints: bool = True       # 显示升级提示
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SmartRoutingConfig:
     """
     智能模型路由配置 (v6.0)
@@ -155,7 +172,7 @@ class SmartRoutingConfig:
     auto_model_upgrade: bool = True           # 自动升级到更强模型
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ToolDiscoveryConfig:
     """
     工具发现配置 (v6.0)
@@ -168,7 +185,7 @@ class ToolDiscoveryConfig:
     preload_common_tools: bool = True     # 预加载常用工具
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BranchConfig:
     """
     分支管理配置 (v6.0)
@@ -181,7 +198,7 @@ class BranchConfig:
     preserve_history: bool = True         # 保留分支历史
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SkillSystemConfig:
     """
     Skill 系统配置 (v6.0)
@@ -195,7 +212,7 @@ class SkillSystemConfig:
     debounce_ms: int = 500                # 热重载防抖时间
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LSPConfig:
     """
     LSP 集成配置 (v6.0)
@@ -204,22 +221,22 @@ class LSPConfig:
     """
     enabled: bool = False                 # 是否启用 LSP（默认关闭）
     auto_start: bool = False              # 是否自动启动 LSP 服务
-    supported_languages: list = None      # 支持的语言列表
+    supported_languages: Tuple[str, ...] = DEFAULT_LSP_LANGUAGES  # 支持的语言列表
     timeout_seconds: int = 30             # LSP 请求超时
 
     def __post_init__(self):
         if self.supported_languages is None:
-            self.supported_languages = ["typescript", "python", "go", "rust"]
+            self.supported_languages = DEFAULT_LSP_LANGUAGES
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OutputConfig:
     """输出目录配置"""
     current_dir: str = ".skillpack/current"
     history_dir: str = ".skillpack/history"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SkillpackConfig:
     """Skillpack 配置"""
     version: str = "6.0"
@@ -241,7 +258,7 @@ class SkillpackConfig:
     lsp: LSPConfig = field(default_factory=LSPConfig)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScoreCard:
     """评分卡"""
     scope: int = 0          # 范围广度 (0-25)
@@ -257,7 +274,7 @@ class ScoreCard:
         return self.scope + self.dependency + self.technical + self.risk + self.time + self.ui
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TaskContext:
     """任务上下文"""
     description: str
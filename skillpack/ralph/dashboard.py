@@ -4,11 +4,15 @@ RALPH 进度追踪仪表板
 提供任务执行进度追踪和回调机制。
 """
 
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Deque, Optional
+
+from ..models import _DATACLASS_SLOTS
 
 
 class Phase(Enum):
@@ -24,13 +28,27 @@ class Phase(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# 各阶段固定的开始消息与输出前缀（导入时生成一次）
+_PHASE_START_MESSAGES = {phase: f"开始 {phase.value}" for phase in Phase}
+_PHASE_LABELS = {phase: f"[{phase.value}]" for phase in Phase}
+
+# 事件时间戳时钟（模块级绑定，省去每次的属性查找）
+_time_ns = time.time_ns
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProgressEvent:
     """进度事件"""
     phase: Phase
     progress: float
     message: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    # 整数纳秒时间戳（由创建方传入），需要时再转换为 datetime
+    timestamp_ns: int
+
+    @property
+    def timestamp(self) -> datetime:
+        """事件时间"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 
 class ProgressCallback(ABC):
@@ -78,7 +96,9 @@ class ProgressTracker(ABC):
 
 
 class SimpleProgressTracker(ProgressTracker):
-    """简单进度追踪器实现"""
+    """简单进度追踪器实现（只保留最近 max_events 条进度事件）"""
+
+    DEFAULT_MAX_EVENTS = 1000
     
     def __init__(
         self,
@@ -86,6 +106,7 @@ class SimpleProgressTracker(ProgressTracker):
         description: str,
         callback: Optional[ProgressCallback] = None,
         quiet: bool = False,
+        max_events: int = DEFAULT_MAX_EVENTS,
     ):
         self.task_id = task_id
         self.description = description
@@ -94,7 +115,9 @@ class SimpleProgressTracker(ProgressTracker):
         
         self.current_phase = Phase.PENDING
         self.current_progress = 0.0
-        self.events: List[ProgressEvent] = []
+        self.events: Deque[ProgressEvent] = deque(maxlen=max_events)
+        # max_events=0 时不记录事件（跳过 ProgressEvent 分配）
+        self._record_events = max_events > 0
         self.error: Optional[str] = None
     
     def start_phase(self, phase: Phase) -> None:
@@ -102,40 +125,41 @@ class SimpleProgressTracker(ProgressTracker):
         self.current_phase = phase
         self.current_progress = 0.0
         
-        event = ProgressEvent(phase, 0.0, f"开始 {phase.value}")
-        self.events.append(event)
+        message = _PHASE_START_MESSAGES[phase]
+        if self._record_events:
+            self.events.append(ProgressEvent(phase, 0.0, message, _time_ns()))
         
         if self.callback:
-            self.callback.on_phase_start(phase, f"开始 {phase.value}")
+            self.callback.on_phase_start(phase, message)
         
         if not self.quiet:
-            print(f"[{phase.value}] 开始...")
+            print(f"{_PHASE_LABELS[phase]} 开始...")
     
     def update(self, progress: float, message: str) -> None:
         """更新进度"""
         self.current_progress = progress
         
-        event = ProgressEvent(self.current_phase, progress, message)
-        self.events.append(event)
+        if self._record_events:
+            self.events.append(ProgressEvent(self.current_phase, progress, message, _time_ns()))
         
         if self.callback:
             self.callback.on_progress(self.current_phase, progress, message)
         
         if not self.quiet:
-            print(f"[{self.current_phase.value}] {progress*100:.0f}% - {message}")
+            print(f"{_PHASE_LABELS[self.current_phase]} {progress*100:.0f}% - {message}")
     
     def complete_phase(self) -> None:
         """完成当前阶段"""
         self.current_progress = 1.0
         
-        event = ProgressEvent(self.current_phase, 1.0, "完成")
-        self.events.append(event)
+        if self._record_events:
+            self.events.append(ProgressEvent(self.current_phase, 1.0, "完成", _time_ns()))
         
         if self.callback:
             self.callback.on_phase_complete(self.current_phase)
         
         if not self.quiet:
-            print(f"[{self.current_phase.value}] ✓ 完成")
+            print(f"{_PHASE_LABELS[self.current_phase]} ✓ 完成")
     
     def complete(self) -> None:
         """完成整个任务"""
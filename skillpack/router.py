@@ -36,17 +36,34 @@ class TaskRouter:
     }
     
     # UI 信号
-    UI_SIGNALS = [
+    UI_SIGNALS = (
         "ui", "ux", "界面", "组件", "component", "页面", "page",
         "布局", "layout", "样式", "css", "前端", "frontend",
         "jsx", "tsx", "hook", "useState", "vue", "next", "nuxt",
         "shadcn", "radix", "chakra", "material-ui", "antd",
         "framer", "framer-motion", "gsap", "animation",
         "button", "form", "modal", "card", "table", "tabs", "dialog",
-    ]
+    )
     
     # 文本任务信号
-    TEXT_SIGNALS = [".md", ".txt", ".json", ".yaml", ".toml", "config", "配置"]
+    TEXT_SIGNALS = (".md", ".txt", ".json", ".yaml", ".toml", "config", "配置")
+
+    # 复杂度与路由的显示名称
+    COMPLEXITY_NAMES = {
+        TaskComplexity.SIMPLE: "简单",
+        TaskComplexity.MEDIUM: "中等",
+        TaskComplexity.COMPLEX: "复杂",
+        TaskComplexity.ARCHITECT: "超复杂",
+        TaskComplexity.UI: "UI",
+    }
+
+    ROUTE_NAMES = {
+        ExecutionRoute.DIRECT: "直接执行",
+        ExecutionRoute.PLANNED: "计划执行",
+        ExecutionRoute.RALPH: "RALPH 自动化",
+        ExecutionRoute.ARCHITECT: "架构优先",
+        ExecutionRoute.UI_FLOW: "UI 流程",
+    }
     
     def __init__(self, config: Optional[SkillpackConfig] = None):
         self.config = config or SkillpackConfig()
@@ -219,22 +236,6 @@ class TaskRouter:
         if context.notebook_id:
             lines.append(f"知识库: {context.notebook_id}")
         
-        complexity_names = {
-            TaskComplexity.SIMPLE: "简单",
-            TaskComplexity.MEDIUM: "中等",
-            TaskComplexity.COMPLEX: "复杂",
-            TaskComplexity.ARCHITECT: "超复杂",
-            TaskComplexity.UI: "UI",
-        }
-        
-        route_names = {
-            ExecutionRoute.DIRECT: "直接执行",
-            ExecutionRoute.PLANNED: "计划执行",
-            ExecutionRoute.RALPH: "RALPH 自动化",
-            ExecutionRoute.ARCHITECT: "架构优先",
-            ExecutionRoute.UI_FLOW: "UI 流程",
-        }
-        
-        lines.insert(3, f"  → {complexity_names.get(context.complexity, '')} 任务，{route_names.get(context.route, '')}")
+        lines.insert(3, f"  → {self.COMPLEXITY_NAMES.get(context.complexity, '')} 任务，{self.ROUTE_NAMES.get(context.route, '')}")
         
         return "\n".join(lines)
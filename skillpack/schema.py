@@ -139,7 +139,8 @@ SKILLPACKRC_SCHEMA: Dict[str, Any] = {
                 "file_path": {"type": "string"},
                 "max_size_mb": {"type": "integer", "minimum": 1, "maximum": 100},
                 "backup_count": {"type": "integer", "minimum": 0, "maximum": 10},
-                "json_format": {"type": "boolean", "default": False}
+                "json_format": {"type": "boolean", "default": False},
+                "batch_size": {"type": "integer", "minimum": 1, "maximum": 10000}
             },
             "additionalProperties": False
         }
@@ -5,6 +5,7 @@ Skill 加载器 (v6.0)
 """
 
 import os
+import re
 import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Set
@@ -15,6 +16,10 @@ from .registry import SkillRegistry, SkillInfo
 from .metadata import SkillMetadata, parse_skill_toml, parse_skill_md
 
 
+# SKILL.md 中 YAML frontmatter 之后的正文
+_MD_BODY_RE = re.compile(r'^---\s*\n.*?\n---\s*\n(.*)$', re.DOTALL)
+
+
 @dataclass
 class LoadResult:
     """加载结果"""
@@ -61,6 +66,8 @@ class SkillLoader:
         # 热重载状态
         self._watch_thread: Optional[threading.Thread] = None
         self._watching = False
+        # 停止时唤醒监视线程，无需等完一个防抖周期
+        self._stop_event = threading.Event()
         self._last_reload: Dict[str, float] = {}
 
         # 加载状态
@@ -182,12 +189,14 @@ class SkillLoader:
             return
 
         self._watching = True
+        self._stop_event.clear()
         self._watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
         self._watch_thread.start()
 
     def stop_watching(self):
         """停止热重载监视"""
         self._watching = False
+        self._stop_event.set()
         if self._watch_thread:
             self._watch_thread.join(timeout=1)
             self._watch_thread = None
@@ -250,8 +259,7 @@ class SkillLoader:
 
         # 如果是 SKILL.md，使用 YAML 之后的内容作为模板
         if md_content:
-            import re
-            match = re.match(r'^---\s*\n.*?\n---\s*\n(.*)$', md_content, re.DOTALL)
+            match = _MD_BODY_RE.match(md_content)
             if match:
                 return match.group(1).strip()
 
@@ -264,19 +272,15 @@ class SkillLoader:
 
     def _watch_loop(self):
         """热重载监视循环"""
-        import time
-
         while self._watching:
             try:
                 self._check_changes()
             except Exception:
                 pass
-            time.sleep(self._debounce_ms / 1000)
+            self._stop_event.wait(self._debounce_ms / 1000)
 
     def _check_changes(self):
         """检查文件变更"""
-        import os
-
         for skill_path in self._loaded_paths.copy():
             if not skill_path.exists():
                 # 目录被删除，注销 Skill
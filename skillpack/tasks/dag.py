@@ -4,7 +4,9 @@
 管理任务依赖关系，支持波次计算和并行执行。
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, List, Optional, Set, Any
 from enum import Enum
 from datetime import datetime
@@ -21,6 +23,10 @@ class TaskState(Enum):
     BLOCKED = "blocked"         # 被阻塞
 
 
+# 可执行任务的排序键：先波次后优先级
+_READY_ORDER = attrgetter("wave", "priority")
+
+
 class DependencyError(Exception):
     """依赖错误"""
     pass
@@ -50,6 +56,17 @@ class TaskNode:
     # 元数据
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # 状态变化（包括直接调用 mark_* 或赋值）通知所属 DAG 更新计数
+        if name == "state":
+            old = self.__dict__.get("state")
+            object.__setattr__(self, name, value)
+            dag = self.__dict__.get("_dag")
+            if dag is not None and old is not value:
+                dag._on_state_change(self, old, value)
+        else:
+            object.__setattr__(self, name, value)
+
     def is_ready(self) -> bool:
         """检查是否可以执行"""
         return self.state == TaskState.READY
@@ -88,6 +105,10 @@ class TaskDAG:
         self._nodes: Dict[str, TaskNode] = {}
         self._waves: List[List[str]] = []
         self._computed = False
+        # 每个任务尚未完成的依赖数，节点状态变化时增量维护
+        self._unmet: Dict[str, int] = {}
+        # 各状态的任务数（同样由节点状态变化回调维护），get_progress 无需遍历全部任务
+        self._state_counts: Counter = Counter()
 
     def add_task(
         self,
@@ -139,12 +160,18 @@ class TaskDAG:
             if dep_id not in self._nodes:
                 raise DependencyError(f"依赖任务 {dep_id} 不存在")
 
-        # 添加节点
+        # 添加节点（节点状态变化时回调 _on_state_change）
+        node._dag = self
         self._nodes[task_id] = node
+        self._unmet[task_id] = 0
+        self._state_counts[node.state] += 1
 
         # 更新依赖关系
         for dep_id in node.dependencies:
-            self._nodes[dep_id].dependents.add(task_id)
+            dep = self._nodes[dep_id]
+            dep.dependents.add(task_id)
+            if dep.state != TaskState.COMPLETED:
+                self._unmet[task_id] += 1
 
         # 标记需要重新计算
         self._computed = False
@@ -171,7 +198,11 @@ class TaskDAG:
         if self._would_create_cycle(task_id, depends_on):
             raise DependencyError(f"添加依赖 {task_id} -> {depends_on} 会形成环")
 
-        self._nodes[task_id].dependencies.add(depends_on)
+        node = self._nodes[task_id]
+        if depends_on not in node.dependencies:
+            node.dependencies.add(depends_on)
+            if self._nodes[depends_on].state != TaskState.COMPLETED:
+                self._unmet[task_id] += 1
         self._nodes[depends_on].dependents.add(task_id)
         self._computed = False
 
@@ -191,8 +222,13 @@ class TaskDAG:
         for dependent_id in node.dependents:
             if dependent_id in self._nodes:
                 self._nodes[dependent_id].dependencies.discard(task_id)
+                if node.state != TaskState.COMPLETED:
+                    self._unmet[dependent_id] -= 1
 
+        node._dag = None
         del self._nodes[task_id]
+        del self._unmet[task_id]
+        self._state_counts[node.state] -= 1
         self._computed = False
 
     def get_task(self, task_id: str) -> Optional[TaskNode]:
@@ -248,18 +284,14 @@ class TaskDAG:
             self.compute_waves()
 
         ready = []
-        for node in self._nodes.values():
-            if node.state == TaskState.PENDING:
-                # 检查所有依赖是否完成
-                deps_completed = all(
-                    self._nodes[dep_id].state == TaskState.COMPLETED
-                    for dep_id in node.dependencies
-                )
-                if deps_completed:
-                    node.state = TaskState.READY
-                    ready.append(node)
-
-        ready.sort(key=lambda n: (n.wave, n.priority))
+        unmet = self._unmet
+        for task_id, node in self._nodes.items():
+            # 依赖全部完成的待执行任务
+            if node.state == TaskState.PENDING and unmet[task_id] == 0:
+                node.state = TaskState.READY
+                ready.append(node)
+
+        ready.sort(key=_READY_ORDER)
         return ready
 
     def update_task_state(self, task_id: str, state: TaskState, result: Optional[str] = None, error: Optional[str] = None):
@@ -268,7 +300,6 @@ class TaskDAG:
             return
 
         node = self._nodes[task_id]
-
         if state == TaskState.RUNNING:
             node.mark_running()
         elif state == TaskState.COMPLETED:
@@ -278,12 +309,23 @@ class TaskDAG:
         else:
             node.state = state
 
+    def _on_state_change(self, node: TaskNode, old: TaskState, new: TaskState) -> None:
+        """节点状态变化回调：更新各状态计数和下游任务的未完成依赖数"""
+        self._state_counts[old] -= 1
+        self._state_counts[new] += 1
+
+        was_completed = old == TaskState.COMPLETED
+        if was_completed != (new == TaskState.COMPLETED):
+            delta = 1 if was_completed else -1
+            for dependent_id in node.dependents:
+                self._unmet[dependent_id] += delta
+
     def get_progress(self) -> Dict[str, Any]:
         """获取进度统计"""
         total = len(self._nodes)
-        completed = sum(1 for n in self._nodes.values() if n.state == TaskState.COMPLETED)
-        running = sum(1 for n in self._nodes.values() if n.state == TaskState.RUNNING)
-        failed = sum(1 for n in self._nodes.values() if n.state == TaskState.FAILED)
+        completed = self._state_counts[TaskState.COMPLETED]
+        running = self._state_counts[TaskState.RUNNING]
+        failed = self._state_counts[TaskState.FAILED]
         pending = total - completed - running - failed
 
         return {
@@ -8,6 +8,9 @@ from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 from pathlib import Path
 import json
+import shutil
+import threading
+import uuid
 
 from .registry import ToolRegistry, ToolInfo, ToolSource, ToolParameter
 
@@ -249,14 +252,53 @@ class LazyToolLoader:
             pass
 
     def clear_cache(self):
-        """清空缓存"""
+        """清空缓存（只删除 *.json 缓存文件）"""
         self._loaded_schemas.clear()
+        # 上次后台删除未完成（如进程被强制终止）留下的目录一并清理
+        trash_dirs = list(self._cache_dir.parent.glob(f".{self._cache_dir.name}.trash.*"))
         if self._cache_dir.exists():
-            for f in self._cache_dir.glob("*.json"):
-                try:
-                    f.unlink()
-                except Exception:
-                    pass
+            trash = self._move_cache_to_trash()
+            if trash is not None:
+                trash_dirs.append(trash)
+            else:
+                self._unlink_cache_files()
+        if not trash_dirs:
+            return
+
+        # 改名后在后台删除，避免逐个 unlink 阻塞调用方；
+        # 非守护线程，解释器退出前会等待删除完成
+        threading.Thread(
+            target=self._remove_trash,
+            args=(trash_dirs,),
+            name="skillpack-cache-cleanup",
+        ).start()
+
+    def _move_cache_to_trash(self) -> Optional[Path]:
+        """缓存目录只含 *.json 文件时整体改名并返回新路径，否则返回 None"""
+        try:
+            if any(
+                not (entry.name.endswith(".json") and entry.is_file())
+                for entry in self._cache_dir.iterdir()
+            ):
+                return None
+            trash = self._cache_dir.with_name(f".{self._cache_dir.name}.trash.{uuid.uuid4().hex}")
+            self._cache_dir.rename(trash)
+        except OSError:
+            return None
+        return trash
+
+    def _unlink_cache_files(self):
+        """逐个删除缓存文件"""
+        for f in self._cache_dir.glob("*.json"):
+            try:
+                f.unlink()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _remove_trash(trash_dirs: List[Path]):
+        for trash in trash_dirs:
+            shutil.rmtree(trash, ignore_errors=True)
 
     def get_load_stats(self) -> Dict[str, Any]:
         """获取加载统计"""
@@ -4,8 +4,10 @@
 提供智能工具搜索和推荐功能。
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Set, Tuple
 from dataclasses import dataclass
+from operator import itemgetter
+import heapq
 import re
 
 from .registry import ToolRegistry, ToolInfo, ToolSource
@@ -72,12 +74,14 @@ class ToolSearcher:
             搜索结果列表
         """
         results: List[SearchResult] = []
+        seen: Set[str] = set()
 
         # 1. 语义推断
         semantic_tools = self._semantic_search(query)
         for name in semantic_tools:
             tool = self._registry.get(name)
             if tool:
+                seen.add(tool.name)
                 results.append(SearchResult(
                     tool=tool,
                     score=0.9,
@@ -87,7 +91,8 @@ class ToolSearcher:
         # 2. 关键词搜索
         keyword_results = self._registry.search(query, limit=limit * 2)
         for tool in keyword_results:
-            if not any(r.tool.name == tool.name for r in results):
+            if tool.name not in seen:
+                seen.add(tool.name)
                 score = self._calculate_score(query, tool)
                 results.append(SearchResult(
                     tool=tool,
@@ -99,17 +104,19 @@ class ToolSearcher:
         if context:
             context_tools = self._context_search(context)
             for tool in context_tools:
-                if not any(r.tool.name == tool.name for r in results):
+                if tool.name not in seen:
+                    seen.add(tool.name)
                     results.append(SearchResult(
                         tool=tool,
                         score=0.5,
                         match_reason="上下文推荐",
                     ))
 
-        # 排序
-        results.sort(key=lambda r: (-r.score, -self._usage_counts.get(r.tool.name, 0)))
-
-        return results[:limit]
+        # 只取前 limit 个（与完整排序后截取结果一致）
+        usage_counts = self._usage_counts
+        return heapq.nsmallest(
+            limit, results, key=lambda r: (-r.score, -usage_counts.get(r.tool.name, 0))
+        )
 
     def recommend_for_task(
         self,
@@ -221,9 +228,4 @@ class ToolSearcher:
 
     def get_popular_tools(self, limit: int = 10) -> List[Tuple[str, int]]:
         """获取热门工具"""
-        sorted_tools = sorted(
-            self._usage_counts.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        return sorted_tools[:limit]
+        return heapq.nlargest(limit, self._usage_counts.items(), key=itemgetter(1))
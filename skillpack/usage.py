@@ -4,15 +4,29 @@
 提供用量数据收集、持久化存储和统计分析功能。
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 import json
 
+from .models import _DATACLASS_SLOTS
 
-@dataclass
+try:
+    # 可选依赖：orjson 序列化/解析更快；其 JSONDecodeError 是 json.JSONDecodeError 的子类
+    import orjson
+
+    def _dump_line(data: Dict) -> str:
+        return orjson.dumps(data).decode("utf-8")
+
+    _load_line = orjson.loads
+except ImportError:
+    _dump_line = json.JSONEncoder(ensure_ascii=False).encode
+    _load_line = json.loads
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class UsageRecord:
     """单次模型调用记录"""
     timestamp: str                    # ISO 8601 格式
@@ -52,6 +66,10 @@ class UsageSummary:
     route_distribution: Dict[str, int] = field(default_factory=dict)
 
 
+# UsageRecord 字段名（字段均为基本类型，浅拷贝即可序列化，无需 asdict 递归复制）
+_RECORD_FIELDS = tuple(f.name for f in fields(UsageRecord))
+
+
 class UsageStore:
     """用量数据持久化存储"""
 
@@ -63,8 +81,17 @@ class UsageStore:
 
     def append_record(self, record: UsageRecord) -> None:
         """追加单条记录（JSONL 格式）"""
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+        self.append_records((record,))
+
+    def append_records(self, records: Iterable[UsageRecord]) -> None:
+        """批量追加记录（一次打开、一次写入）"""
+        lines = [
+            _dump_line({name: getattr(record, name) for name in _RECORD_FIELDS}) + "\n"
+            for record in records
+        ]
+        if lines:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
 
     def load_all_records(self) -> List[UsageRecord]:
         """加载所有记录"""
@@ -76,7 +103,7 @@ class UsageStore:
             for line in f:
                 if line.strip():
                     try:
-                        data = json.loads(line)
+                        data = _load_line(line)
                         records.append(UsageRecord(**data))
                     except (json.JSONDecodeError, TypeError):
                         # 跳过损坏的记录
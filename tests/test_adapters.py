@@ -25,6 +25,15 @@ class TestCLIVersion:
         assert version.minor == 89
         assert version.patch == 0
 
+    def test_version_parsing_prerelease_and_reassign(self):
+        """预发布后缀与修改版本号后重新解析"""
+        version = CLIVersion("codex", "1.2.3-beta")
+        assert (version.major, version.minor, version.patch) == (1, 2, 3)
+
+        version.version = "2.0"
+        assert (version.major, version.minor, version.patch) == (2, 0, 0)
+        assert version >= "1.99.99"
+
     def test_version_comparison_ge(self):
         """版本号比较 >= 测试"""
         version = CLIVersion("codex", "0.89.0")
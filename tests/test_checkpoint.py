@@ -351,6 +351,19 @@ class TestCheckpointManagerBasic:
         assert loaded is not None
         assert loaded.task_id == "save-load-test"
 
+    def test_save_non_str_keys_and_big_ints(self, manager):
+        """测试自由格式字段中的整数键和超过 64 位的整数可以保存"""
+        cp = Checkpoint(
+            task_id="non-str-keys",
+            config_snapshot={1: "a", "big": 2 ** 70 + 1},
+        )
+
+        assert manager.save(cp) is True
+
+        content = (Path(manager.current_dir) / "checkpoint.json").read_text(encoding="utf-8")
+        assert str(2 ** 70 + 1) in content
+        assert manager.load_current().config_snapshot["1"] == "a"
+
     def test_load_nonexistent(self, manager):
         """测试加载不存在的检查点"""
         loaded = manager.load_current()
@@ -364,6 +377,10 @@ class TestCheckpointManagerBasic:
         checksum_path = Path(manager.current_dir) / "checkpoint.json.sha256"
         assert checksum_path.exists()
 
+        import hashlib
+        content = (Path(manager.current_dir) / "checkpoint.json").read_bytes()
+        assert checksum_path.read_text(encoding="utf-8") == hashlib.sha256(content).hexdigest()
+
     def test_backup_rotation(self, manager):
         """测试备份轮转"""
         # 多次保存
@@ -468,6 +485,38 @@ class TestCheckpointManagerOperations:
         assert archive_path.exists()
         assert (archive_path / "checkpoint.json").exists()
 
+    def test_archive_skipped_when_unchanged(self, manager):
+        """测试内容未变化时不重复归档"""
+        manager.save(Checkpoint(task_id="archive-same"))
+        (Path(manager.current_dir) / "output.md").write_text("v1")
+
+        first = manager.archive_current()
+        second = manager.archive_current()
+        assert second == first
+        assert len([p for p in Path(manager.history_dir).iterdir() if p.is_dir()]) == 1
+
+        (Path(manager.current_dir) / "output.md").write_text("v2")
+        third = manager.archive_current()
+        assert (third / "output.md").read_text() == "v2"
+
+    def test_archive_and_restore_copies_all_files(self, manager):
+        """测试归档与恢复复制全部文件内容"""
+        manager.save(Checkpoint(task_id="archive-copy"))
+        current = Path(manager.current_dir)
+        large = bytes(range(256)) * 8192  # 2 MiB，跨越多个复制块
+        (current / "large.bin").write_bytes(large)
+        for i in range(5):
+            (current / f"{i}_output.md").write_text(f"输出 {i}", encoding="utf-8")
+
+        archive_path = manager.archive_current()
+        assert (archive_path / "large.bin").read_bytes() == large
+        assert (archive_path / "3_output.md").read_text(encoding="utf-8") == "输出 3"
+
+        (current / "large.bin").write_bytes(b"stale")
+        restored = manager.restore_from_history(archive_path.name)
+        assert restored.task_id == "archive-copy"
+        assert (current / "large.bin").read_bytes() == large
+
 
 class TestCheckpointManagerRecovery:
     """CheckpointManager 恢复功能测试"""
@@ -245,3 +245,50 @@ class TestKnowledgeConfigParsing:
         data = json.loads(config_path.read_text())
 
         assert data["knowledge"]["auto_query"] is False
+
+
+class TestConfigFileCache:
+    """配置文件缓存测试"""
+
+    def test_unchanged_file_not_reparsed(self, temp_dir):
+        """文件未变化时复用解析结果"""
+        from skillpack.cli import _read_config_file
+
+        config_path = temp_dir / ".skillpackrc"
+        config_path.write_text(json.dumps({"version": "5.4"}))
+
+        first = _read_config_file(config_path)
+        second = _read_config_file(config_path)
+
+        assert first == {"version": "5.4"}
+        assert second is first
+
+    def test_changed_file_reparsed(self, temp_dir):
+        """文件变化后重新解析"""
+        import os
+        from skillpack.cli import _read_config_file
+
+        config_path = temp_dir / ".skillpackrc"
+        config_path.write_text(json.dumps({"version": "5.4"}))
+        _read_config_file(config_path)
+
+        config_path.write_text(json.dumps({"version": "6.0", "extra": True}))
+        os.utime(config_path, ns=(0, 1))
+
+        assert _read_config_file(config_path) == {"version": "6.0", "extra": True}
+
+    def test_missing_file(self, temp_dir):
+        """文件不存在返回 None"""
+        from skillpack.cli import _read_config_file
+
+        assert _read_config_file(temp_dir / ".skillpackrc") is None
+
+    def test_invalid_file_raises_json_error(self, temp_dir):
+        """无效 JSON 抛出 json.JSONDecodeError（与解析后端无关）"""
+        from skillpack.cli import _read_config_file
+
+        config_path = temp_dir / ".skillpackrc"
+        config_path.write_text("{ invalid json }")
+
+        with pytest.raises(json.JSONDecodeError):
+            _read_config_file(config_path)
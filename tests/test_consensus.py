@@ -127,6 +127,29 @@ class TestProposalParser:
         assert proposal.approach == ApproachType.AGGRESSIVE
         assert proposal.parse_success is True
 
+    def test_parse_json_with_surrounding_text(self):
+        """测试 JSON 前后有说明文字，且字符串中包含花括号"""
+        output = '''方案如下：
+{"summary": "处理 {占位符}", "approach": "conservative", "subtasks": []}
+以上方案供参考 }'''
+        proposal = ProposalParser.parse(output, "codex")
+        assert proposal.summary == "处理 {占位符}"
+        assert proposal.approach == ApproachType.CONSERVATIVE
+        assert proposal.parse_success is True
+
+    def test_parse_json_after_brace_in_prose(self):
+        """测试正文中的 {变量} 不会被当作 JSON 起始"""
+        output = '''模板使用 {name} 语法，方案如下：
+{
+    "summary": "渲染模板",
+    "approach": "balanced",
+    "subtasks": [{"id": "task-1", "description": "解析 {name}"}]
+}'''
+        proposal = ProposalParser.parse(output, "claude")
+        assert proposal.summary == "渲染模板"
+        assert proposal.subtasks[0].description == "解析 {name}"
+        assert proposal.parse_success is True
+
     def test_parse_fallback_numbered_list(self):
         """测试 fallback 解析（编号列表）"""
         output = '''我的实施方案如下：
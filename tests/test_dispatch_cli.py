@@ -480,6 +480,70 @@ class TestExecutionLogging:
         assert len(log) == 1
         assert log[0]["success"] is False
 
+    def test_execution_log_bounded(self, real_cli_dispatcher, mock_subprocess_success, temp_dir):
+        """测试内存执行日志只保留最近的记录"""
+        real_cli_dispatcher._usage_store.path = temp_dir / "usage.jsonl"
+        limit = real_cli_dispatcher.MAX_EXECUTION_LOG
+
+        with patch('subprocess.run', return_value=mock_subprocess_success):
+            for i in range(limit + 5):
+                real_cli_dispatcher._call_codex_cli(f"Test {i}")
+
+        log = real_cli_dispatcher.get_execution_log()
+        assert isinstance(log, list)
+        assert len(log) == limit
+
+    def test_batched_usage_written_on_exit(self, real_cli_dispatcher, mock_subprocess_success, temp_dir):
+        """测试 batched_usage 期间的用量记录在退出时一次写入"""
+        store = real_cli_dispatcher._usage_store
+        store.path = temp_dir / "usage.jsonl"
+
+        with pytest.raises(RuntimeError):
+            with real_cli_dispatcher.batched_usage():
+                with patch('subprocess.run', return_value=mock_subprocess_success):
+                    real_cli_dispatcher._call_codex_cli("Test 1")
+                    real_cli_dispatcher._call_codex_cli("Test 2")
+                assert not store.path.exists()
+                raise RuntimeError("中断")
+
+        assert len(store.load_all_records()) == 2
+
+        with patch('subprocess.run', return_value=mock_subprocess_success):
+            real_cli_dispatcher._call_codex_cli("Test 3")
+        assert len(store.load_all_records()) == 3
+
+    def test_batched_usage_nested_and_overlapping(self, real_cli_dispatcher, mock_subprocess_success, temp_dir):
+        """测试嵌套/交叠的 batched_usage 各自写出本层记录，退出后恢复外层"""
+        store = real_cli_dispatcher._usage_store
+        store.path = temp_dir / "usage.jsonl"
+
+        def call(name):
+            with patch('subprocess.run', return_value=mock_subprocess_success):
+                real_cli_dispatcher.set_context(name, "DIRECT", 1, "Phase 1")
+                real_cli_dispatcher._call_codex_cli("Test")
+
+        def task_ids():
+            return [r.task_id for r in store.load_all_records()] if store.path.exists() else []
+
+        with real_cli_dispatcher.batched_usage():
+            call("outer-1")
+            with real_cli_dispatcher.batched_usage():
+                call("inner")
+            assert task_ids() == ["inner"]
+            call("outer-2")
+            assert task_ids() == ["inner"]
+        assert task_ids() == ["inner", "outer-1", "outer-2"]
+
+        first = real_cli_dispatcher.batched_usage()
+        second = real_cli_dispatcher.batched_usage()
+        first.__enter__()
+        second.__enter__()
+        call("overlap")
+        first.__exit__(None, None, None)
+        second.__exit__(None, None, None)
+        call("after")
+        assert task_ids()[3:] == ["overlap", "after"]
+
 
 # =============================================================================
 # Formatting Tests
@@ -2,10 +2,12 @@
 测试任务执行器
 """
 
+import asyncio
 import pytest
 from pathlib import Path
 import tempfile
 import shutil
+from datetime import datetime
 
 from skillpack.models import (
     TaskContext,
@@ -15,11 +17,20 @@ from skillpack.models import (
 )
 from skillpack.executor import (
     TaskExecutor,
+    ExecutionStatus,
+    ModelCall,
     DirectExecutor,
     PlannedExecutor,
     RalphExecutor,
     UIFlowExecutor,
 )
+from skillpack.dispatch import DispatchResult, ExecutionMode, ModelType
+from skillpack.consensus import (
+    ArbitrationDecision,
+    ConsensusStatus,
+    PlanningConsensus,
+    Subtask,
+)
 from skillpack.ralph.dashboard import (
     ProgressTracker,
     SimpleProgressTracker,
@@ -78,6 +89,53 @@ class TestProgressTracker:
 
         assert len(tracker.events) == 4  # start + 2 updates + complete
 
+    def test_tracker_events_bounded(self):
+        tracker = SimpleProgressTracker("test-id", "Test task", quiet=True, max_events=3)
+
+        tracker.start_phase(Phase.IMPLEMENTING)
+        for i in range(10):
+            tracker.update(i / 10, f"step {i}")
+
+        assert [e.message for e in tracker.events] == ["step 7", "step 8", "step 9"]
+
+    def test_tracker_events_disabled(self):
+        callback = MockProgressCallback()
+        tracker = SimpleProgressTracker("test-id", "Test task", callback=callback,
+                                        quiet=True, max_events=0)
+
+        tracker.start_phase(Phase.IMPLEMENTING)
+        tracker.update(0.5, "halfway")
+        tracker.complete_phase()
+
+        assert len(tracker.events) == 0
+        assert tracker.current_progress == 1.0
+        assert callback.progress_updates == [(Phase.IMPLEMENTING, 0.5, "halfway")]
+
+    def test_tracker_event_timestamp(self):
+        tracker = SimpleProgressTracker("test-id", "Test task", quiet=True)
+
+        tracker.start_phase(Phase.IMPLEMENTING)
+
+        event = tracker.events[-1]
+        assert isinstance(event.timestamp_ns, int)
+        assert abs((datetime.now() - event.timestamp).total_seconds()) < 1
+
+    def test_tracker_phase_output(self, capsys):
+        callback = MockProgressCallback()
+        tracker = SimpleProgressTracker("test-id", "Test task", callback=callback)
+
+        tracker.start_phase(Phase.PLANNING)
+        tracker.update(0.5, "halfway")
+        tracker.complete_phase()
+
+        assert tracker.events[0].message == "开始 planning"
+        assert callback.phases_started == [(Phase.PLANNING, "开始 planning")]
+        assert capsys.readouterr().out.splitlines() == [
+            "[planning] 开始...",
+            "[planning] 50% - halfway",
+            "[planning] ✓ 完成",
+        ]
+
     def test_tracker_failure(self):
         tracker = SimpleProgressTracker("test-id", "Test task")
 
@@ -200,6 +258,77 @@ class TestTaskExecutor:
         history_dir = self.temp_dir / ".skillpack" / "history"
         assert history_dir.exists()
 
+    def test_execute_async(self):
+        context = TaskContext(
+            description="Test task",
+            complexity=TaskComplexity.SIMPLE,
+            route=ExecutionRoute.UI_FLOW,
+            working_dir=self.temp_dir
+        )
+
+        async def run_concurrently():
+            return await asyncio.gather(
+                TaskExecutor(quiet=True).execute_async(context),
+                TaskExecutor(quiet=True).execute_async(context),
+            )
+
+        statuses = asyncio.run(run_concurrently())
+
+        assert all(isinstance(status, ExecutionStatus) for status in statuses)
+        assert all(not status.is_running for status in statuses)
+
+    def test_import_does_not_load_asyncio(self):
+        """导入 skillpack 时不加载 asyncio（只在异步执行时导入）"""
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, skillpack; print('asyncio' in sys.modules)"],
+            capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_output_dirs_prepared_once(self, monkeypatch):
+        executor = TaskExecutor(quiet=True)
+        calls = []
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **kw: calls.append(self))
+
+        executor._prepare_output_dirs(self.temp_dir)
+        executor._prepare_output_dirs(self.temp_dir)
+
+        assert len(calls) == 2  # current + history，仅首次创建
+
+    def test_pending_writes_waited_when_strategy_raises(self):
+        """策略异常退出时等待已提交的写入，且不覆盖原异常"""
+        executor = TaskExecutor(quiet=True)
+        strategy = executor._get_strategy(ExecutionRoute.DIRECT)
+        output_dir = self.temp_dir / "out"
+
+        def failing_execute(context, tracker):
+            strategy.output_dir = output_dir
+            strategy._save_output_async("done.md", "written")
+            strategy._pending_writes.append(strategy._writer.submit(self._raise_io_error))
+            raise ValueError("策略失败")
+
+        strategy.execute = failing_execute
+        context = TaskContext(
+            description="Test task",
+            complexity=TaskComplexity.SIMPLE,
+            route=ExecutionRoute.DIRECT,
+            working_dir=self.temp_dir
+        )
+
+        with pytest.raises(ValueError, match="策略失败"):
+            executor.execute(context)
+
+        assert strategy._pending_writes == []
+        assert (output_dir / "done.md").read_text(encoding="utf-8") == "written"
+        executor.close()
+
+    @staticmethod
+    def _raise_io_error():
+        raise OSError("磁盘已满")
+
     def test_executor_routes_correctly(self):
         """验证执行器根据路由选择正确策略"""
         executor = TaskExecutor(quiet=True)
@@ -223,3 +352,256 @@ class TestTaskExecutor:
         )
         status = executor.execute(context)
         assert status.error is None
+
+
+class TestOutputWriting:
+    """输出文件写入测试"""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_outputs_batch(self):
+        executor = DirectExecutor()
+        executor.output_dir = self.temp_dir / "current"
+
+        paths = executor._save_outputs([
+            ("a.md", "# A\n中文内容"),
+            ("b.md", "# B"),
+        ])
+
+        assert [p.name for p in paths] == ["a.md", "b.md"]
+        assert (executor.output_dir / "a.md").read_text(encoding="utf-8") == "# A\n中文内容"
+        assert (executor.output_dir / "b.md").read_text(encoding="utf-8") == "# B"
+
+    def test_save_output_truncates_existing(self):
+        executor = DirectExecutor()
+        executor.output_dir = self.temp_dir / "current"
+
+        executor._save_output("out.md", "long content " * 100)
+        executor._save_output("out.md", "short")
+
+        assert (executor.output_dir / "out.md").read_text(encoding="utf-8") == "short"
+
+    def test_save_output_recreates_removed_dir(self):
+        executor = DirectExecutor()
+        executor.output_dir = self.temp_dir / "current"
+
+        executor._save_output("first.md", "1")
+        shutil.rmtree(executor.output_dir)
+        executor._save_output("second.md", "2")
+
+        assert (executor.output_dir / "second.md").read_text(encoding="utf-8") == "2"
+
+    def test_async_saves_land_in_submission_order(self):
+        executor = DirectExecutor()
+        executor.output_dir = self.temp_dir / "current"
+
+        executor._save_output_async("doc.md", "placeholder")
+        executor._save_output_async("doc.md", "final")
+        executor._wait_pending_writes()
+
+        assert executor._pending_writes == []
+        assert (executor.output_dir / "doc.md").read_text(encoding="utf-8") == "final"
+
+    def test_format_result_markdown(self):
+        executor = DirectExecutor()
+        context = TaskContext(
+            description="render {placeholder}",
+            complexity=TaskComplexity.SIMPLE,
+            route=ExecutionRoute.DIRECT,
+        )
+        result = DispatchResult(
+            success=False,
+            output="partial",
+            error="boom",
+            mode=ExecutionMode.CLI,
+            duration_ms=1500,
+            command="codex exec",
+        )
+
+        content = executor._format_result_markdown("Phase 1", ModelType.CODEX, result, context)
+
+        assert content.startswith("# Phase 1\n")
+        assert "- **任务**: render {placeholder}" in content
+        assert "- **模型**: Codex" in content
+        assert "- **执行模式**: CLI" in content
+        assert "- **耗时**: 1.50s" in content
+        assert content.endswith("### 错误\n\n```\nboom\n```\n\n### 部分输出\n\npartial")
+
+        result.mode = None
+        content = executor._format_result_markdown("Phase 1", ModelType.GEMINI, result, context)
+        assert "- **模型**: Gemini" in content
+        assert "- **执行模式**: UNKNOWN" in content
+
+    def test_format_arbitration_report(self):
+        executor = DirectExecutor()
+        consensus = PlanningConsensus(
+            status=ConsensusStatus.DISAGREEMENT,
+            claude_proposal=None,
+            codex_proposal=None,
+            divergences=[],
+            final_subtasks=[Subtask(id="t1", description="实现 {x}"), Subtask(id="t2", description="测试")],
+            consensus_confidence=0.5,
+        )
+
+        content = executor._format_arbitration_report(consensus)
+        assert content.startswith("# 共识仲裁报告\n\n## 分歧分析\n")
+        assert "- **采纳方案**: merged" in content
+        assert content.endswith("## 最终子任务\n1. 实现 {x}\n2. 测试\n")
+
+        consensus.arbitration = ArbitrationDecision(accepted_approach="codex", reasoning="更稳妥")
+        content = executor._format_arbitration_report(consensus, preamble="## 摘要\n分析\n\n")
+        assert content.startswith("# 共识仲裁报告\n\n## 摘要\n分析\n\n## 分歧分析\n")
+        assert "- **采纳方案**: codex\n- **决策理由**: 更稳妥\n" in content
+
+
+class TestUIContextFiles:
+    """UI 上下文文件测试"""
+
+    def test_first_existing_ui_dir_is_used(self, tmp_path, monkeypatch):
+        (tmp_path / "components").mkdir()
+        (tmp_path / "src" / "pages").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        executor = UIFlowExecutor()
+        context = TaskContext(
+            description="update login button",
+            complexity=TaskComplexity.UI,
+            route=ExecutionRoute.UI_FLOW,
+        )
+
+        assert executor._get_ui_context_files(context) == ["src/pages"]
+
+
+class TestStrategySelection:
+    """策略选择测试"""
+
+    def test_strategies_created_lazily(self):
+        executor = TaskExecutor(quiet=True)
+        assert executor._strategy_cache == {}
+
+        strategy = executor._get_strategy(ExecutionRoute.RALPH)
+
+        assert isinstance(strategy, RalphExecutor)
+        assert list(executor._strategy_cache) == [ExecutionRoute.RALPH]
+        assert executor._get_strategy(ExecutionRoute.RALPH) is strategy
+
+    def test_strategies_share_dispatcher(self):
+        executor = TaskExecutor(quiet=True)
+
+        direct = executor._get_strategy(ExecutionRoute.DIRECT)
+        ui_flow = executor._get_strategy(ExecutionRoute.UI_FLOW)
+
+        assert direct.dispatcher is ui_flow.dispatcher
+
+    def test_model_pool_reused_until_close(self):
+        executor = TaskExecutor(quiet=True)
+        strategy = executor._get_strategy(ExecutionRoute.ARCHITECT)
+
+        pool = strategy._get_model_pool()
+        assert strategy._get_model_pool() is pool
+
+        executor.close()
+
+        assert strategy._model_pool is None
+        assert executor._strategy_cache == {}
+        with pytest.raises(RuntimeError):
+            pool.submit(int)
+
+    def test_model_pool_replaced_after_timeout(self):
+        """模型调用超时后弃用线程池，下次运行不在遗留调用后排队"""
+        import threading
+        from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+        executor = TaskExecutor(quiet=True)
+        strategy = executor._get_strategy(ExecutionRoute.ARCHITECT)
+        strategy.output_dir = Path(tempfile.mkdtemp())
+        strategy.GEMINI_ANALYSIS_TIMEOUT = 0.05
+        release = threading.Event()
+        ok = DispatchResult(success=True, output="ok", model=ModelType.CODEX, mode=ExecutionMode.CLI)
+        strategy.dispatcher.call_gemini = lambda *args, **kwargs: release.wait(10) or ok
+        strategy.dispatcher.call_codex_for_planning = lambda *args, **kwargs: ok
+        context = TaskContext(
+            description="Test task",
+            complexity=TaskComplexity.ARCHITECT,
+            route=ExecutionRoute.ARCHITECT,
+        )
+        tracker = SimpleProgressTracker("test", "Test", quiet=True)
+
+        pool = strategy._get_model_pool()
+        try:
+            with pytest.raises(FuturesTimeoutError):
+                strategy.execute(context, tracker)
+
+            assert strategy._model_pool is None
+            fresh = strategy._get_model_pool()
+            assert fresh is not pool
+            assert fresh.submit(int, "7").result(timeout=1) == 7
+        finally:
+            release.set()
+            executor.close()
+            shutil.rmtree(strategy.output_dir, ignore_errors=True)
+
+    def test_phase_steps_progress_increasing(self):
+        executor = TaskExecutor(quiet=True)
+
+        for route in (ExecutionRoute.PLANNED, ExecutionRoute.RALPH,
+                      ExecutionRoute.ARCHITECT, ExecutionRoute.UI_FLOW):
+            strategy = executor._get_strategy(route)
+            progress = [step.progress for step in strategy.PHASE_STEPS.values()]
+            assert strategy.ROUTE == route.name
+            assert progress == sorted(progress)
+
+    def test_enter_phase(self, capsys):
+        strategy = TaskExecutor(quiet=True)._get_strategy(ExecutionRoute.UI_FLOW)
+        tracker = SimpleProgressTracker("test-id", "Test task", quiet=True)
+
+        strategy._enter_phase(tracker, "implement", 2, 3)
+
+        assert tracker.current_phase == Phase.IMPLEMENTING
+        assert tracker.events[-1].message == "准备 Gemini UI 实现..."
+        output = capsys.readouterr().out
+        assert "UI_FLOW" in output
+        assert "实现" in output
+
+
+class TestExecutionStatus:
+    """执行状态测试"""
+
+    def test_defaults_not_shared(self):
+        first = ExecutionStatus()
+        second = ExecutionStatus()
+
+        first.output_files.append("output.txt")
+        first.model_calls.append(ModelCall(phase=1, model="codex", success=True, duration_ms=10))
+
+        assert second.output_files == []
+        assert second.model_calls == []
+
+    def test_model_call_as_dict(self):
+        call = ModelCall(phase=1, model="codex", success=True, duration_ms=10, route="DIRECT_CODE")
+
+        assert call._asdict() == {
+            "phase": 1,
+            "model": "codex",
+            "success": True,
+            "duration_ms": 10,
+            "route": "DIRECT_CODE",
+            "type": None,
+        }
+
+
+class TestDescriptionScan:
+    """任务描述扫描测试"""
+
+    def test_is_code_task(self):
+        executor = DirectExecutor()
+
+        assert executor._is_code_task("Fix login BUG") is True
+        assert executor._is_code_task("修复登录问题") is True
+        assert executor._is_code_task("fix typo in README") is False  # 文本信号优先
+        assert executor._is_code_task("update config.json") is False
+        assert executor._is_code_task("hello world") is False
@@ -0,0 +1,76 @@
+"""
+测试 tools/lazy_loader.py 懒加载工具加载器
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from skillpack.tools import LazyToolLoader, ToolRegistry
+
+
+def wait_cleanup():
+    """等待后台缓存清理线程结束"""
+    for thread in threading.enumerate():
+        if thread.name == "skillpack-cache-cleanup":
+            thread.join(timeout=10)
+
+
+@pytest.fixture
+def loader(temp_dir):
+    return LazyToolLoader(ToolRegistry(), cache_dir=temp_dir / "tool_cache")
+
+
+class TestClearCache:
+    """测试清空缓存"""
+
+    def test_clear_then_write(self, loader, temp_dir):
+        """测试清空后缓存为空，且可以重新写入"""
+        for i in range(5):
+            loader._write_cache(f"mcp__tool__{i}", {"name": i})
+        assert loader.get_load_stats()["cache_size"] == 5
+
+        loader.clear_cache()
+        assert loader.get_load_stats()["cache_size"] == 0
+
+        loader._write_cache("mcp__tool__new", {"name": "new"})
+        assert loader._read_cache("mcp__tool__new") == {"name": "new"}
+        assert loader.get_load_stats()["cache_size"] == 1
+
+        wait_cleanup()
+        assert list(temp_dir.glob(".tool_cache.trash.*")) == []
+
+    def test_clear_keeps_non_json_files(self, loader):
+        """测试只删除 *.json 缓存文件"""
+        loader._write_cache("mcp__tool__a", {"name": "a"})
+        keep = loader._cache_dir / "README.txt"
+        keep.write_text("keep")
+
+        loader.clear_cache()
+
+        assert loader.get_load_stats()["cache_size"] == 0
+        assert keep.read_text() == "keep"
+
+    def test_clear_falls_back_when_rename_fails(self, loader, monkeypatch):
+        """测试目录改名失败时逐个删除缓存文件"""
+        loader._write_cache("mcp__tool__a", {"name": "a"})
+
+        def fail_rename(self, target):
+            raise OSError("busy")
+
+        monkeypatch.setattr(Path, "rename", fail_rename)
+        loader.clear_cache()
+
+        assert loader.get_load_stats()["cache_size"] == 0
+
+    def test_clear_sweeps_stale_trash(self, loader, temp_dir):
+        """测试清理上次遗留的回收目录"""
+        stale = temp_dir / ".tool_cache.trash.stale"
+        stale.mkdir()
+        (stale / "old.json").write_text("{}")
+
+        loader.clear_cache()
+        wait_cleanup()
+
+        assert not stale.exists()
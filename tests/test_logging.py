@@ -4,6 +4,8 @@
 
 import json
 import logging
+import logging.handlers
+import sys
 import pytest
 from pathlib import Path
 
@@ -13,6 +15,9 @@ from skillpack.logging import (
     SkillpackLogger,
     JSONFormatter,
     ColoredFormatter,
+    CachedTimeFormatter,
+    BatchRotatingFileHandler,
+    QueueFileHandler,
     get_logger,
     configure_logging,
 )
@@ -110,6 +115,40 @@ class TestJSONFormatter:
         assert data["route"] == "DIRECT"
         assert data["phase"] == 1
 
+    def test_format_keeps_non_ascii(self):
+        """测试非 ASCII 字符原样输出"""
+        formatter = JSONFormatter()
+        record = logging.LogRecord("test", logging.INFO, "", 0, "任务完成", (), None)
+
+        result = formatter.format(record)
+
+        assert isinstance(result, str)
+        assert "任务完成" in result
+        assert json.loads(result)["message"] == "任务完成"
+
+    def test_cached_timestamp_matches_isoformat(self):
+        """测试缓存的时间戳与 datetime.isoformat() 一致"""
+        from datetime import datetime
+
+        formatter = JSONFormatter()
+        record = logging.LogRecord("test", logging.INFO, "", 0, "m", (), None)
+        for created in (1700000000.0, 1700000000.25, 1700000000.999999, 1700000001.5):
+            record.created = created
+            data = json.loads(formatter.format(record))
+            assert data["timestamp"] == datetime.fromtimestamp(created).isoformat()
+        assert data["pid"] == record.process
+        assert data["hostname"]
+
+    def test_cached_asctime_matches_default(self):
+        """测试缓存的 asctime 与标准格式化器一致"""
+        cached = CachedTimeFormatter("%(asctime)s %(message)s")
+        plain = logging.Formatter("%(asctime)s %(message)s")
+        record = logging.LogRecord("test", logging.INFO, "", 0, "m", (), None)
+        for created in (1700000000.1, 1700000000.9, 1700000002.3):
+            record.created = created
+            record.msecs = int((created - int(created)) * 1000)
+            assert cached.format(record) == plain.format(record)
+
 
 class TestColoredFormatter:
     """测试彩色格式化器"""
@@ -131,6 +170,14 @@ class TestColoredFormatter:
         # 应包含 ANSI 颜色代码
         assert "\033[" in result
 
+    def test_format_restores_levelname(self):
+        """测试格式化后还原 levelname，不影响其他处理器"""
+        formatter = ColoredFormatter("%(levelname)s %(message)s", use_colors=True)
+        record = logging.LogRecord("test", logging.WARNING, "", 0, "Test", (), None)
+
+        assert formatter.format(record) == "\033[33mWARNING\033[0m Test"
+        assert record.levelname == "WARNING"
+
     def test_format_without_colors(self):
         """测试无颜色格式化"""
         formatter = ColoredFormatter("%(levelname)s %(message)s", use_colors=False)
@@ -157,6 +204,7 @@ class TestSkillpackLogger:
         logger1 = SkillpackLogger()
         logger2 = SkillpackLogger()
         assert logger1 is logger2
+        assert get_logger() is logger1
 
     def test_configure_with_defaults(self):
         """测试使用默认配置"""
@@ -201,6 +249,44 @@ class TestSkillpackLogger:
             phase=1,
         )
 
+    def test_console_colors_only_on_terminal(self, monkeypatch):
+        """测试控制台不是终端时不使用颜色"""
+        import io
+
+        class FakeTTY(io.StringIO):
+            def isatty(self):
+                return True
+
+        logger = get_logger()
+        for stream, expected in ((io.StringIO(), False), (FakeTTY(), True)):
+            monkeypatch.setattr(sys, "stderr", stream)
+            logger.configure(LoggingConfig(file_enabled=False))
+            formatter = logger._logger.handlers[0].formatter
+            assert formatter.use_colors is expected
+
+    def test_disabled_level_skips_record(self):
+        """测试被过滤的级别不生成日志记录"""
+        records = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        logger = get_logger()
+        logger.configure(LoggingConfig(
+            level=LogLevel.WARNING, console_enabled=False, file_enabled=False,
+        ))
+        logger._logger.addHandler(Capture())
+
+        logger.debug("hidden", task_id="t")
+        logger.task_log("hidden", task_id="t", level=LogLevel.INFO)
+        logger.task_log("shown", task_id="t", level=LogLevel.ERROR)
+        logger.warning("phase %d of %d", 2, 5, task_id="t")
+
+        assert [r.getMessage() for r in records] == ["shown", "phase 2 of 5"]
+        assert records[0].task_id == "t"
+        assert records[1].args == (2, 5)
+
 
 class TestFileLogging:
     """测试文件日志"""
@@ -220,6 +306,21 @@ class TestFileLogging:
         # 目录应该被创建
         assert log_path.parent.exists()
 
+    def test_file_handler_recreates_removed_directory(self, temp_dir):
+        """测试已缓存的日志目录被删除后重新创建"""
+        import shutil
+
+        log_path = temp_dir / "logs" / "test.log"
+        config = LoggingConfig(console_enabled=False, file_path=str(log_path))
+        logger = get_logger()
+        logger.configure(config)
+        logger.configure(LoggingConfig(console_enabled=False, file_enabled=False))
+
+        shutil.rmtree(log_path.parent)
+        logger.configure(config)
+
+        assert log_path.exists()
+
     def test_file_handler_writes_log(self, temp_dir):
         """测试文件处理器写入日志"""
         log_path = temp_dir / "test.log"
@@ -243,6 +344,105 @@ class TestFileLogging:
         content = log_path.read_text()
         assert "Test log message" in content
 
+    def test_batch_handler_rotates(self, temp_dir):
+        """测试批量处理器按累计大小轮转"""
+        log_path = temp_dir / "batch.log"
+        handler = BatchRotatingFileHandler(log_path, maxBytes=200, backupCount=2, batch_size=4)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        for i in range(10):
+            handler.handle(logging.LogRecord("t", logging.INFO, "", 0, "line-%02d " + "x" * 40, (i,), None))
+        assert log_path.stat().st_size < 200  # 未满批次仍在内存中
+        handler.close()
+
+        assert (temp_dir / "batch.log.1").exists()
+        assert "line-09" in log_path.read_text(encoding="utf-8")
+        assert all(
+            p.stat().st_size <= 200 for p in temp_dir.glob("batch.log*")
+        )
+
+    def test_batch_handler_rollover_check_skips_stat(self, temp_dir, monkeypatch):
+        """测试轮转判断使用内存中的大小，不访问文件系统"""
+        import os
+
+        handler = BatchRotatingFileHandler(temp_dir / "stat.log", maxBytes=100, batch_size=100)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        record = logging.LogRecord("t", logging.INFO, "", 0, "x" * 60, (), None)
+
+        def no_stat(path):
+            raise AssertionError("unexpected stat")
+
+        monkeypatch.setattr(os.path, "exists", no_stat)
+        monkeypatch.setattr(os.path, "isfile", no_stat)
+        assert handler.shouldRollover(record) is False
+        handler.emit(record)
+        assert handler.shouldRollover(record) is True
+        monkeypatch.undo()
+        handler.close()
+
+    def test_batch_handler_formats_each_record_once(self, temp_dir):
+        """测试 emit 每条记录只格式化一次，且与 shouldRollover 判断一致"""
+        handler = BatchRotatingFileHandler(temp_dir / "once.log", maxBytes=100, backupCount=1)
+        calls = []
+
+        class CountingFormatter(logging.Formatter):
+            def format(self, record):
+                calls.append(record)
+                return super().format(record)
+
+        handler.setFormatter(CountingFormatter("%(message)s"))
+        record = logging.LogRecord("t", logging.INFO, "", 0, "x" * 60, (), None)
+
+        handler.emit(record)
+        assert len(calls) == 1
+        expected = handler.shouldRollover(record)
+        handler.emit(record)
+        handler.close()
+
+        assert expected is True
+        assert (temp_dir / "once.log.1").exists()
+
+    def test_file_writes_happen_on_listener_thread(self, temp_dir):
+        """测试文件写入在后台线程完成，重新配置前写完队列"""
+        log_path = temp_dir / "queued.log"
+        logger = get_logger()
+        logger.configure(LoggingConfig(console_enabled=False, file_path=str(log_path)))
+
+        assert [type(h) for h in logger._logger.handlers] == [QueueFileHandler]
+        for i in range(100):
+            logger.info("record %d", i)
+        logger.configure(LoggingConfig(console_enabled=False, file_enabled=False))
+
+        assert logger._listener is None
+        assert "record 99" in log_path.read_text(encoding="utf-8")
+
+    def test_flush_after_listener_stopped(self, temp_dir):
+        """测试监听线程停止后记录日志并刷新不会阻塞"""
+        import subprocess
+
+        script = (
+            "import logging\n"
+            "from skillpack.logging import LoggingConfig, get_logger\n"
+            "logger = get_logger()\n"
+            f"logger.configure(LoggingConfig(console_enabled=False, file_path={str(temp_dir / 'stop.log')!r}))\n"
+            "queue_handler = logger._logger.handlers[0]\n"
+            "logger._stop_listener()\n"
+            "assert logger._logger.handlers == []\n"
+            "logger.info('after stop')\n"
+            "queue_handler.handle(logging.makeLogRecord({'msg': 'orphan'}))\n"
+            "queue_handler.flush()\n"
+            "logging.shutdown()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+
 
 class TestConvenienceFunctions:
     """测试便捷函数"""
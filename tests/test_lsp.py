@@ -0,0 +1,283 @@
+"""
+LSP 客户端测试 (v6.0)
+
+使用一个基于 stdio 的最小 LSP 服务器脚本验证协议读写。
+"""
+
+import sys
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from skillpack.integrations.lsp import LSPClient, LSPConfig
+from skillpack.integrations.lsp.config import LSPServerConfig, detect_language
+
+
+FAKE_SERVER = textwrap.dedent('''
+    import json
+    import sys
+
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+
+
+    def read_message():
+        length = 0
+        while True:
+            line = stdin.readline()
+            if not line:
+                return None
+            if line == b"\\r\\n":
+                break
+            if line.startswith(b"Content-Length:"):
+                length = int(line[15:].strip())
+        return json.loads(stdin.read(length))
+
+
+    def write_message(message):
+        body = json.dumps(message).encode("utf-8")
+        stdout.write(b"Content-Length: %d\\r\\n" % len(body))
+        stdout.write(b"Content-Type: application/vscode-jsonrpc; charset=utf-8\\r\\n\\r\\n")
+        stdout.write(body)
+        stdout.flush()
+
+
+    def handle(method, params):
+        if method == "initialize":
+            return {"capabilities": {}}
+        if method == "textDocument/definition":
+            position = params["position"]
+            return [{
+                "uri": params["textDocument"]["uri"],
+                "range": {"start": position, "end": position},
+            }]
+        if method == "textDocument/references":
+            uri = params["textDocument"]["uri"]
+            return [
+                {"uri": uri, "range": {"start": {"line": i, "character": 0},
+                                       "end": {"line": i, "character": 3}}}
+                for i in range(2)
+            ]
+        if method == "textDocument/hover":
+            return {"contents": {"kind": "markdown", "value": "说明文档"}}
+        if method == "textDocument/documentSymbol":
+            span = {"start": {"line": 0, "character": 0}, "end": {"line": 9, "character": 0}}
+            return [{
+                "name": "Outer",
+                "kind": 5,
+                "range": span,
+                "children": [
+                    {"name": "method_a", "kind": 6, "range": span},
+                    {"name": "Inner", "kind": 5, "range": span, "children": [
+                        {"name": "field_b", "kind": 8, "range": span},
+                    ]},
+                ],
+            }]
+        return None
+
+
+    while True:
+        message = read_message()
+        if message is None or message.get("method") == "exit":
+            break
+        if "id" in message:
+            write_message({
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "result": handle(message["method"], message.get("params", {})),
+            })
+''')
+
+
+@pytest.fixture
+def lsp_client(tmp_path):
+    """连接到最小 LSP 服务器的客户端"""
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_SERVER, encoding="utf-8")
+    config = LSPConfig(
+        enabled=True,
+        timeout_seconds=5,
+        workspace_root=tmp_path,
+        servers={"python": LSPServerConfig(command=sys.executable, args=[str(script)])},
+    )
+    client = LSPClient(config)
+    yield client
+    client.stop_all()
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("class Outer:\n    pass\n", encoding="utf-8")
+    return path
+
+
+class TestLanguageDetection:
+    """语言检测测试"""
+
+    def test_detect_language(self):
+        assert detect_language(Path("a.py")) == "python"
+        assert detect_language(Path("A.TSX")) == "typescript"
+        assert detect_language(Path("README.md")) is None
+
+
+class TestLSPClient:
+    """LSPClient 协议测试"""
+
+    def test_disabled_config(self, source_file):
+        client = LSPClient(LSPConfig(enabled=False))
+        assert client.goto_definition(source_file, 0, 6) is None
+
+    def test_goto_definition(self, lsp_client, source_file):
+        location = lsp_client.goto_definition(source_file, 3, 7)
+
+        assert location is not None
+        assert location.file == source_file
+        assert (location.line, location.column) == (3, 7)
+
+    def test_find_references(self, lsp_client, source_file):
+        references = lsp_client.find_references(source_file, 0, 6)
+
+        assert [ref.line for ref in references] == [0, 1]
+
+    def test_hover(self, lsp_client, source_file):
+        info = lsp_client.hover(source_file, 0, 6)
+
+        assert info is not None
+        assert info.content == "说明文档"
+
+    def test_document_symbols(self, lsp_client, source_file):
+        symbols = lsp_client.document_symbols(source_file)
+
+        assert [(s.name, s.kind, s.container) for s in symbols] == [
+            ("Outer", "Class", None),
+            ("method_a", "Method", "Outer"),
+            ("Inner", "Class", "Outer"),
+            ("field_b", "Field", "Inner"),
+        ]
+        assert list(symbols.names) == ["Outer", "method_a", "Inner", "field_b"]
+        assert symbols.kinds.count(5) == 2
+        assert symbols[1].location.end_line == 9
+        assert [s.name for s in symbols[1:3]] == ["method_a", "Inner"]
+
+    def test_parse_symbol_information(self, tmp_path):
+        client = LSPClient(LSPConfig())
+        other = (tmp_path / "other.py").as_uri()
+        data = [
+            {"name": "f", "kind": 12, "location": {
+                "uri": other, "range": {"start": {"line": 4, "character": 2}},
+            }},
+            {"name": "missing", "kind": 12, "location": {"uri": other}},
+        ]
+
+        symbols = client._parse_symbols(data, tmp_path / "module.py")
+
+        assert len(symbols) == 1
+        assert symbols[0].location.file == tmp_path / "other.py"
+        assert (symbols[0].location.line, symbols[0].location.column) == (4, 2)
+        assert symbols[0].location.end_line is None
+
+    def test_sequential_requests(self, lsp_client, source_file):
+        for line in range(20):
+            location = lsp_client.goto_definition(source_file, line, 0)
+            assert location.line == line
+
+    def test_concurrent_requests(self, lsp_client, source_file):
+        assert lsp_client.goto_definition(source_file, 0, 0) is not None
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            locations = list(pool.map(
+                lambda line: lsp_client.goto_definition(source_file, line, 1),
+                range(40),
+            ))
+
+        assert [location.line for location in locations] == list(range(40))
+        assert lsp_client._servers["python"].pending == {}
+
+    def test_goto_definition_batch(self, lsp_client, source_file, tmp_path):
+        positions = [
+            (source_file, 1, 2),
+            (tmp_path / "notes.txt", 0, 0),  # 不支持的语言
+            (source_file, 5, 4),
+        ]
+
+        locations = lsp_client.goto_definition_batch(positions)
+
+        assert len(locations) == 3
+        assert (locations[0].line, locations[0].column) == (1, 2)
+        assert locations[1] is None
+        assert (locations[2].line, locations[2].column) == (5, 4)
+        assert lsp_client._servers["python"].pending == {}
+
+    def test_clients_share_server(self, tmp_path, source_file):
+        script = tmp_path / "fake_server.py"
+        script.write_text(FAKE_SERVER, encoding="utf-8")
+        config = LSPConfig(
+            enabled=True,
+            timeout_seconds=5,
+            workspace_root=tmp_path,
+            servers={"python": LSPServerConfig(command=sys.executable, args=[str(script)])},
+        )
+        first, second = LSPClient(config), LSPClient(config)
+
+        assert first.goto_definition(source_file, 1, 0) is not None
+        assert second.goto_definition(source_file, 2, 0) is not None
+        connection = first._servers["python"]
+        assert second._servers["python"] is connection
+        assert connection.refcount == 2
+
+        first.stop_all()
+        assert connection.process.poll() is None
+        assert second.goto_definition(source_file, 3, 0).line == 3
+
+        second.stop_all()
+        assert connection.process.wait(timeout=5) is not None
+
+    def test_server_exit_wakes_pending_requests(self, tmp_path, source_file):
+        script = tmp_path / "fake_server.py"
+        script.write_text(FAKE_SERVER, encoding="utf-8")
+        config = LSPConfig(
+            enabled=True,
+            timeout_seconds=30,
+            workspace_root=tmp_path,
+            servers={"python": LSPServerConfig(command=sys.executable, args=[str(script)])},
+        )
+        client = LSPClient(config)
+        assert client.goto_definition(source_file, 1, 0) is not None
+
+        connection = client._servers["python"]
+        connection.process.kill()
+        connection.process.wait(timeout=5)
+
+        start = time.monotonic()
+        assert client.goto_definition(source_file, 2, 0) is None
+        assert time.monotonic() - start < 5
+        assert connection.closed
+        assert connection.pending == {}
+        client.stop_all()
+
+    def test_goto_definition_escaped_path(self, lsp_client, tmp_path):
+        path = tmp_path / "my module 模块.py"
+        path.write_text("x = 1\n", encoding="utf-8")
+
+        location = lsp_client.goto_definition(path, 0, 0)
+
+        assert location is not None
+        assert location.file == path
+
+    def test_parse_deeply_nested_symbols(self, tmp_path):
+        client = LSPClient(LSPConfig())
+        span = {"start": {"line": 0, "character": 0}, "end": {"line": 0, "character": 1}}
+        root = node = {"name": "s0", "kind": 12, "range": span}
+        for depth in range(1, 5000):
+            child = {"name": f"s{depth}", "kind": 12, "range": span}
+            node["children"] = [child]
+            node = child
+
+        symbols = client._parse_symbols([root], tmp_path / "deep.py")
+
+        assert len(symbols) == 5000
+        assert symbols[-1].name == "s4999"
+        assert symbols[-1].container == "s4998"
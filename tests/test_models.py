@@ -4,6 +4,8 @@
 测试 skillpack/models.py 中定义的所有数据模型。
 """
 
+import sys
+
 import pytest
 from dataclasses import asdict
 
@@ -97,6 +99,15 @@ class TestRoutingConfig:
         total = sum(config.weights.values())
         assert total == 100
 
+    def test_instances_do_not_share_defaults(self):
+        """修改实例的权重不影响默认值和其他实例"""
+        config = RoutingConfig()
+        config.weights["scope"] = 0
+        config.thresholds["direct"] = 5
+
+        assert RoutingConfig().weights["scope"] == 25
+        assert RoutingConfig().thresholds["direct"] == 20
+
 
 class TestCheckpointConfig:
     """CheckpointConfig 测试"""
@@ -188,6 +199,16 @@ class TestSkillpackConfig:
         assert config.knowledge.default_notebook == "test-nb"
         assert config.parallel.enabled is True
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots 需要 Python 3.10+")
+    def test_slots_no_instance_dict(self):
+        """配置对象使用 __slots__，拒绝未声明的属性"""
+        config = SkillpackConfig()
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.routing, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_option = True
+        assert asdict(config)["routing"]["thresholds"]["direct"] == 20
+
 
 class TestScoreCard:
     """ScoreCard 测试"""
@@ -104,6 +104,46 @@ class TestTaskDAG:
         assert len(ready) == 1
         assert ready[0].id == "task-2"
 
+    def test_get_ready_tasks_tracks_unmet_dependencies(self):
+        """依赖计数随状态变化和移除任务更新"""
+        dag = TaskDAG()
+        dag.add_task("a", "A")
+        dag.add_task("b", "B")
+        dag.add_task("c", "C", dependencies=["a", "b"])
+        dag.add_task("d", "D", dependencies=["c"])
+
+        assert {n.id for n in dag.get_ready_tasks()} == {"a", "b"}
+
+        dag.update_task_state("a", TaskState.COMPLETED)
+        assert dag.get_ready_tasks() == []
+
+        # 移除未完成的依赖后，c 可执行
+        dag.remove_task("b")
+        assert [n.id for n in dag.get_ready_tasks()] == ["c"]
+
+        # 已完成任务重新置为待执行，下游重新被阻塞
+        dag.update_task_state("c", TaskState.COMPLETED)
+        dag.update_task_state("c", TaskState.PENDING)
+        assert [n.id for n in dag.get_ready_tasks()] == ["c"]
+        dag.update_task_state("c", TaskState.COMPLETED)
+        assert [n.id for n in dag.get_ready_tasks()] == ["d"]
+
+    def test_get_ready_tasks_after_direct_node_update(self):
+        """直接通过节点方法更新状态时，下游任务同样被释放"""
+        dag = TaskDAG()
+        dag.add_task("a", "A")
+        dag.add_task("b", "B", dependencies=["a"])
+        assert [n.id for n in dag.get_ready_tasks()] == ["a"]
+
+        dag.get_task("a").mark_completed()
+        assert [n.id for n in dag.get_ready_tasks()] == ["b"]
+
+        # 已移除的节点不再影响 DAG
+        node = dag.get_task("b")
+        dag.remove_task("b")
+        node.mark_completed()
+        assert dag.get_ready_tasks() == []
+
     def test_get_progress(self):
         """进度统计"""
         dag = TaskDAG()
@@ -121,6 +161,44 @@ class TestTaskDAG:
         assert progress["completed"] == 1
         assert progress["progress_percent"] == pytest.approx(33.33, 0.1)
 
+    def test_get_progress_counts_follow_state_changes(self):
+        """进度计数随状态变化、就绪检查和移除任务更新"""
+        dag = TaskDAG()
+        for tid in ("a", "b", "c", "d"):
+            dag.add_task(tid, tid)
+
+        dag.get_ready_tasks()
+        dag.update_task_state("a", TaskState.RUNNING)
+        dag.update_task_state("b", TaskState.FAILED, error="boom")
+        dag.update_task_state("c", TaskState.COMPLETED)
+        dag.update_task_state("c", TaskState.COMPLETED)
+        dag.remove_task("d")
+
+        progress = dag.get_progress()
+        assert progress["total"] == 3
+        assert progress["running"] == 1
+        assert progress["failed"] == 1
+        assert progress["completed"] == 1
+        assert progress["pending"] == 0
+
+    def test_get_progress_after_direct_node_update(self):
+        """直接通过 get_task() 返回的节点更新状态时，进度同样更新"""
+        dag = TaskDAG()
+        dag.add_task("a", "A")
+        dag.add_task("b", "B")
+
+        dag.get_task("a").mark_completed()
+        dag.get_task("b").mark_running()
+        progress = dag.get_progress()
+        assert progress["completed"] == 1
+        assert progress["running"] == 1
+        assert progress["pending"] == 0
+
+        dag.get_task("b").mark_failed("boom")
+        progress = dag.get_progress()
+        assert progress["running"] == 0
+        assert progress["failed"] == 1
+
     def test_topological_sort(self):
         """拓扑排序"""
         dag = TaskDAG()
@@ -91,6 +91,8 @@ class TestUsageStore:
             assert len(records) == 1
             assert records[0].model == "codex"
             assert records[0].duration_ms == 45000
+            assert records[0] == record
+            assert "实现" in store.path.read_text(encoding="utf-8")
 
     def test_append_multiple_records(self):
         with TemporaryDirectory() as tmpdir:
@@ -111,6 +113,27 @@ class TestUsageStore:
             records = store.load_all_records()
             assert len(records) == 5
 
+    def test_append_records_batch(self):
+        with TemporaryDirectory() as tmpdir:
+            store = UsageStore(Path(tmpdir) / "usage.jsonl")
+            batch = [
+                UsageRecord(
+                    timestamp=f"2026-01-20T10:{30+i}:00",
+                    model="codex",
+                    route="RALPH",
+                    phase=i + 1,
+                    phase_name=f"Phase {i+1}",
+                )
+                for i in range(3)
+            ]
+
+            store.append_records([])
+            assert not store.path.exists()
+
+            store.append_records(batch)
+            store.append_records(batch[:1])
+            assert store.load_all_records() == batch + batch[:1]
+
     def test_load_empty_store(self):
         with TemporaryDirectory() as tmpdir:
             store = UsageStore(Path(tmpdir) / "nonexistent.jsonl")